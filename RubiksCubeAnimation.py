@@ -0,0 +1,188 @@
+import time
+import queue
+from collections import deque
+from RubiksCubeProfiler import PROFILER
+
+# ===== FRAME SCHEDULER =====
+
+class Frame:
+    """One animation step: the cube state after `step` moves and its status line"""
+
+    __slots__ = ('state', 'move', 'step', 'status')
+
+    def __init__(self, state, move='', step=0, status=''):
+        self.state = state
+        self.move = move
+        self.step = step
+        self.status = status
+
+
+class _SequenceEnd:
+    __slots__ = ('callback',)
+
+    def __init__(self, callback):
+        self.callback = callback
+
+
+class AnimationScheduler:
+    """Plays queued frames from the Tk main loop with root.after.
+
+    Any thread may queue frames (play) or main-thread callbacks (call); only
+    the scheduler's tick, which always runs on the Tk thread, renders them.
+    When ticks arrive late, every frame that is already due is coalesced into
+    one render. A tick never spends more than budget_ms pulling from the queue.
+    While paused, frames and sequence ends are held back in order but plain
+    callbacks still run, so work handed over by other threads is not blocked.
+    """
+
+    def __init__(self, root, render, interval_ms=400, budget_ms=8, poll_ms=30,
+                 profiler=PROFILER):
+        self.root = root
+        self.render = render
+        self.profiler = profiler
+        self.interval_ms = interval_ms
+        self.budget_ms = budget_ms
+        self.poll_ms = poll_ms
+
+        self.queue = queue.Queue()
+        self.held = deque()           # frames and sequence ends pulled while paused
+        self.paused = False
+        self.skipping = False
+        self.cancelling = False
+        self.next_due = None
+
+        self.frames_rendered = 0
+        self.frames_coalesced = 0
+        self.after_id = None
+
+    # ----- producer side (any thread) -----
+
+    def play(self, frames, on_done=None):
+        """Queue a sequence of frames; on_done(completed) runs on the Tk thread"""
+        for frame in frames:
+            self.queue.put(frame)
+        self.queue.put(_SequenceEnd(on_done))
+
+    def call(self, callback):
+        """Run callback on the Tk thread once the frames queued before it are shown"""
+        self.queue.put(callback)
+
+    # ----- controls (Tk thread) -----
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self.next_due = None          # continue from now, not from before the pause
+
+    def toggle_pause(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+        return self.paused
+
+    def skip(self):
+        """Jump to the last frame of the current sequence"""
+        self.skipping = True
+
+    def cancel(self):
+        """Drop the rest of the current sequence, leaving the last shown frame"""
+        self.cancelling = True
+
+    # ----- main loop -----
+
+    def start(self):
+        if self.after_id is None:
+            self.after_id = self.root.after(self.poll_ms, self.tick)
+
+    def stop(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000
+        interval = self.interval_ms / 1000
+        fast = self.skipping or self.cancelling
+        if self.paused and not fast:
+            self._drain_callbacks(deadline)
+
+        # frames due since the last render; more than one means we fell behind
+        if self.next_due is None:
+            self.next_due = start
+        late = max(0.0, start - self.next_due)
+        due = 0
+        if start >= self.next_due:
+            due = 1 + int((start - self.next_due) / interval)
+
+        latest = None
+        taken = consumed = 0
+        while self.skipping or self.cancelling or (due > 0 and not self.paused):
+            try:
+                item = self.held.popleft() if self.held else self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(item, Frame):
+                if not self.cancelling:
+                    latest = item
+                    taken += 1
+                    consumed += 1
+                    due -= 1
+            else:
+                # callbacks see the frames queued before them
+                if latest is not None:
+                    self._show(latest, taken, late)
+                    latest, taken = None, 0
+                if isinstance(item, _SequenceEnd):
+                    completed = not self.cancelling
+                    self.skipping = self.cancelling = False
+                    if item.callback is not None:
+                        item.callback(completed)
+                else:
+                    item()
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if latest is not None:
+            self._show(latest, taken, late)
+        if self.is_idle():
+            self.next_due = None
+        elif fast:
+            self.next_due = start + interval
+        else:
+            self.next_due += interval * consumed
+
+        if self.skipping or self.cancelling:
+            delay = 1
+        elif self.next_due is not None and not self.paused:
+            delay = max(1, int((self.next_due - time.perf_counter()) * 1000))
+        else:
+            delay = self.poll_ms
+        self.after_id = self.root.after(delay, self.tick)
+
+    def _drain_callbacks(self, deadline):
+        """Run queued callbacks while paused, holding frames and sequence ends"""
+        while time.perf_counter() < deadline:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, (Frame, _SequenceEnd)):
+                self.held.append(item)
+            else:
+                item()
+
+    def _show(self, frame, taken, late=0.0):
+        start = time.perf_counter()
+        self.render(frame)
+        self.frames_rendered += 1
+        self.frames_coalesced += taken - 1
+        self.profiler.frame(start, late, time.perf_counter() - start, taken - 1)
+
+    def is_idle(self):
+        return not self.held and self.queue.empty()
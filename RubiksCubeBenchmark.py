@@ -0,0 +1,261 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+import subprocess
+import numpy as np
+from RubiksCubeEngine import (MOVES, QUARTER_MOVES, solved_state, apply_move,
+                              apply_move_batch, is_solved, cube_model)
+from RubiksCubeSolver import CubeSolver
+
+# Every benchmark draws from its own fixed seed, so two runs on the same
+# commit time exactly the same work and results can be diffed between commits.
+SEED = 2024
+DEPTHS = range(5, 21)                 # the GUI's scramble slider range
+
+# Metrics where a bigger number is better; all others are costs
+HIGHER_IS_BETTER = ('per_second',)
+
+
+def timed(function, repeat):
+    """Best-of-3 seconds per call over `repeat` calls"""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def percentiles(samples):
+    samples = np.asarray(samples)
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+    return {'mean': float(samples.mean()), 'p50': float(p50), 'p90': float(p90),
+            'p99': float(p99), 'max': float(samples.max())}
+
+
+def random_scramble(rng, depth, moves=QUARTER_MOVES):
+    return [rng.choice(moves) for _ in range(depth)]
+
+
+# ===== BENCHMARKS =====
+
+def bench_apply_move(repeat=20000, batch_size=10000):
+    rng = random.Random(SEED)
+    state = solved_state()
+    sequence = [rng.choice(MOVES) for _ in range(repeat)]
+
+    def single():
+        s = state
+        for move in sequence:
+            s = apply_move(s, move)
+
+    seconds = timed(single, 1)
+    np_rng = np.random.default_rng(SEED)
+    states = np.tile(solved_state(), (batch_size, 1))
+    moves = np_rng.integers(0, len(MOVES), size=batch_size)
+    batch_seconds = timed(lambda: apply_move_batch(states, moves), 100)
+    return {
+        'single_moves_per_second': repeat / seconds,
+        'batch_moves_per_second': batch_size / batch_seconds,
+        'batch_size': batch_size,
+    }
+
+
+def bench_is_solved(repeat=20000):
+    rng = random.Random(SEED)
+    scrambled = solved_state()
+    for move in random_scramble(rng, 20):
+        scrambled = apply_move(scrambled, move)
+    solved = solved_state()
+    return {
+        'solved_seconds': timed(lambda: is_solved(solved), repeat),
+        'scrambled_seconds': timed(lambda: is_solved(scrambled), repeat),
+    }
+
+
+def bench_solve(samples=20, engine='Two-Phase', time_limit=1.0, depths=DEPTHS):
+    """Latency of the GUI's solve pipeline (CubeSolver, as generate_ai_solution)
+    per scramble depth. The cache is disabled so every sample searches."""
+    solver = CubeSolver(engine, time_limit=time_limit, cache_capacity=0, telemetry=False)
+    if solver.two_phase_solver is not None:
+        solver.two_phase_solver.load()       # keep table loading out of the first sample
+    results = {}
+    for depth in depths:
+        rng = random.Random(SEED + depth)
+        latencies, lengths = [], []
+        for _ in range(samples):
+            scramble = random_scramble(rng, depth)
+            state = solved_state()
+            for move in scramble:
+                state = apply_move(state, move)
+            start = time.perf_counter()
+            solution = solver.solve(state, scramble)
+            latencies.append(time.perf_counter() - start)
+            lengths.append(len(solution))
+        results[str(depth)] = {'seconds': percentiles(latencies),
+                               'mean_length': float(np.mean(lengths))}
+    return {'engine': engine, 'time_limit': time_limit, 'samples': samples,
+            'depths': results}
+
+
+def bench_draw_cube(frames=200):
+    """Frame time of RubiksCubeGUI.draw_cube on a real Tk canvas"""
+    import tkinter as tk
+    from RubiksCubeGUI import RubiksCubeGUI
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        return {'skipped': f'no display ({error})'}
+    root.withdraw()
+    try:
+        gui = RubiksCubeGUI.__new__(RubiksCubeGUI)
+        gui.root = root
+        gui.colors = {0: '#FFFFFF', 1: '#FFD700', 2: '#FF3B3B',
+                      3: '#FF8C00', 4: '#00E676', 5: '#2196F3'}
+        gui.cube_canvas = tk.Canvas(root, width=600, height=400)
+        gui.cube_canvas.pack()
+        gui.sticker_items = None
+        gui.cube_size = 3
+        gui.model = cube_model(3)
+        gui.cube_state = gui.create_solved_state()
+
+        start = time.perf_counter()
+        gui.draw_cube()
+        root.update_idletasks()
+        first = time.perf_counter() - start
+
+        rng = random.Random(SEED)
+        times = []
+        for move in random_scramble(rng, frames, MOVES):
+            gui.cube_state = apply_move(gui.cube_state, move)
+            start = time.perf_counter()
+            gui.draw_cube()
+            root.update_idletasks()
+            times.append(time.perf_counter() - start)
+        return {'first_frame_seconds': first, 'frame_seconds': percentiles(times)}
+    finally:
+        root.destroy()
+
+
+def max_rss_bytes():
+    """Peak resident set size of this process, or None where it is not
+    available (the resource module is Unix-only)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def bench_memory(samples=10, time_limit=0.5):
+    """Peak Python allocations of a solve run, and the process's peak RSS"""
+    tracemalloc.start()
+    bench_solve(samples, time_limit=time_limit, depths=(20,))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results = {'solve_peak_bytes': peak}
+    rss = max_rss_bytes()
+    if rss is not None:
+        results['max_rss_bytes'] = rss
+    return results
+
+
+BENCHMARKS = {
+    'apply_move': bench_apply_move,
+    'is_solved': bench_is_solved,
+    'solve': bench_solve,
+    'draw_cube': bench_draw_cube,
+    'memory': bench_memory,
+}
+
+
+# ===== RESULTS =====
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'commit': commit, 'python': platform.python_version(), 'numpy': np.__version__,
+            'machine': platform.machine(), 'system': platform.system(),
+            'cpus': os.cpu_count(), 'seed': SEED, 'timestamp': time.time()}
+
+
+def flatten(results, prefix=''):
+    """{'solve.depths.5.seconds.p50': value, ...} for every numeric leaf"""
+    flat = {}
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(baseline, current, tolerance=0.10):
+    """(metric, old, new, relative change) of every metric that got worse by
+    more than `tolerance`"""
+    old, new = flatten(baseline['results']), flatten(current['results'])
+    regressions = []
+    for name in sorted(old.keys() & new.keys()):
+        if old[name] == 0 or name.startswith(('solve.samples', 'solve.time_limit')):
+            continue
+        change = (new[name] - old[name]) / abs(old[name])
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        if change > tolerance:
+            regressions.append((name, old[name], new[name], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the engine, solver and rendering")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        default=sorted(BENCHMARKS))
+    parser.add_argument('--samples', type=int, default=20, help="solves per scramble depth")
+    parser.add_argument('--time-limit', type=float, default=1.0)
+    parser.add_argument('--engine', default='Two-Phase')
+    parser.add_argument('--output', default='-', help="JSON results file ('-' for stdout)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="earlier results file; exit 1 on regressions")
+    parser.add_argument('--tolerance', type=float, default=0.20)
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only:
+        print(f"running {name}...", file=sys.stderr)
+        if name == 'solve':
+            results[name] = bench_solve(args.samples, args.engine, args.time_limit)
+        else:
+            results[name] = BENCHMARKS[name]()
+    report = {'environment': environment(), 'results': results}
+
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:.6g} -> {new:.6g} ({change:+.0%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
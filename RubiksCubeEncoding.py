@@ -0,0 +1,399 @@
+import numpy as np
+from math import factorial, perm
+from RubiksCubeEngine import NUM_STICKERS, MOVES, FACE_NAMES, apply_move, solved_state
+
+# Cubie naming follows the usual corner/edge order used by coordinate solvers.
+# Facelet indices refer to the flat sticker layout of RubiksCubeEngine
+# (U=0..8, D=9..17, L=18..26, R=27..35, F=36..44, B=45..53); the first facelet
+# of every corner is its U/D sticker and the rest follow clockwise.
+U, D, L, R, F, B = range(6)
+
+CORNER_NAMES = ['URF', 'UFL', 'ULB', 'UBR', 'DFR', 'DLF', 'DBL', 'DRB']
+CORNER_FACELETS = np.array([
+    [8, 27, 38], [6, 36, 20], [0, 18, 47], [2, 45, 29],
+    [11, 44, 33], [9, 26, 42], [15, 53, 24], [17, 35, 51],
+], dtype=np.intp)
+CORNER_COLORS = np.array([
+    [U, R, F], [U, F, L], [U, L, B], [U, B, R],
+    [D, F, R], [D, L, F], [D, B, L], [D, R, B],
+], dtype=np.uint8)
+
+EDGE_NAMES = ['UR', 'UF', 'UL', 'UB', 'DR', 'DF', 'DL', 'DB', 'FR', 'FL', 'BL', 'BR']
+EDGE_FACELETS = np.array([
+    [5, 28], [7, 37], [3, 19], [1, 46], [14, 34], [10, 43],
+    [12, 25], [16, 52], [41, 30], [39, 23], [50, 21], [48, 32],
+], dtype=np.intp)
+EDGE_COLORS = np.array([
+    [U, R], [U, F], [U, L], [U, B], [D, R], [D, F],
+    [D, L], [D, B], [F, R], [F, L], [B, L], [B, R],
+], dtype=np.uint8)
+
+CENTER_FACELETS = np.arange(6) * 9 + 4
+
+N_CORNER_PERM = factorial(8)      # 40320
+N_CORNER_ORI = 3 ** 7             # 2187
+N_EDGE_PERM = factorial(12)       # 479001600
+N_EDGE_ORI = 2 ** 11              # 2048
+N_CORNER_COORD = N_CORNER_PERM * N_CORNER_ORI
+N_EDGE_COORD = N_EDGE_PERM * N_EDGE_ORI
+
+# Packed key = corner_coord * N_EDGE_COORD + edge_coord, 67 bits -> 9 bytes
+KEY_BYTES = 9
+
+
+# Corner lookup is keyed by the two colours clockwise after the U/D sticker
+_CORNER_CUBIE = np.full((6, 6), -1, dtype=np.int8)
+for _j, (_c0, _c1, _c2) in enumerate(CORNER_COLORS):
+    _CORNER_CUBIE[_c1, _c2] = _j
+
+# Edge lookup is keyed by the colours read in facelet order
+_EDGE_CUBIE = np.full((6, 6), -1, dtype=np.int8)
+_EDGE_ORI = np.zeros((6, 6), dtype=np.int8)
+for _j, (_c0, _c1) in enumerate(EDGE_COLORS):
+    _EDGE_CUBIE[_c0, _c1] = _j
+    _EDGE_CUBIE[_c1, _c0] = _j
+    _EDGE_ORI[_c1, _c0] = 1
+
+
+# ===== PERMUTATION RANKING =====
+
+def _factorials(n):
+    return np.array([factorial(n - 1 - i) for i in range(n)], dtype=np.int64)
+
+
+def rank_permutation_batch(perms):
+    """Lehmer rank of every row of an (N, n) permutation array"""
+    perms = np.asarray(perms)
+    n = perms.shape[1]
+    later = np.triu(np.ones((n, n), dtype=bool), 1)
+    smaller_after = ((perms[:, None, :] < perms[:, :, None]) & later).sum(axis=2)
+    return smaller_after.astype(np.int64) @ _factorials(n)
+
+
+def unrank_permutation_batch(ranks, n):
+    """Inverse of rank_permutation_batch"""
+    return unrank_partial_permutation_batch(ranks, n, n)
+
+
+def rank_partial_permutation_batch(values, n):
+    """Rank of every row of an (N, k) array of distinct values drawn from range(n)"""
+    values = np.asarray(values, dtype=np.int64)
+    k = values.shape[1]
+    earlier = np.tril(np.ones((k, k), dtype=bool), -1)
+    smaller_before = ((values[:, None, :] < values[:, :, None]) & earlier).sum(axis=2)
+    weights = np.array([perm(n - 1 - i, k - 1 - i) for i in range(k)], dtype=np.int64)
+    return (values - smaller_before) @ weights
+
+
+def unrank_partial_permutation_batch(ranks, n, k):
+    """Inverse of rank_partial_permutation_batch"""
+    ranks = np.asarray(ranks, dtype=np.int64).copy()
+    count = len(ranks)
+    available = np.ones((count, n), dtype=bool)
+    values = np.empty((count, k), dtype=np.int8)
+    rows = np.arange(count)
+    for i in range(k):
+        weight = perm(n - 1 - i, k - 1 - i)
+        digit = ranks // weight
+        ranks -= digit * weight
+        # position of the (digit+1)-th still-available element
+        choice = np.argmax(np.cumsum(available, axis=1) == (digit + 1)[:, None], axis=1)
+        values[:, i] = choice
+        available[rows, choice] = False
+    return values
+
+
+def rank_orientation_batch(oris, base):
+    """Orientation coordinate from all but the last cubie (which is implied)"""
+    oris = np.asarray(oris, dtype=np.int64)[:, :-1]
+    weights = base ** np.arange(oris.shape[1] - 1, -1, -1, dtype=np.int64)
+    return oris @ weights
+
+
+def unrank_orientation_batch(coords, base, n):
+    """Inverse of rank_orientation_batch; the last cubie restores the total twist"""
+    coords = np.asarray(coords, dtype=np.int64).copy()
+    oris = np.empty((len(coords), n), dtype=np.int8)
+    for i in range(n - 2, -1, -1):
+        oris[:, i] = coords % base
+        coords //= base
+    oris[:, n - 1] = (-oris[:, :n - 1].sum(axis=1)) % base
+    return oris
+
+
+# ===== STICKERS <-> CUBIES =====
+
+def stickers_to_cubies_batch(states):
+    """Read (cp, co, ep, eo) arrays from a (N, 54) batch of sticker states"""
+    states = np.asarray(states)
+    count = len(states)
+
+    corner_cols = states[:, CORNER_FACELETS]                       # (N, 8, 3)
+    co = np.argmax(corner_cols <= D, axis=2).astype(np.int8)       # U/D sticker
+    rows = np.arange(count)[:, None]
+    slots = np.arange(8)[None, :]
+    col1 = corner_cols[rows, slots, (co + 1) % 3]
+    col2 = corner_cols[rows, slots, (co + 2) % 3]
+    cp = _CORNER_CUBIE[col1, col2]
+
+    edge_cols = states[:, EDGE_FACELETS]                           # (N, 12, 2)
+    ep = _EDGE_CUBIE[edge_cols[:, :, 0], edge_cols[:, :, 1]]
+    eo = _EDGE_ORI[edge_cols[:, :, 0], edge_cols[:, :, 1]]
+    return cp, co, ep, eo
+
+
+def cubies_to_stickers_batch(cp, co, ep, eo):
+    """Build a (N, 54) sticker batch from cubie permutation/orientation arrays"""
+    cp, co = np.asarray(cp, dtype=np.intp), np.asarray(co, dtype=np.intp)
+    ep, eo = np.asarray(ep, dtype=np.intp), np.asarray(eo, dtype=np.intp)
+    count = len(cp)
+    states = np.empty((count, NUM_STICKERS), dtype=np.uint8)
+    states[:, CENTER_FACELETS] = np.arange(6, dtype=np.uint8)
+
+    rows = np.arange(count)[:, None]
+    for n in range(3):
+        states[rows, CORNER_FACELETS[np.arange(8), (n + co) % 3]] = CORNER_COLORS[cp, n]
+    for n in range(2):
+        states[rows, EDGE_FACELETS[np.arange(12), (n + eo) % 2]] = EDGE_COLORS[ep, n]
+    return states
+
+
+def stickers_to_cubies(state):
+    """(cp, co, ep, eo) of a single sticker state"""
+    return tuple(a[0] for a in stickers_to_cubies_batch(np.asarray(state)[None]))
+
+
+def cubies_to_stickers(cp, co, ep, eo):
+    """Sticker state of a single cubie description"""
+    return cubies_to_stickers_batch([cp], [co], [ep], [eo])[0]
+
+
+# ===== PACKED KEYS =====
+
+def encode_cubies_batch(cp, co, ep, eo):
+    """Pack cubie arrays into (N, 2) uint64 [corner_coord, edge_coord]"""
+    corner = rank_permutation_batch(cp) * N_CORNER_ORI + rank_orientation_batch(co, 3)
+    edge = rank_permutation_batch(ep) * N_EDGE_ORI + rank_orientation_batch(eo, 2)
+    return np.stack([corner, edge], axis=1).astype(np.uint64)
+
+
+def decode_cubies_batch(keys):
+    """(cp, co, ep, eo) arrays from (N, 2) packed keys"""
+    keys = np.asarray(keys, dtype=np.int64)
+    corner, edge = keys[:, 0], keys[:, 1]
+    cp = unrank_permutation_batch(corner // N_CORNER_ORI, 8)
+    co = unrank_orientation_batch(corner % N_CORNER_ORI, 3, 8)
+    ep = unrank_permutation_batch(edge // N_EDGE_ORI, 12)
+    eo = unrank_orientation_batch(edge % N_EDGE_ORI, 2, 12)
+    return cp, co, ep, eo
+
+
+def encode_batch(states):
+    """Encode a (N, 54) batch as (N, 2) uint64 [corner_coord, edge_coord]"""
+    return encode_cubies_batch(*stickers_to_cubies_batch(states))
+
+
+def decode_batch(keys):
+    """Inverse of encode_batch"""
+    return cubies_to_stickers_batch(*decode_cubies_batch(keys))
+
+
+def encode_state(state):
+    """Pack a sticker state into a single 67-bit integer (solved cube is 0)"""
+    corner, edge = encode_batch(np.asarray(state)[None])[0]
+    return int(corner) * N_EDGE_COORD + int(edge)
+
+
+def decode_state(key):
+    """Sticker state from a packed integer key"""
+    corner, edge = divmod(int(key), N_EDGE_COORD)
+    return decode_batch([[corner, edge]])[0]
+
+
+def state_key(state):
+    """9-byte hashable key for dictionaries and on-disk tables"""
+    return encode_state(state).to_bytes(KEY_BYTES, 'big')
+
+
+def key_to_state(key):
+    """Sticker state from a state_key() bytes key"""
+    return decode_state(int.from_bytes(key, 'big'))
+
+
+# ===== KEY HASH TABLE =====
+
+class KeyTable:
+    """Open-addressing hash table from packed (corner, edge) keys to dense ids.
+
+    Everything lives in two flat arrays and whole batches are inserted or
+    looked up with vectorised linear probing.
+    """
+
+    def __init__(self, capacity):
+        size = 1 << int(np.ceil(np.log2(max(2, capacity * 2))))
+        self.mask = size - 1
+        self.keys = np.zeros((size, 2), dtype=np.uint64)
+        self.values = np.full(size, -1, dtype=np.int64)
+        self.count = 0
+
+    def _slots(self, keys):
+        mixed = keys[:, 0] * np.uint64(0x9E3779B97F4A7C15) ^ keys[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+        return (mixed >> np.uint64(17)).astype(np.int64) & self.mask
+
+    def get(self, keys):
+        """Id of every key, -1 where absent"""
+        slots = self._slots(keys)
+        ids = np.full(len(keys), -1, dtype=np.int64)
+        pending = np.arange(len(keys))
+        while len(pending):
+            s = slots[pending]
+            occupant = self.values[s]
+            match = (occupant >= 0) & (self.keys[s] == keys[pending]).all(axis=1)
+            ids[pending[match]] = occupant[match]
+            # an empty slot ends the probe sequence
+            probing = (occupant >= 0) & ~match
+            pending = pending[probing]
+            slots[pending] = (slots[pending] + 1) & self.mask
+        return ids
+
+    def get_or_insert(self, keys):
+        """Id of every key; absent keys get the next free ids in order.
+
+        Keys must be unique within the batch. Returns (ids, inserted_mask).
+        """
+        slots = self._slots(keys)
+        ids = np.full(len(keys), -1, dtype=np.int64)
+        inserted = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        while len(pending):
+            s = slots[pending]
+            occupant = self.values[s]
+            empty = occupant < 0
+            match = ~empty & (self.keys[s] == keys[pending]).all(axis=1)
+            ids[pending[match]] = occupant[match]
+
+            claimed = np.zeros(len(pending), dtype=bool)
+            if empty.any():
+                # several keys may race for one empty slot; the first one wins
+                free_slots, first = np.unique(s[empty], return_index=True)
+                winners = np.flatnonzero(empty)[first]
+                claimed[winners] = True
+                won = pending[winners]
+                new_ids = self.count + np.arange(len(won))
+                self.count += len(won)
+                self.keys[free_slots] = keys[won]
+                self.values[free_slots] = new_ids
+                ids[won] = new_ids
+                inserted[won] = True
+
+            # losers of a race retry the same slot, collisions probe onwards
+            collided = ~empty & ~match
+            slots[pending[collided]] = (slots[pending[collided]] + 1) & self.mask
+            pending = pending[~match & ~claimed]
+        return ids, inserted
+
+
+# ===== CUBIE MOVES =====
+
+def build_cubie_moves():
+    """Cubie form (cp, co, ep, eo) of every move, read off the sticker engine"""
+    solved = solved_state()
+    return [stickers_to_cubies(apply_move(solved, move)) for move in MOVES]
+
+
+# Applying move m to cubies s: cp'[i] = cp[m.cp[i]], co'[i] = co[m.cp[i]] + m.co[i]
+# (and likewise for edges, modulo 2)
+MOVE_CUBIES = build_cubie_moves()
+
+
+def apply_move_cubies_batch(cp, co, ep, eo, move):
+    """Apply move index `move` to a batch of cubie arrays"""
+    move_cp, move_co, move_ep, move_eo = MOVE_CUBIES[move]
+    return (cp[:, move_cp], (co[:, move_cp] + move_co) % 3,
+            ep[:, move_ep], (eo[:, move_ep] + move_eo) % 2)
+
+
+# ===== STATE VALIDATION =====
+
+def permutation_parity_batch(perms):
+    """0 for even, 1 for odd rows of an (N, n) permutation array"""
+    perms = np.asarray(perms)
+    n = perms.shape[1]
+    later = np.triu(np.ones((n, n), dtype=bool), 1)
+    return (((perms[:, None, :] < perms[:, :, None]) & later).sum(axis=(1, 2)) % 2)
+
+
+def state_errors(state):
+    """Everything that makes `state` unreachable by legal moves (empty when valid).
+
+    Checks, cheapest first: 54 stickers of colours 0-5, 9 of each colour,
+    centres in place, every corner and edge a real cubie present exactly
+    once, corner twist and edge flip sums, and equal corner and edge
+    permutation parity.
+    """
+    state = np.asarray(state)
+    if state.shape != (NUM_STICKERS,) or not np.isin(state, range(6)).all():
+        return ["state must be 54 sticker colours 0-5"]
+    state = state.astype(np.uint8)
+    counts = np.bincount(state, minlength=6)
+    if (counts != 9).any():
+        return [f"{count} stickers of {FACE_NAMES[colour]}, expected 9"
+                for colour, count in enumerate(counts) if count != 9]
+    errors = []
+    if (state[CENTER_FACELETS] != np.arange(6)).any():
+        errors.append("centres must be " + ' '.join(FACE_NAMES) + " in face order")
+
+    corner_cols = state[CORNER_FACELETS]
+    bad_corners = (corner_cols <= D).sum(axis=1) != 1
+    edge_cols = state[EDGE_FACELETS]
+    cp, co, ep, eo = stickers_to_cubies(state)
+    bad_corners |= cp < 0
+    bad_edges = ep < 0
+    errors += [f"corner {CORNER_NAMES[i]} has no matching cubie "
+               f"({''.join(FACE_NAMES[c] for c in corner_cols[i])})"
+               for i in np.flatnonzero(bad_corners)]
+    errors += [f"edge {EDGE_NAMES[i]} has no matching cubie "
+               f"({''.join(FACE_NAMES[c] for c in edge_cols[i])})"
+               for i in np.flatnonzero(bad_edges)]
+    if errors:
+        return errors
+
+    if len(set(cp.tolist())) != 8:
+        errors.append("a corner cubie appears twice")
+    if len(set(ep.tolist())) != 12:
+        errors.append("an edge cubie appears twice")
+    if errors:
+        return errors
+    if co.sum() % 3:
+        errors.append("corner orientation: one corner is twisted")
+    if eo.sum() % 2:
+        errors.append("edge orientation: one edge is flipped")
+    if permutation_parity_batch([cp])[0] != permutation_parity_batch([ep])[0]:
+        errors.append("permutation parity: two pieces are swapped")
+    return errors
+
+
+def validate_state(state):
+    """The state as uint8 stickers; ValueError listing the problems if it is unreachable"""
+    errors = state_errors(state)
+    if errors:
+        raise ValueError('; '.join(errors))
+    return np.asarray(state).astype(np.uint8)
+
+
+def parse_facelets(text):
+    """Sticker state from a facelet string: 54 face letters (U D L R F B)
+    naming each sticker's colour, in the engine's face-major sticker order.
+    Whitespace is ignored, so faces may be written on separate lines."""
+    if not isinstance(text, str):
+        raise ValueError("facelets must be a string")
+    facelets = ''.join(text.split()).upper()
+    if len(facelets) != NUM_STICKERS or set(facelets) - set(FACE_NAMES):
+        raise ValueError(f"facelets must be {NUM_STICKERS} letters from "
+                         + ''.join(FACE_NAMES))
+    return validate_state([FACE_NAMES.index(f) for f in facelets])
+
+
+def to_facelets(state):
+    """Facelet string of a sticker state (inverse of parse_facelets)"""
+    return ''.join(FACE_NAMES[c] for c in np.asarray(state))
@@ -0,0 +1,376 @@
+import numpy as np
+from functools import lru_cache
+
+# Face order matches RubiksCubeGUI: 0 Up, 1 Down, 2 Left, 3 Right, 4 Front, 5 Back.
+# A cube state is a flat array of 54 stickers, face-major, 9 stickers per face
+# laid out row by row exactly as draw_cube shows them in the unfolded net.
+FACE_NAMES = ['U', 'D', 'L', 'R', 'F', 'B']
+NUM_STICKERS = 54
+
+# Clockwise turn of a face's own stickers: new[i] = old[FACE_CW[i]]
+FACE_CW = [6, 3, 0, 7, 4, 1, 8, 5, 2]
+
+# Side strips moved by each clockwise quarter turn. Every strip receives the
+# stickers of the strip after it; the last strip receives from the first.
+SIDE_CYCLES = {
+    'U': [(4, (0, 1, 2)), (3, (0, 1, 2)), (5, (0, 1, 2)), (2, (0, 1, 2))],
+    'D': [(4, (6, 7, 8)), (2, (6, 7, 8)), (5, (6, 7, 8)), (3, (6, 7, 8))],
+    'L': [(0, (0, 3, 6)), (5, (8, 5, 2)), (1, (0, 3, 6)), (4, (0, 3, 6))],
+    'R': [(0, (2, 5, 8)), (4, (2, 5, 8)), (1, (2, 5, 8)), (5, (6, 3, 0))],
+    'F': [(0, (6, 7, 8)), (2, (8, 5, 2)), (1, (2, 1, 0)), (3, (0, 3, 6))],
+    'B': [(0, (0, 1, 2)), (3, (2, 5, 8)), (1, (8, 7, 6)), (2, (6, 3, 0))],
+}
+
+QUARTER_MOVES = ['U', 'D', 'L', 'R', 'F', 'B', "U'", "D'", "L'", "R'", "F'", "B'"]
+HALF_MOVES = ['U2', 'D2', 'L2', 'R2', 'F2', 'B2']
+MOVES = QUARTER_MOVES + HALF_MOVES
+MOVE_INDEX = {move: i for i, move in enumerate(MOVES)}
+
+INVERSE_MOVES = {}
+for _face in FACE_NAMES:
+    INVERSE_MOVES[_face] = _face + "'"
+    INVERSE_MOVES[_face + "'"] = _face
+    INVERSE_MOVES[_face + '2'] = _face + '2'
+
+
+def build_quarter_turn(face):
+    """Index permutation of a clockwise quarter turn: new = state[perm]"""
+    perm = np.arange(NUM_STICKERS)
+    f = FACE_NAMES.index(face)
+    perm[f * 9:f * 9 + 9] = [f * 9 + i for i in FACE_CW]
+
+    strips = SIDE_CYCLES[face]
+    for k, (dst_face, dst_idx) in enumerate(strips):
+        src_face, src_idx = strips[(k + 1) % len(strips)]
+        for d, s in zip(dst_idx, src_idx):
+            perm[dst_face * 9 + d] = src_face * 9 + s
+    return perm
+
+
+def build_move_table():
+    """Precompute all 18 moves as a (18, 54) table of index permutations"""
+    table = np.empty((len(MOVES), NUM_STICKERS), dtype=np.intp)
+    for face in FACE_NAMES:
+        quarter = build_quarter_turn(face)
+        half = quarter[quarter]
+        table[MOVE_INDEX[face]] = quarter
+        table[MOVE_INDEX[face + '2']] = half
+        table[MOVE_INDEX[face + "'"]] = half[quarter]
+    return table
+
+
+MOVE_TABLE = build_move_table()
+MOVE_TABLE.flags.writeable = False
+MOVE_PERMS = {move: MOVE_TABLE[i] for i, move in enumerate(MOVES)}
+
+
+def solved_state():
+    """Solved cube as a flat uint8 sticker array"""
+    return np.repeat(np.arange(6, dtype=np.uint8), 9)
+
+
+def apply_move(state, move):
+    """Apply one move with a single gather"""
+    return state[MOVE_PERMS[move]]
+
+
+def apply_moves(state, moves):
+    """Apply a sequence of moves in order"""
+    for move in moves:
+        state = state[MOVE_PERMS[move]]
+    return state
+
+
+def is_solved(state):
+    """True when every face shows a single colour (any cube size)"""
+    faces = np.asarray(state).reshape(6, -1)
+    return bool((faces == faces[:, :1]).all())
+
+
+def from_faces(faces):
+    """Convert a list of six 9-sticker faces into a flat state"""
+    return np.concatenate([np.asarray(face) for face in faces]).astype(np.uint8)
+
+
+def to_faces(state):
+    """Split a flat state back into six 9-sticker faces"""
+    return [face.copy() for face in np.asarray(state).reshape(6, 9)]
+
+
+# ===== BATCHED ENVIRONMENT =====
+
+# uint8 copy of the move table keeps batched gather indices small
+MOVE_TABLE_U8 = MOVE_TABLE.astype(np.uint8)
+
+
+def move_indices(moves):
+    """Convert move names (or indices) to an integer index array"""
+    moves = np.asarray(moves)
+    if moves.dtype.kind in 'US':
+        return np.array([MOVE_INDEX[m] for m in moves.ravel()],
+                        dtype=np.intp).reshape(moves.shape)
+    return moves.astype(np.intp, copy=False)
+
+
+def apply_move_batch(states, moves):
+    """Apply moves[i] to states[i] for a (N, 54) batch in one gather"""
+    return np.take_along_axis(states, MOVE_TABLE_U8[move_indices(moves)], axis=1)
+
+
+def is_solved_batch(states):
+    """Solvedness of every cube in a (N, 54) batch"""
+    faces = states.reshape(len(states), 6, 9)
+    return (faces == faces[:, :, 4:5]).all(axis=(1, 2))
+
+
+class BatchCubeEnv:
+    """N cubes stored as one (N, 54) uint8 array, stepped with vector moves"""
+
+    def __init__(self, num_cubes, seed=None):
+        self.num_cubes = num_cubes
+        self.rng = np.random.default_rng(seed)
+        self.states = np.tile(solved_state(), (num_cubes, 1))
+
+    def reset(self):
+        self.states[:] = solved_state()
+        return self.states
+
+    def step(self, moves):
+        """Apply one move per cube; moves is a length-N vector"""
+        self.states = apply_move_batch(self.states, moves)
+        return self.states
+
+    def random_moves(self, num_moves=len(QUARTER_MOVES)):
+        """Draw one random move index per cube from the first num_moves moves"""
+        return self.rng.integers(0, num_moves, size=self.num_cubes)
+
+    def scramble(self, depth, num_moves=len(QUARTER_MOVES)):
+        """Apply `depth` random moves to every cube"""
+        for _ in range(depth):
+            self.step(self.random_moves(num_moves))
+        return self.states
+
+    def is_solved(self):
+        return is_solved_batch(self.states)
+
+
+# ===== MOVE SEQUENCE NORMALIZATION =====
+
+METRICS = ('HTM', 'QTM')
+_TURN_SUFFIX = {'': 1, '2': 2, "'": 3}
+_SUFFIX_OF = {1: '', 2: '2', 3: "'"}
+_FACE_AXIS = {face: i // 2 for i, face in enumerate(FACE_NAMES)}
+
+
+def normalize_moves(moves, metric='HTM'):
+    """Canonical form of a move sequence, in one pass over a stack.
+
+    Same-face turns merge (U U -> U2, U U' -> nothing), turns of opposite faces
+    commute so they merge across each other (U D U' -> D) and are kept in
+    FACE_NAMES order, and every cancellation exposes the earlier moves to the
+    next one (U R R' U' -> nothing). In QTM half turns are written as two
+    quarter turns; in HTM they stay X2.
+    """
+    stack = []                      # [face, quarter turns mod 4]
+    for move in moves:
+        face, turns = move[0], _TURN_SUFFIX[move[1:]]
+        axis = _FACE_AXIS[face]
+        if stack and stack[-1][0] == face:
+            slot = len(stack) - 1
+        elif (len(stack) >= 2 and _FACE_AXIS[stack[-1][0]] == axis
+              and stack[-2][0] == face):
+            slot = len(stack) - 2
+        else:
+            stack.append([face, turns])
+            # opposite faces commute: keep each axis pair in FACE_NAMES order
+            if (len(stack) >= 2 and _FACE_AXIS[stack[-2][0]] == axis
+                    and FACE_NAMES.index(stack[-2][0]) > FACE_NAMES.index(face)):
+                stack[-2], stack[-1] = stack[-1], stack[-2]
+            continue
+        stack[slot][1] = (stack[slot][1] + turns) % 4
+        if stack[slot][1] == 0:
+            del stack[slot]
+
+    result = []
+    for face, turns in stack:
+        if metric == 'QTM' and turns == 2:
+            result += [face, face]
+        else:
+            result.append(face + _SUFFIX_OF[turns])
+    return result
+
+
+def move_count(moves, metric='HTM'):
+    """Length of a sequence in the given metric (a half turn counts 2 in QTM)"""
+    if metric == 'QTM':
+        return sum(2 if move.endswith('2') else 1 for move in moves)
+    return len(moves)
+
+
+# ===== MOVE SEQUENCES =====
+# A sticker permutation p acts as new = state[p] (the same convention as
+# MOVE_TABLE), so "p then q" is p[q]. A whole move sequence composes into one
+# permutation; applying or verifying it is then a single gather.
+
+IDENTITY = np.arange(NUM_STICKERS, dtype=np.intp)
+IDENTITY.flags.writeable = False
+
+
+def sequence_permutation(moves):
+    """One permutation for a whole move sequence (cached; read-only)"""
+    return _sequence_permutation(tuple(moves))
+
+
+@lru_cache(maxsize=4096)
+def _sequence_permutation(moves):
+    if len(moves) <= 1:
+        perm = MOVE_PERMS[moves[0]] if moves else IDENTITY
+    else:
+        # split in halves so sequences sharing a prefix share cached work
+        half = len(moves) // 2
+        perm = _sequence_permutation(moves[:half])[_sequence_permutation(moves[half:])]
+        perm.flags.writeable = False
+    return perm
+
+
+def apply_sequence(state, moves):
+    """apply_moves as one gather through the composed permutation"""
+    return state[sequence_permutation(moves)]
+
+
+def sequence_states(state, moves, perms=MOVE_PERMS):
+    """(n + 1, stickers) array of `state` and the state after every move, in
+    the state's own dtype (54 bytes per step for uint8 3x3 stickers). Pass a
+    CubeModel's move_perms for other cube sizes."""
+    states = np.empty((len(moves) + 1, len(state)), dtype=state.dtype)
+    states[0] = state
+    for k, move in enumerate(moves):
+        np.take(states[k], perms[move], out=states[k + 1])
+    return states
+
+
+def invert_moves(moves):
+    """The move sequence that undoes `moves`"""
+    return [INVERSE_MOVES[move] for move in reversed(moves)]
+
+
+# ===== NxN CUBES =====
+# Any cube size, generated from geometry instead of hand-written cycles.
+# Stickers sit at integer points on the surface of a cube of half-width n:
+# the face's own axis is +-n and the other two axes step by 2 through
+# -(n-1)..n-1. A quarter turn of a layer rotates the points in it by -90
+# degrees about the face's outward normal, and reading off where each point
+# lands gives the move's permutation.
+
+# Outward normal, column direction and row direction of every face as it is
+# laid out in the unfolded net (x right, y up, z towards the viewer on F)
+FACE_FRAMES = {
+    'U': ((0, 1, 0), (1, 0, 0), (0, 0, 1)),
+    'D': ((0, -1, 0), (1, 0, 0), (0, 0, -1)),
+    'L': ((-1, 0, 0), (0, 0, 1), (0, -1, 0)),
+    'R': ((1, 0, 0), (0, 0, -1), (0, -1, 0)),
+    'F': ((0, 0, 1), (1, 0, 0), (0, -1, 0)),
+    'B': ((0, 0, -1), (-1, 0, 0), (0, -1, 0)),
+}
+
+MIN_CUBE_SIZE = 2
+MAX_CUBE_SIZE = 7
+
+
+def sticker_positions(n):
+    """(6 * n * n, 3) integer surface points, face-major and row by row"""
+    steps = 2 * np.arange(n) - (n - 1)
+    rows, cols = np.meshgrid(steps, steps, indexing='ij')
+    points = []
+    for face in FACE_NAMES:
+        normal, col_dir, row_dir = (np.array(v) for v in FACE_FRAMES[face])
+        points.append(n * normal + cols.reshape(-1, 1) * col_dir +
+                      rows.reshape(-1, 1) * row_dir)
+    return np.concatenate(points)
+
+
+def build_layer_turn(positions, n, face, layer):
+    """Clockwise quarter turn of the layer-th layer (1 = outer) seen from `face`"""
+    normal = np.array(FACE_FRAMES[face][0])
+    depth = positions @ normal
+    selected = depth == n + 1 - 2 * layer
+    if layer == 1:
+        selected |= depth == n
+    # rotation by -90 degrees about the normal: p -> (n.p) n - n x p
+    turned = positions.copy()
+    turned[selected] = (depth[selected, None] * normal -
+                        np.cross(normal, positions[selected]))
+
+    # dense lookup from a surface point to its sticker index
+    width = 2 * n + 1
+    keys = ((positions + n) * [width * width, width, 1]).sum(axis=1)
+    index_of = np.empty(width ** 3, dtype=np.intp)
+    index_of[keys] = np.arange(len(positions))
+    destination = index_of[((turned + n) * [width * width, width, 1]).sum(axis=1)]
+    perm = np.empty(len(positions), dtype=np.intp)
+    perm[destination] = np.arange(len(positions))     # new[dest] = old[src]
+    return perm
+
+
+class CubeModel:
+    """Sticker engine of an n x n x n cube: flat uint8 states of 6 * n * n
+    stickers and one precomputed gather per move.
+
+    Stickers are face-major and row by row as in the unfolded net, so n = 3
+    reproduces MOVE_TABLE. Moves are the outer turns (named as in MOVES)
+    followed by inner slice turns in SiGN notation: '2R' turns the second
+    layer seen from R, "3U'" the third layer from U counter-clockwise.
+    """
+
+    def __init__(self, n):
+        if not MIN_CUBE_SIZE <= n <= MAX_CUBE_SIZE:
+            raise ValueError(f"cube size must be {MIN_CUBE_SIZE}-{MAX_CUBE_SIZE}")
+        self.n = n
+        self.num_stickers = 6 * n * n
+        positions = sticker_positions(n)
+
+        self.moves = []
+        self.inverse_moves = {}
+        tables = []
+        for layer in range(1, (n + 1) // 2 + 1):
+            prefix = '' if layer == 1 else str(layer)
+            turns = {}
+            for face in FACE_NAMES:
+                quarter = build_layer_turn(positions, n, face, layer)
+                half = quarter[quarter]
+                turns[face], turns[face + '2'], turns[face + "'"] = quarter, half, half[quarter]
+            for move in MOVES:
+                self.moves.append(prefix + move)
+                self.inverse_moves[prefix + move] = prefix + INVERSE_MOVES[move]
+                tables.append(turns[move])
+        self.move_table = np.array(tables, dtype=np.intp)
+        self.move_table.flags.writeable = False
+        self.move_perms = {move: self.move_table[i] for i, move in enumerate(self.moves)}
+
+    def quarter_moves(self):
+        """Every move except half turns (the QTM move set)"""
+        return [move for move in self.moves if not move.endswith('2')]
+
+    def solved_state(self):
+        return np.repeat(np.arange(6, dtype=np.uint8), self.n * self.n)
+
+    def apply_move(self, state, move):
+        """One gather, whatever the cube size"""
+        return state[self.move_perms[move]]
+
+    def apply_moves(self, state, moves):
+        for move in moves:
+            state = state[self.move_perms[move]]
+        return state
+
+    def invert_moves(self, moves):
+        return [self.inverse_moves[move] for move in reversed(moves)]
+
+    def sequence_states(self, state, moves):
+        return sequence_states(state, moves, self.move_perms)
+
+
+@lru_cache(maxsize=None)
+def cube_model(n):
+    """The CubeModel of size n, generated on first use and then shared"""
+    return CubeModel(n)
@@ -1,9 +1,16 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 import numpy as np
 import random
 import time
 from threading import Thread
+from RubiksCubeEngine import (QUARTER_MOVES, MOVES, METRICS, MIN_CUBE_SIZE, MAX_CUBE_SIZE,
+                              cube_model, is_solved, move_count)
+from RubiksCubeSolver import CubeSolver, ENGINES
+from RubiksCubeEncoding import parse_facelets, to_facelets
+from RubiksCubeAnimation import Frame, AnimationScheduler
+from RubiksCubeResults import ResultsStore
+from RubiksCubeProfiler import PROFILER
 
 class RubiksCubeGUI:
     def __init__(self, root):
@@ -14,15 +21,27 @@ class RubiksCubeGUI:
         # Modern gradient-like background
         self.root.configure(bg='#0a0e27')
         
-        # Cube state (3x3 cube - 6 faces with 9 stickers each)
+        # Cube state: 6 faces of cube_size x cube_size stickers; the 3x3 is
+        # the one the solvers handle, larger cubes are scrambled and replayed
         self.cube_size = 3
+        self.model = cube_model(self.cube_size)
         self.cube_state = self.create_solved_state()
         self.scramble_moves = []
         self.solution_moves = []
         self.is_animating = False
         self.animation_speed = 400
+        
+        # Timeline: every state of scramble + solution, row k = after k moves
+        self.timeline_moves = []
+        self.timeline = self.cube_state[np.newaxis].copy()
+        self.timeline_pos = 0
+        self.frame_offset = 0
         self.scramble_depth = 10
         
+        # Persistent canvas items, created on the first draw
+        self.sticker_items = None
+        self.rendered_state = None
+        
         # Enhanced color palette
         self.colors = {
             0: '#FFFFFF',  # White (Up)
@@ -39,11 +58,34 @@ class RubiksCubeGUI:
             'total_moves': 0,
         }
         
+        # Headless solve pipeline: symmetry-aware solution cache, then the
+        # two-phase or IDA* engine (tables are built with:
+        # python RubiksCubeSolver.py --build-tables), then the inverse scramble
+        self.solver_engine = 'Two-Phase'
+        self.metric = 'HTM'
+        self.solver = CubeSolver(self.solver_engine, self.metric)
+        self.solve_report = ''
+        self.solve_seconds = 0.0
+        
+        # Every finished solve is logged for the analysis dashboard
+        self.results = ResultsStore()
+        
         self.create_widgets()
         
+        # All widget updates of an animation happen on the Tk thread, in the
+        # scheduler's root.after ticks; workers only queue frames
+        self.animator = AnimationScheduler(self.root, self.show_frame,
+                                           interval_ms=self.animation_speed)
+        self.played_steps = 0
+        self.animator.start()
+        
+        # Profiler overlay (stage timings, counters, frame latency); off by default
+        self.overlay_item = None
+        self.animate_start = None
+        
     def create_solved_state(self):
-        """Create solved cube state - 6 faces with 9 stickers each"""
-        return [np.full(9, i, dtype=int) for i in range(6)]
+        """Create solved cube state - flat array of 6 faces x n*n stickers"""
+        return self.model.solved_state()
     
     def create_widgets(self):
         # Main container with padding
@@ -102,6 +144,36 @@ class RubiksCubeGUI:
                              bg='#1a1f3a', pady=5)
         move_label.pack(fill=tk.X, pady=(5, 0))
         
+        # Timeline scrubbing over the precomputed states
+        timeline_frame = tk.Frame(status_container, bg='#1a1f3a')
+        timeline_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        for text, command in [("⏮", lambda: self.seek(0)),
+                              ("◀", lambda: self.seek(self.timeline_pos - 1))]:
+            tk.Button(timeline_frame, text=text, font=('Helvetica', 9, 'bold'),
+                      bg='#2d3548', fg='#00d4ff', activebackground='#3d4558',
+                      relief=tk.FLAT, bd=0, width=3, command=command,
+                      cursor='hand2').pack(side=tk.LEFT, padx=2)
+        
+        self.timeline_scale = tk.Scale(timeline_frame, from_=0, to=0, orient=tk.HORIZONTAL,
+                                       showvalue=False, bg='#1a1f3a', fg='#ffffff',
+                                       highlightthickness=0, troughcolor='#0f1429',
+                                       activebackground='#00d4ff', sliderrelief=tk.FLAT,
+                                       command=lambda value: self.seek(int(value)))
+        self.timeline_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4)
+        
+        for text, command in [("▶", lambda: self.seek(self.timeline_pos + 1)),
+                              ("⏭", lambda: self.seek(len(self.timeline_moves)))]:
+            tk.Button(timeline_frame, text=text, font=('Helvetica', 9, 'bold'),
+                      bg='#2d3548', fg='#00d4ff', activebackground='#3d4558',
+                      relief=tk.FLAT, bd=0, width=3, command=command,
+                      cursor='hand2').pack(side=tk.LEFT, padx=2)
+        
+        self.timeline_var = tk.StringVar(value="0/0")
+        tk.Label(timeline_frame, textvariable=self.timeline_var, width=9,
+                 font=('Courier', 9, 'bold'), fg='#7c8db5',
+                 bg='#1a1f3a').pack(side=tk.LEFT, padx=(4, 0))
+        
         # ===== RIGHT PANEL - CONTROLS (SCROLLABLE) =====
         right_frame = tk.Frame(content, bg='#1a1f3a', relief=tk.RAISED, 
                               bd=2, width=380)
@@ -158,6 +230,40 @@ class RubiksCubeGUI:
         self.btn_reset.pack(fill=tk.X, padx=8, pady=5)
         self.add_button_hover(self.btn_reset, '#3498db', '#2980b9')
         
+        self.btn_import = tk.Button(controls, text="📥 IMPORT", 
+                              font=('Helvetica', 10, 'bold'), bg='#1abc9c', 
+                              fg='black', activebackground='#16a085', 
+                              relief=tk.FLAT, bd=0,
+                              command=self.import_state, height=2, 
+                              cursor='hand2', padx=15)
+        self.btn_import.pack(fill=tk.X, padx=8, pady=5)
+        self.add_button_hover(self.btn_import, '#1abc9c', '#16a085')
+        
+        # Playback controls for the running animation
+        playback = tk.Frame(controls, bg='#1a1f3a')
+        playback.pack(fill=tk.X, padx=8, pady=5)
+        
+        self.btn_pause = tk.Button(playback, text="⏸ PAUSE",
+                                   font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                                   fg='#00d4ff', activebackground='#3d4558',
+                                   relief=tk.FLAT, bd=0,
+                                   command=self.pause_animation, cursor='hand2')
+        self.btn_pause.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 4))
+        
+        self.btn_skip = tk.Button(playback, text="⏭ SKIP",
+                                  font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                                  fg='#00d4ff', activebackground='#3d4558',
+                                  relief=tk.FLAT, bd=0,
+                                  command=self.skip_animation, cursor='hand2')
+        self.btn_skip.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4)
+        
+        self.btn_cancel = tk.Button(playback, text="⏹ CANCEL",
+                                    font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                                    fg='#00d4ff', activebackground='#3d4558',
+                                    relief=tk.FLAT, bd=0,
+                                    command=self.cancel_animation, cursor='hand2')
+        self.btn_cancel.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+        
         # Settings
         settings = tk.LabelFrame(scrollable_frame, text="⚙️ SETTINGS", 
                                 font=('Helvetica', 11, 'bold'),
@@ -206,6 +312,72 @@ class RubiksCubeGUI:
                               sliderrelief=tk.FLAT)
         speed_scale.pack(fill=tk.X, pady=3)
         
+        # Cube size: moves and the net are generated for any size
+        size_container = tk.Frame(settings, bg='#1a1f3a')
+        size_container.pack(fill=tk.X, padx=8, pady=5)
+        
+        tk.Label(size_container, text="Size:",
+                 font=('Helvetica', 9, 'bold'),
+                 fg='#ffffff', bg='#1a1f3a').pack(side=tk.LEFT)
+        
+        self.size_var = tk.IntVar(value=self.cube_size)
+        size_menu = tk.OptionMenu(size_container, self.size_var,
+                                  *range(MIN_CUBE_SIZE, MAX_CUBE_SIZE + 1),
+                                  command=self.update_cube_size)
+        size_menu.config(font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                         fg='#00d4ff', activebackground='#00d4ff',
+                         highlightthickness=0, relief=tk.FLAT)
+        size_menu.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
+        
+        # Solver engine
+        engine_container = tk.Frame(settings, bg='#1a1f3a')
+        engine_container.pack(fill=tk.X, padx=8, pady=5)
+        
+        tk.Label(engine_container, text="Engine:",
+                 font=('Helvetica', 9, 'bold'),
+                 fg='#ffffff', bg='#1a1f3a').pack(side=tk.LEFT)
+        
+        self.engine_var = tk.StringVar(value=self.solver_engine)
+        engine_menu = tk.OptionMenu(engine_container, self.engine_var,
+                                    *ENGINES,
+                                    command=self.update_solver_engine)
+        engine_menu.config(font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                           fg='#00d4ff', activebackground='#00d4ff',
+                           highlightthickness=0, relief=tk.FLAT)
+        engine_menu.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
+        
+        # Turn metric: HTM scrambles and solves with half turns, QTM only with quarters
+        metric_container = tk.Frame(settings, bg='#1a1f3a')
+        metric_container.pack(fill=tk.X, padx=8, pady=5)
+        
+        tk.Label(metric_container, text="Metric:",
+                 font=('Helvetica', 9, 'bold'),
+                 fg='#ffffff', bg='#1a1f3a').pack(side=tk.LEFT)
+        
+        self.metric_var = tk.StringVar(value=self.metric)
+        metric_menu = tk.OptionMenu(metric_container, self.metric_var, *METRICS,
+                                    command=self.update_metric)
+        metric_menu.config(font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                           fg='#00d4ff', activebackground='#00d4ff',
+                           highlightthickness=0, relief=tk.FLAT)
+        metric_menu.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
+        
+        # Profiler: stage timings and frame latency drawn over the cube
+        profile_container = tk.Frame(settings, bg='#1a1f3a')
+        profile_container.pack(fill=tk.X, padx=8, pady=5)
+        
+        self.profile_var = tk.BooleanVar(value=PROFILER.enabled)
+        tk.Checkbutton(profile_container, text="Profile", variable=self.profile_var,
+                       command=self.update_profiling,
+                       font=('Helvetica', 9, 'bold'), fg='#ffffff', bg='#1a1f3a',
+                       selectcolor='#2d3548', activebackground='#1a1f3a',
+                       highlightthickness=0).pack(side=tk.LEFT)
+        tk.Button(profile_container, text="💾 DUMP TRACE",
+                  font=('Helvetica', 9, 'bold'), bg='#2d3548',
+                  fg='#00d4ff', activebackground='#3d4558',
+                  relief=tk.FLAT, bd=0, command=self.dump_trace,
+                  cursor='hand2').pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
+        
         # Statistics
         stats_frame = tk.LabelFrame(scrollable_frame, text="📊 STATS", 
                                    font=('Helvetica', 11, 'bold'), 
@@ -263,28 +435,76 @@ class RubiksCubeGUI:
     def update_animation_speed(self, value):
         self.animation_speed = int(value)
         self.speed_label.config(text=f"Speed: {self.animation_speed}ms")
+        self.animator.interval_ms = self.animation_speed
+    
+    def update_solver_engine(self, value):
+        self.solver_engine = value
+    
+    def update_metric(self, value):
+        self.metric = value
+    
+    def update_cube_size(self, value):
+        if self.is_animating:
+            self.size_var.set(self.cube_size)
+            return
+        self.cube_size = int(value)
+        self.model = cube_model(self.cube_size)
+        self.sticker_items = None       # the net is rebuilt for the new size
+        self.reset_cube()
+    
+    def update_profiling(self):
+        PROFILER.enabled = self.profile_var.get()
+        if PROFILER.enabled:
+            self.refresh_overlay()
+        elif self.overlay_item is not None:
+            self.cube_canvas.delete(self.overlay_item)
+            self.overlay_item = None
+    
+    def refresh_overlay(self):
+        """Redraw the profiler overlay twice a second while profiling is on"""
+        if not PROFILER.enabled:
+            return
+        if self.overlay_item is None:
+            self.overlay_item = self.cube_canvas.create_text(
+                594, 6, anchor='ne', justify=tk.LEFT, fill='#FFD700',
+                font=('Courier', 8, 'bold'))
+        self.cube_canvas.itemconfig(self.overlay_item, text=PROFILER.overlay_text())
+        self.cube_canvas.tag_raise(self.overlay_item)
+        self.root.after(500, self.refresh_overlay)
+    
+    def dump_trace(self):
+        path = PROFILER.dump()
+        self.status_var.set(f"💾 Trace written to {path}")
     
     def get_stats_text(self):
         avg_moves = self.stats['total_moves'] / max(1, self.stats['solves'])
+        cache = self.solver.cache
         return f"Scrambles: {self.stats['scrambles']:>5}\n" \
                f"Solves:    {self.stats['solves']:>5}\n" \
-               f"Avg Moves: {avg_moves:>5.1f}"
+               f"Avg Moves: {avg_moves:>5.1f}\n" \
+               f"Cache Hit: {cache.hit_rate() * 100:>5.1f}%\n" \
+               f"Cache Mem: {cache.memory_bytes() / 1024:>5.1f}KB\n" \
+               f"Evictions: {cache.evictions:>5}"
     
-    def draw_cube(self):
-        """Draw compact cube visualization"""
+    def create_cube_items(self):
+        """Create the net's labels, shadows and stickers once; frames only recolour them"""
         self.cube_canvas.delete('all')
+        self.overlay_item = None
         
-        sticker_size = 30
-        gap = 3
+        # The net spans 4n + 4 by 3n + 3 sticker cells whatever the size
+        n = self.cube_size
+        sticker_size = 120 // (n + 1)
+        gap = max(1, 9 // n)
         
-        # Cube layout positions
+        # Cube layout positions, one empty cell between faces
+        unit = n + 1
         positions = {
-            0: (5, 1),   # Up
-            2: (1, 5),   # Left
-            4: (5, 5),   # Front
-            3: (9, 5),   # Right
-            5: (13, 5),  # Back
-            1: (5, 9),   # Down
+            0: (1 + unit, 1),              # Up
+            2: (1, 1 + unit),              # Left
+            4: (1 + unit, 1 + unit),       # Front
+            3: (1 + 2 * unit, 1 + unit),   # Right
+            5: (1 + 3 * unit, 1 + unit),   # Back
+            1: (1 + unit, 1 + 2 * unit),   # Down
         }
         
         face_names = ['UP', 'DOWN', 'LEFT', 'RIGHT', 'FRONT', 'BACK']
@@ -292,10 +512,13 @@ class RubiksCubeGUI:
         offset_x = 20
         offset_y = 15
         
+        # Canvas item id of every sticker, indexed like the flat cube state
+        self.sticker_items = [None] * len(self.cube_state)
+        
         for face_idx, (start_col, start_row) in positions.items():
             # Draw face label
-            label_x = offset_x + (start_col + 1) * sticker_size + start_col * gap
-            label_y = offset_y + (start_row - 0.6) * sticker_size + start_row * gap
+            label_x = offset_x + (start_col + (n - 1) / 2) * sticker_size + start_col * gap
+            label_y = offset_y + start_row * sticker_size - 18 + start_row * gap
             
             self.cube_canvas.create_text(label_x, label_y, 
                                         text=face_names[face_idx],
@@ -303,100 +526,74 @@ class RubiksCubeGUI:
                                         fill='#00d4ff')
             
             # Draw stickers with 3D effect
-            for i in range(9):
-                row = i // 3
-                col = i % 3
+            for i in range(n * n):
+                row, col = divmod(i, n)
                 
                 x = offset_x + (start_col + col) * sticker_size + col * gap
                 y = offset_y + (start_row + row) * sticker_size + row * gap
                 
-                color = self.colors[self.cube_state[face_idx][i]]
-                
                 # Shadow for 3D effect
                 self.cube_canvas.create_rectangle(
                     x+2, y+2, x + sticker_size+2, y + sticker_size+2,
                     fill='#000000', outline='')
                 
-                # Main sticker
-                self.cube_canvas.create_rectangle(
+                # Main sticker (coloured by draw_cube)
+                self.sticker_items[face_idx * n * n + i] = self.cube_canvas.create_rectangle(
                     x, y, x + sticker_size, y + sticker_size,
-                    fill=color, outline='#1a1f3a', width=2)
+                    fill='', outline='#1a1f3a', width=2)
+        
+        # Nothing rendered yet: the next draw recolours every sticker
+        self.rendered_state = None
+    
+    def draw_cube(self):
+        """Recolour only the stickers that changed since the last draw"""
+        if self.sticker_items is None:
+            self.create_cube_items()
+        
+        if self.rendered_state is None:
+            changed = range(len(self.cube_state))
+        else:
+            changed = np.flatnonzero(self.cube_state != self.rendered_state)
+        
+        for index in changed:
+            self.cube_canvas.itemconfig(self.sticker_items[index],
+                                        fill=self.colors[self.cube_state[index]])
+        self.rendered_state = self.cube_state.copy()
     
     def apply_move(self, state, move):
-        """Apply move to cube state"""
-        new_state = [face.copy() for face in state]
-        is_prime = "'" in move
-        base_face = move.replace("'", '')
-        times = 3 if is_prime else 1
-        
-        for _ in range(times):
-            temp = [face.copy() for face in new_state]
-            
-            if base_face == 'U':
-                new_state[0] = [temp[0][6], temp[0][3], temp[0][0],
-                               temp[0][7], temp[0][4], temp[0][1],
-                               temp[0][8], temp[0][5], temp[0][2]]
-                new_state[4][:3] = temp[3][:3]
-                new_state[3][:3] = temp[5][:3]
-                new_state[5][:3] = temp[2][:3]
-                new_state[2][:3] = temp[4][:3]
-                
-            elif base_face == 'D':
-                new_state[1] = [temp[1][6], temp[1][3], temp[1][0],
-                               temp[1][7], temp[1][4], temp[1][1],
-                               temp[1][8], temp[1][5], temp[1][2]]
-                new_state[4][6:9] = temp[2][6:9]
-                new_state[2][6:9] = temp[5][6:9]
-                new_state[5][6:9] = temp[3][6:9]
-                new_state[3][6:9] = temp[4][6:9]
-                
-            elif base_face == 'L':
-                new_state[2] = [temp[2][6], temp[2][3], temp[2][0],
-                               temp[2][7], temp[2][4], temp[2][1],
-                               temp[2][8], temp[2][5], temp[2][2]]
-                for i in [0, 3, 6]:
-                    new_state[0][i] = temp[5][8-i]
-                    new_state[5][8-i] = temp[1][i]
-                    new_state[1][i] = temp[4][i]
-                    new_state[4][i] = temp[0][i]
-                    
-            elif base_face == 'R':
-                new_state[3] = [temp[3][6], temp[3][3], temp[3][0],
-                               temp[3][7], temp[3][4], temp[3][1],
-                               temp[3][8], temp[3][5], temp[3][2]]
-                for i in [2, 5, 8]:
-                    new_state[0][i] = temp[4][i]
-                    new_state[4][i] = temp[1][i]
-                    new_state[1][i] = temp[5][8-i]
-                    new_state[5][8-i] = temp[0][i]
-                    
-            elif base_face == 'F':
-                new_state[4] = [temp[4][6], temp[4][3], temp[4][0],
-                               temp[4][7], temp[4][4], temp[4][1],
-                               temp[4][8], temp[4][5], temp[4][2]]
-                new_state[0][6:9] = [temp[2][8], temp[2][5], temp[2][2]]
-                new_state[2][2] = temp[1][0]
-                new_state[2][5] = temp[1][1]
-                new_state[2][8] = temp[1][2]
-                new_state[1][0:3] = [temp[3][6], temp[3][3], temp[3][0]]
-                new_state[3][0] = temp[0][6]
-                new_state[3][3] = temp[0][7]
-                new_state[3][6] = temp[0][8]
-                
-            elif base_face == 'B':
-                new_state[5] = [temp[5][6], temp[5][3], temp[5][0],
-                               temp[5][7], temp[5][4], temp[5][1],
-                               temp[5][8], temp[5][5], temp[5][2]]
-                new_state[0][0:3] = [temp[3][2], temp[3][5], temp[3][8]]
-                new_state[3][2] = temp[1][8]
-                new_state[3][5] = temp[1][7]
-                new_state[3][8] = temp[1][6]
-                new_state[1][6:9] = [temp[2][0], temp[2][3], temp[2][6]]
-                new_state[2][0] = temp[0][2]
-                new_state[2][3] = temp[0][1]
-                new_state[2][6] = temp[0][0]
-        
-        return new_state
+        """Apply move to cube state (single gather over precomputed permutation)"""
+        return self.model.apply_move(state, move)
+    
+    # ===== TIMELINE =====
+    
+    def set_timeline(self, moves, start=None):
+        """Precompute the state after every move of `moves`, starting from
+        `start` (the solved cube by default)"""
+        self.timeline_moves = list(moves)
+        start = self.create_solved_state() if start is None else start
+        self.timeline = self.model.sequence_states(start, self.timeline_moves)
+        self.timeline_scale.config(to=len(self.timeline_moves))
+    
+    def show_timeline_position(self, pos):
+        self.timeline_pos = pos
+        self.timeline_scale.set(pos)
+        self.timeline_var.set(f"{pos}/{len(self.timeline_moves)}")
+    
+    def seek(self, pos):
+        """Jump to the state after `pos` moves of the timeline: one row lookup"""
+        if self.is_animating:
+            self.timeline_scale.set(self.timeline_pos)
+            return
+        pos = max(0, min(pos, len(self.timeline_moves)))
+        if pos == self.timeline_pos and self.timeline_scale.get() == pos:
+            return
+        self.cube_state = self.timeline[pos]
+        self.show_timeline_position(pos)
+        self.draw_cube()
+        self.current_move_var.set(f"➤ {self.timeline_moves[pos - 1]}" if pos else "")
+        scramble_length = len(self.scramble_moves)
+        phase = "🎲 scramble" if pos <= scramble_length else "⚡ solution"
+        self.status_var.set(f"⏱ {phase} step {pos}/{len(self.timeline_moves)}")
     
     def scramble_cube(self):
         if self.is_animating:
@@ -406,168 +603,272 @@ class RubiksCubeGUI:
         self.cube_state = self.create_solved_state()
         self.draw_cube()
         
-        def animate():
-            self.is_animating = True
-            self.disable_buttons()
-            
-            self.status_var.set(f"🎲 Scrambling...")
-            self.root.update()
-            time.sleep(0.3)
-            
-            moves = ['U', 'D', 'L', 'R', 'F', 'B', "U'", "D'", "L'", "R'", "F'", "B'"]
-            self.scramble_moves = [random.choice(moves) for _ in range(self.scramble_depth)]
-            
-            self.history_text.delete(1.0, tk.END)
-            self.history_text.insert(tk.END, "═══ SCRAMBLE ═══\n", 'header')
-            self.history_text.insert(tk.END, ' '.join(self.scramble_moves) + '\n\n', 'scramble')
-            self.history_text.tag_config('header', foreground='#00d4ff', 
-                                        font=('Courier', 9, 'bold'))
-            self.history_text.tag_config('scramble', foreground='#9b59b6')
-            
-            for i, move in enumerate(self.scramble_moves):
-                self.current_move_var.set(f"➤ {move}")
-                self.status_var.set(f"🎲 {i+1}/{len(self.scramble_moves)}")
-                self.cube_state = self.apply_move(self.cube_state, move)
-                self.draw_cube()
-                self.root.update()
-                time.sleep(self.animation_speed / 1000)
-            
-            self.current_move_var.set("")
-            self.status_var.set("✅ Ready to solve!")
-            self.stats['scrambles'] += 1
-            self.stats_text.config(text=self.get_stats_text())
-            
-            self.is_animating = False
-            self.enable_buttons()
+        self.is_animating = True
+        self.disable_buttons()
+        self.status_var.set(f"🎲 Scrambling...")
         
-        Thread(target=animate, daemon=True).start()
+        if self.cube_size == 3:
+            move_set = MOVES if self.metric == 'HTM' else QUARTER_MOVES
+        else:
+            # outer and inner-slice turns of the larger cube
+            move_set = self.model.moves if self.metric == 'HTM' else self.model.quarter_moves()
+        self.scramble_moves = [random.choice(move_set) for _ in range(self.scramble_depth)]
+        
+        self.history_text.delete(1.0, tk.END)
+        self.history_text.insert(tk.END, "═══ SCRAMBLE ═══\n", 'header')
+        self.history_text.insert(tk.END, ' '.join(self.scramble_moves) + '\n\n', 'scramble')
+        self.history_text.tag_config('header', foreground='#00d4ff', 
+                                    font=('Courier', 9, 'bold'))
+        self.history_text.tag_config('scramble', foreground='#9b59b6')
+        
+        self.played_steps = 0
+        self.set_timeline(self.scramble_moves)
+        self.show_timeline_position(0)
+        self.frame_offset = 0
+        self.animator.play(self.build_frames(self.scramble_moves, "🎲"),
+                           self.finish_scramble)
+    
+    def finish_scramble(self, completed):
+        """Runs on the Tk thread once the scramble has played (or was cancelled)"""
+        self.current_move_var.set("")
+        if completed:
+            self.status_var.set("✅ Ready to solve!")
+        else:
+            # The cube only holds the moves that were shown
+            self.scramble_moves = self.scramble_moves[:self.played_steps]
+            self.set_timeline(self.scramble_moves)
+            self.history_text.insert(tk.END,
+                f"⏹ cancelled after {len(self.scramble_moves)} moves\n\n", 'scramble')
+            self.status_var.set("⏹ Scramble cancelled")
+        self.stats['scrambles'] += 1
+        self.stats_text.config(text=self.get_stats_text())
+        self.end_animation()
     
     def solve_cube(self):
         if self.is_animating:
             messagebox.showinfo("Wait", "Animation in progress!")
             return
         
-        if not self.scramble_moves:
-            messagebox.showwarning("No Scramble", "Scramble first!")
+        if self.is_cube_solved():
+            messagebox.showwarning("No Scramble", "Scramble or import a state first!")
             return
         
-        def animate():
-            self.is_animating = True
-            self.disable_buttons()
-            
-            self.status_var.set("🤖 AI solving...")
-            self.root.update()
-            time.sleep(0.8)
-            
-            self.solution_moves = self.generate_ai_solution()
-            
-            improvement = (1 - len(self.solution_moves) / len(self.scramble_moves)) * 100
-            
-            self.history_text.insert(tk.END, "═══ SOLUTION ═══\n", 'sol_header')
-            self.history_text.insert(tk.END, ' '.join(self.solution_moves) + '\n\n', 'solution')
+        # Solve what is shown: after scrubbing back, the scramble is the
+        # timeline up to the current position
+        if self.timeline_moves[:self.timeline_pos] != self.scramble_moves:
+            self.scramble_moves = self.timeline_moves[:self.timeline_pos]
+            self.set_timeline(self.scramble_moves, self.timeline[0])
+        
+        self.is_animating = True
+        self.disable_buttons()
+        self.status_var.set("🤖 AI solving...")
+        self.played_steps = 0
+        
+        def search():
+            # Solver work stays off the Tk thread; results go through the scheduler
+            start = time.perf_counter()
+            try:
+                with PROFILER.stage('solve'):
+                    solution = self.generate_ai_solution()
+                self.solve_seconds = time.perf_counter() - start
+                if solution is None:
+                    self.animator.call(self.solve_failed)
+                    return
+                with PROFILER.stage('frames'):
+                    timeline = self.model.sequence_states(self.timeline[0],
+                                                          self.scramble_moves + solution)
+                    frames = self.build_frames(solution, "⚡", timeline)
+            except Exception as error:
+                # a broken table or solver bug must not leave the buttons disabled
+                message = f"{type(error).__name__}: {error}"
+                self.animator.call(lambda: self.solve_failed(message))
+                return
+            self.animator.call(lambda: self.show_solution(solution, timeline))
+            self.animate_start = time.perf_counter()
+            self.animator.play(frames, self.finish_solve)
+        
+        Thread(target=search, daemon=True).start()
+    
+    def solve_failed(self, error=None):
+        """Runs on the Tk thread when the search found nothing or raised `error`"""
+        if error is None:
+            self.history_text.insert(tk.END, f"✗ {self.solver_engine} found no solution\n",
+                                     'stats')
+            self.status_var.set("⚠️ No solution found - try the Two-Phase engine")
+        else:
+            self.history_text.insert(tk.END, f"✗ {self.solver_engine} failed: {error}\n",
+                                     'stats')
+            self.status_var.set(f"⚠️ Solver error - {error}")
+        self.end_animation()
+    
+    def import_state(self):
+        """Load a state typed as 54 facelet letters; it becomes the start of
+        an empty timeline, with no scramble behind it"""
+        if self.is_animating:
+            messagebox.showinfo("Wait", "Animation in progress!")
+            return
+        if self.cube_size != 3:
+            messagebox.showinfo("Import", "Facelet import is for the 3x3 cube")
+            return
+        text = simpledialog.askstring(
+            "Import State", "54 facelets (U D L R F B), faces in order U D L R F B:",
+            initialvalue=to_facelets(self.cube_state), parent=self.root)
+        if text is None:
+            return
+        try:
+            state = parse_facelets(text)
+        except ValueError as error:
+            messagebox.showerror("Invalid State", str(error))
+            return
+        
+        self.cube_state = state
+        self.scramble_moves = []
+        self.solution_moves = []
+        self.set_timeline([], start=state)
+        self.show_timeline_position(0)
+        self.frame_offset = 0
+        self.history_text.delete(1.0, tk.END)
+        self.history_text.insert(tk.END, "═══ IMPORTED ═══\n", 'header')
+        self.history_text.insert(tk.END, to_facelets(state) + '\n\n', 'scramble')
+        self.current_move_var.set("")
+        self.status_var.set("📥 State imported - ready to solve!")
+        self.draw_cube()
+    
+    def show_solution(self, solution, timeline):
+        """Write the solution summary to the history panel"""
+        self.solution_moves = solution
+        self.timeline_moves = self.scramble_moves + solution
+        self.timeline = timeline
+        self.timeline_scale.config(to=len(self.timeline_moves))
+        self.frame_offset = len(self.scramble_moves)
+        scramble_length = move_count(self.scramble_moves, self.metric)
+        solution_length = move_count(self.solution_moves, self.metric)
+        improvement = (1 - solution_length / max(1, scramble_length)) * 100
+        
+        self.history_text.insert(tk.END, "═══ SOLUTION ═══\n", 'sol_header')
+        self.history_text.insert(tk.END, ' '.join(self.solution_moves) + '\n\n', 'solution')
+        if self.scramble_moves:
             self.history_text.insert(tk.END, 
                 f"✨ {improvement:.0f}% better!\n", 'opt')
             self.history_text.insert(tk.END, 
-                f"📊 {len(self.scramble_moves)} → {len(self.solution_moves)} moves\n\n", 'stats')
-            
-            self.history_text.tag_config('sol_header', foreground='#2ecc71', 
-                                        font=('Courier', 9, 'bold'))
-            self.history_text.tag_config('solution', foreground='#00ff88')
-            self.history_text.tag_config('opt', foreground='#FFD700', 
-                                        font=('Courier', 9, 'bold'))
-            self.history_text.tag_config('stats', foreground='#7c8db5')
-            
-            for i, move in enumerate(self.solution_moves):
-                self.current_move_var.set(f"➤ {move}")
-                self.status_var.set(f"⚡ {i+1}/{len(self.solution_moves)}")
-                self.cube_state = self.apply_move(self.cube_state, move)
-                self.draw_cube()
-                self.root.update()
-                time.sleep(self.animation_speed / 1000)
-            
-            # Verify solution
-            if self.is_cube_solved():
-                self.current_move_var.set("✓ SOLVED!")
-                self.status_var.set(f"🎉 Solved in {len(self.solution_moves)} moves!")
-                
-                self.stats['solves'] += 1
-                self.stats['total_moves'] += len(self.solution_moves)
-                self.stats_text.config(text=self.get_stats_text())
-            else:
-                self.current_move_var.set("✗ ERROR")
-                self.status_var.set("⚠️ Solution failed - cube not solved!")
-            
-            time.sleep(1.5)
-            self.current_move_var.set("")
+                f"📊 {scramble_length} → {solution_length} {self.metric} moves\n", 'stats')
+        else:
+            self.history_text.insert(tk.END, 
+                f"📊 {solution_length} {self.metric} moves\n", 'stats')
+        self.history_text.insert(tk.END, self.solve_report + '\n', 'stats')
+        
+        self.history_text.tag_config('sol_header', foreground='#2ecc71', 
+                                    font=('Courier', 9, 'bold'))
+        self.history_text.tag_config('solution', foreground='#00ff88')
+        self.history_text.tag_config('opt', foreground='#FFD700', 
+                                    font=('Courier', 9, 'bold'))
+        self.history_text.tag_config('stats', foreground='#7c8db5')
+    
+    def finish_solve(self, completed):
+        """Runs on the Tk thread once the solution has played (or was cancelled)"""
+        if PROFILER.enabled:
+            PROFILER.record('animate', self.animate_start,
+                            time.perf_counter() - self.animate_start)
+        solution_length = move_count(self.solution_moves, self.metric)
+        
+        # Verify solution
+        with PROFILER.stage('verify'):
+            solved = self.is_cube_solved()
+        if not completed:
+            self.current_move_var.set("⏹ CANCELLED")
+            self.status_var.set("⏹ Solve cancelled")
+        elif solved:
+            self.current_move_var.set("✓ SOLVED!")
+            self.status_var.set(f"🎉 Solved in {solution_length} moves!")
             
-            self.is_animating = False
-            self.enable_buttons()
+            self.stats['solves'] += 1
+            self.stats['total_moves'] += solution_length
+            self.stats_text.config(text=self.get_stats_text())
+        else:
+            self.current_move_var.set("✗ ERROR")
+            self.status_var.set("⚠️ Solution failed - cube not solved!")
+        
+        if completed and self.cube_size == 3:
+            self.results.append(self.solver.last_engine, len(self.scramble_moves),
+                                solution_length, self.solve_seconds, solved)
         
-        Thread(target=animate, daemon=True).start()
+        self.root.after(1500, lambda: self.current_move_var.set(""))
+        self.end_animation()
+    
+    def build_frames(self, moves, icon, timeline=None):
+        """One frame per move, each holding the state after that move. The
+        frames are rows of the timeline (its last len(moves) steps), not copies."""
+        timeline = self.timeline if timeline is None else timeline
+        states = timeline[len(timeline) - len(moves):]
+        return [Frame(states[i], move, i + 1, f"{icon} {i+1}/{len(moves)}")
+                for i, move in enumerate(moves)]
+    
+    def show_frame(self, frame):
+        """Scheduler render callback: runs on the Tk thread"""
+        self.cube_state = frame.state
+        self.played_steps = frame.step
+        self.show_timeline_position(self.frame_offset + frame.step)
+        self.draw_cube()
+        self.current_move_var.set(f"➤ {frame.move}")
+        self.status_var.set(frame.status)
+    
+    def end_animation(self):
+        if self.animator.paused:
+            self.animator.resume()
+            self.btn_pause.config(text="⏸ PAUSE")
+        self.is_animating = False
+        self.enable_buttons()
+    
+    def pause_animation(self):
+        if self.is_animating:
+            paused = self.animator.toggle_pause()
+            self.btn_pause.config(text="▶ RESUME" if paused else "⏸ PAUSE")
+    
+    def skip_animation(self):
+        if self.is_animating:
+            self.animator.skip()
+    
+    def cancel_animation(self):
+        if self.is_animating:
+            self.animator.cancel()
     
     def is_cube_solved(self):
         """Check if cube is in solved state"""
-        for face in self.cube_state:
-            if not all(sticker == face[0] for sticker in face):
-                return False
-        return True
+        return is_solved(self.cube_state)
     
     def generate_ai_solution(self):
-        """AI algorithm to optimize solution"""
-        inverse_moves = {
-            'U': "U'", 'D': "D'", 'L': "L'", 'R': "R'", 'F': "F'", 'B': "B'",
-            "U'": 'U', "D'": 'D', "L'": 'L', "R'": 'R', "F'": 'F', "B'": 'B'
-        }
-        
-        # Start with inverse solution (guaranteed to work)
-        solution = [inverse_moves[m] for m in reversed(self.scramble_moves)]
-        
-        # Apply SAFE AI optimizations
-        optimized = []
-        i = 0
-        
-        while i < len(solution):
-            current = solution[i]
-            
-            # Look ahead for SAFE optimizations only
-            if i + 1 < len(solution):
-                next_move = solution[i + 1]
-                
-                # Optimization 1: Cancel opposite moves (U U' -> nothing)
-                # This is SAFE and guaranteed correct
-                if inverse_moves[current] == next_move:
-                    i += 2  # Skip both moves
-                    continue
-                
-                # Optimization 2: Merge three same moves (U U U -> U')
-                # This is SAFE and mathematically correct
-                if current == next_move:
-                    if i + 2 < len(solution) and solution[i + 2] == current:
-                        optimized.append(inverse_moves[current])  # U U U = U'
-                        i += 3
-                        continue
-            
-            # Keep the move (no risky optimizations)
-            optimized.append(current)
-            i += 1
-        
-        # Verify the optimized solution works before returning it
-        test_state = [face.copy() for face in self.cube_state]
-        for move in optimized:
-            test_state = self.apply_move(test_state, move)
-        
-        # Check if optimized solution solves the cube
-        is_solved = True
-        for face in test_state:
-            if not all(sticker == face[0] for sticker in face):
-                is_solved = False
-                break
-        
-        # If optimization broke something, return original solution
-        if not is_solved or len(optimized) == 0:
-            return solution
-        
-        return optimized
+        """Solve the current state with the selected engine and metric"""
+        if self.cube_size != 3:
+            # the engines search 3x3 cubie coordinates; larger cubes replay
+            # their scramble backwards
+            self.solve_report = f"🔁 inverse scramble ({self.cube_size}x{self.cube_size})"
+            return self.model.invert_moves(self.scramble_moves)
+        self.solver.engine = self.solver_engine
+        self.solver.metric = self.metric
+        # an imported state has no known scramble to invert
+        scramble = self.scramble_moves if is_solved(self.timeline[0]) else None
+        solution = self.solver.solve(self.cube_state, scramble)
+        
+        engine = self.solver.last_engine
+        if engine == 'Cache':
+            self.solve_report = '💾 cache hit'
+        elif engine == 'Two-Phase':
+            self.solve_report = (f"⏱ two-phase: first solution "
+                                 f"{self.solver.two_phase_solver.first_solution_time:.2f}s")
+        elif engine == 'IDA*':
+            self.solve_report = f"🔍 IDA*: {self.solver.search_solver.nodes} nodes"
+        elif engine in ('BWAS', 'BWAS-Net'):
+            bwas = self.solver.bwas_solvers[engine]
+            self.solve_report = f"🧭 {engine}: {bwas.nodes} nodes in {bwas.iterations} batches"
+        elif engine == 'Bidirectional':
+            self.solve_report = (f"↔ bidirectional: optimal, "
+                                 f"{self.solver.bidirectional_solver.nodes} states expanded")
+        else:
+            self.solve_report = '🔁 inverse scramble'
+        if self.solver.fallback_from is not None:
+            self.solve_report = (f"⚠ {self.solver.fallback_from} gave up, "
+                                 f"fell back to two-phase\n{self.solve_report}")
+        return solution
     
     def reset_cube(self):
         if self.is_animating:
@@ -577,6 +878,8 @@ class RubiksCubeGUI:
         self.cube_state = self.create_solved_state()
         self.scramble_moves = []
         self.solution_moves = []
+        self.set_timeline([])
+        self.show_timeline_position(0)
         self.current_move_var.set("")
         self.status_var.set("🔄 Reset complete")
         self.draw_cube()
@@ -586,11 +889,13 @@ class RubiksCubeGUI:
         self.btn_scramble.config(state='disabled')
         self.btn_solve.config(state='disabled')
         self.btn_reset.config(state='disabled')
+        self.btn_import.config(state='disabled')
     
     def enable_buttons(self):
         self.btn_scramble.config(state='normal')
         self.btn_solve.config(state='normal')
         self.btn_reset.config(state='normal')
+        self.btn_import.config(state='normal')
 
 def main():
     root = tk.Tk()
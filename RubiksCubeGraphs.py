@@ -1,9 +1,834 @@
+import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
+from RubiksCubeTraining import load_training_metrics
+from RubiksCubeResults import ResultsStore
+from RubiksCubeTelemetry import TelemetryListener, TELEMETRY_AVAILABLE
+
+# Shown until a real training run has written its metrics file
+EXAMPLE_TRAINING_METRICS = {
+    'epoch': np.array([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+    'loss': np.array([2.45, 2.1, 1.75, 1.42, 1.15, 0.92, 0.75, 0.61, 0.52, 0.45, 0.39]),
+    'accuracy': np.array([12, 22, 35, 48, 61, 72, 81, 87, 91, 94, 96]),
+    'solve_rate': np.array([5, 18, 32, 45, 58, 69, 78, 85, 90, 93, 96]),
+    'avg_moves': np.array([48, 42, 38, 34, 30, 27, 24, 22, 20, 19, 18]),
+}
+
+# Shown until solves are logged to the results store (GUI, batch CLI, training)
+EXAMPLE_DEPTH_SUMMARY = {
+    'depth': np.array([5, 8, 10, 12, 15, 18, 20]),
+    'mean_length': np.array([8, 12, 15, 18, 23, 28, 31]),
+    'min_length': np.array([7, 10, 13, 15, 19, 23, 26]),
+}
+EXAMPLE_RADAR_VALUES = [95, 92, 88, 96, 94, 90]
+EXAMPLE_DEMO_RECORDS = {
+    'depth': np.array([10, 15, 8, 12, 20, 7, 18, 10, 14, 16]),
+    'length': np.array([15, 23, 12, 18, 31, 11, 28, 15, 21, 25]),
+    'seconds': np.array([2.3, 3.5, 1.8, 2.7, 4.6, 1.6, 4.1, 2.2, 3.2, 3.8]),
+    'solved': np.ones(10, dtype=bool),
+}
+EXAMPLE_NOTE = "Example data - solve cubes in RubiksCubeGUI.py (or RubiksCubeSolver.py --batch --log-results) to record real results"
+
+
+# ===== DASHBOARD VIEWS =====
+# Every view is a build function that creates its axes and artists on a
+# Figure (returning the artists it will later change under 'dynamic') and an
+# update function that changes those artists in place. update returns 'blit'
+# when only the dynamic artists changed, 'draw' when other parts of the
+# figure (legend, limits) changed too, and 'rebuild' when the new data does
+# not fit the existing layout.
+
+def build_training(fig, data):
+    epochs = data['epoch']
+    artists = {'note': fig.text(0.5, 0.01,
+                                "Example curves - run RubiksCubeTraining.py to record a real training run",
+                                ha='center', color='#7c8db5', fontsize=9,
+                                visible=data['example'])}
+    
+    # Subplot 1: Loss
+    ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
+    line1, = ax1.plot(epochs, data['loss'], color='#ff3b3b', linewidth=3, marker='o', 
+                      markersize=8, markerfacecolor='#ff6b6b', label='Training Loss')
+    ax1.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Loss', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_title('Training Loss Curve', color='#00d4ff', fontsize=13, 
+                 fontweight='bold', pad=15)
+    ax1.grid(True, alpha=0.2, color='#7c8db5')
+    ax1.tick_params(colors='#ffffff')
+    ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    # Subplot 2: Accuracy
+    ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
+    line2, = ax2.plot(epochs, data['accuracy'], color='#2ecc71', linewidth=3, marker='s',
+                      markersize=8, markerfacecolor='#4dff91', label='Accuracy')
+    ax2.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Accuracy (%)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_title('Model Accuracy', color='#00d4ff', fontsize=13, 
+                 fontweight='bold', pad=15)
+    ax2.grid(True, alpha=0.2, color='#7c8db5')
+    ax2.tick_params(colors='#ffffff')
+    ax2.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    # Subplot 3: Solve Rate
+    ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
+    line3, = ax3.plot(epochs, data['solve_rate'], color='#9b59b6', linewidth=3, marker='^',
+                      markersize=8, markerfacecolor='#bb79d6', label='Solve Rate')
+    ax3.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Solve Rate (%)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_title('Cube Solve Success Rate', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax3.grid(True, alpha=0.2, color='#7c8db5')
+    ax3.tick_params(colors='#ffffff')
+    ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    # Subplot 4: Average Moves
+    ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
+    line4, = ax4.plot(epochs, data['avg_moves'], color='#FFD700', linewidth=3, marker='D',
+                      markersize=8, markerfacecolor='#FFE44D', label='Avg Moves')
+    ax4.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax4.set_ylabel('Average Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax4.set_title('Solution Efficiency', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax4.grid(True, alpha=0.2, color='#7c8db5')
+    ax4.tick_params(colors='#ffffff')
+    ax4.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    artists['lines'] = [line1, line2, line3, line4]
+    artists['dynamic'] = artists['lines']
+    return artists
+
+
+def update_training(artists, data):
+    keys = ('loss', 'accuracy', 'solve_rate', 'avg_moves')
+    for line, key in zip(artists['lines'], keys):
+        line.set_data(data['epoch'], data[key])
+        line.axes.relim()
+        line.axes.autoscale_view()
+    note_changed = artists['note'].get_visible() != data['example']
+    artists['note'].set_visible(data['example'])
+    return 'draw' if note_changed else 'blit'
+
+
+def results_series(data):
+    depths = np.asarray(data['depth'])
+    ai_solution = np.asarray(data['mean_length'], dtype=float)
+    optimal = np.asarray(data['min_length'])          # shortest solution logged at each depth
+    improvement = (1 - ai_solution / depths) * 100
+    efficiency = (optimal / np.maximum(ai_solution, 1)) * 100
+    return depths, ai_solution, optimal, improvement, efficiency
+
+
+def build_results(fig, data):
+    scramble_depths, ai_solution, optimal, improvement, efficiency = results_series(data)
+    artists = {'depth': scramble_depths,
+               'note': fig.text(0.5, 0.01, EXAMPLE_NOTE, ha='center', color='#7c8db5',
+                                fontsize=9, visible=data['example'])}
+    
+    # Subplot 1: Comparison Bar Chart
+    ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
+    x = np.arange(len(scramble_depths))
+    width = 0.25
+    
+    bars1 = ax1.bar(x - width, scramble_depths, width, label='Scramble',
+                   color='#ff3b3b', edgecolor='#ff6b6b', linewidth=2)
+    bars2 = ax1.bar(x, ai_solution, width, label='AI Solution',
+                   color='#2ecc71', edgecolor='#4dff91', linewidth=2)
+    bars3 = ax1.bar(x + width, optimal, width, label='Best Found',
+                   color='#FFD700', edgecolor='#FFE44D', linewidth=2)
+    
+    ax1.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Number of Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_title('AI vs Scramble Length', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(scramble_depths)
+    ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    ax1.grid(True, alpha=0.2, color='#7c8db5', axis='y')
+    ax1.tick_params(colors='#ffffff')
+    
+    # Subplot 2: Improvement Percentage
+    ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
+    line2, = ax2.plot(scramble_depths, improvement, color='#9b59b6', linewidth=3,
+                      marker='o', markersize=10, markerfacecolor='#bb79d6')
+    fill2 = ax2.fill_between(scramble_depths, improvement, alpha=0.3, color='#9b59b6')
+    ax2.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Improvement (%)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_title('AI Improvement Over Scramble', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax2.grid(True, alpha=0.2, color='#7c8db5')
+    ax2.tick_params(colors='#ffffff')
+    
+    # Subplot 3: Efficiency Ratio
+    ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
+    colors_gradient = plt.cm.viridis(efficiency / 100)
+    bars = ax3.bar(scramble_depths, efficiency, color=colors_gradient,
+                  edgecolor='#00d4ff', linewidth=2)
+    ax3.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Efficiency (%)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_title('AI Solution Optimality', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax3.grid(True, alpha=0.2, color='#7c8db5', axis='y')
+    ax3.tick_params(colors='#ffffff')
+    ax3.axhline(y=100, color='#FFD700', linestyle='--', linewidth=2, label='Best Found')
+    ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    # Subplot 4: Scatter Plot
+    ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
+    scatter_ai = ax4.scatter(scramble_depths, ai_solution, s=200, c='#2ecc71',
+                             alpha=0.6, edgecolors='#4dff91', linewidth=2, label='AI Solution')
+    scatter_best = ax4.scatter(scramble_depths, optimal, s=200, c='#FFD700',
+                               alpha=0.6, edgecolors='#FFE44D', linewidth=2, label='Best Found')
+    line_ai, = ax4.plot(scramble_depths, ai_solution, color='#2ecc71', linewidth=2, alpha=0.5)
+    line_best, = ax4.plot(scramble_depths, optimal, color='#FFD700', linewidth=2, alpha=0.5)
+    ax4.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax4.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax4.set_title('AI vs Best Found Solution', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax4.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    ax4.grid(True, alpha=0.2, color='#7c8db5')
+    ax4.tick_params(colors='#ffffff')
+    
+    artists.update(ai_bars=bars2, best_bars=bars3, improvement=line2, fill=fill2,
+                   efficiency=bars, scatter_ai=scatter_ai, scatter_best=scatter_best,
+                   line_ai=line_ai, line_best=line_best)
+    artists['dynamic'] = [*bars2, *bars3, line2, fill2, *bars, scatter_ai, scatter_best,
+                          line_ai, line_best]
+    return artists
+
+
+def update_results(artists, data):
+    scramble_depths, ai_solution, optimal, improvement, efficiency = results_series(data)
+    if not np.array_equal(scramble_depths, artists['depth']):
+        return 'rebuild'                 # bar positions and tick labels follow the depths
+    
+    for bar, height in zip(artists['ai_bars'], ai_solution):
+        bar.set_height(height)
+    for bar, height in zip(artists['best_bars'], optimal):
+        bar.set_height(height)
+    artists['improvement'].set_ydata(improvement)
+    
+    # fill_between has no set_data: swap the polygon for a new one
+    ax2 = artists['fill'].axes
+    animated = artists['fill'].get_animated()
+    artists['fill'].remove()
+    artists['fill'] = ax2.fill_between(scramble_depths, improvement, alpha=0.3, color='#9b59b6',
+                                       animated=animated)
+    
+    for bar, height, color in zip(artists['efficiency'], efficiency,
+                                  plt.cm.viridis(efficiency / 100)):
+        bar.set_height(height)
+        bar.set_facecolor(color)
+    artists['scatter_ai'].set_offsets(np.column_stack([scramble_depths, ai_solution]))
+    artists['scatter_best'].set_offsets(np.column_stack([scramble_depths, optimal]))
+    artists['line_ai'].set_ydata(ai_solution)
+    artists['line_best'].set_ydata(optimal)
+    
+    for ax in {artists['ai_bars'][0].axes, ax2, artists['efficiency'][0].axes,
+               artists['line_ai'].axes}:
+        ax.relim()
+        ax.autoscale_view()
+    artists['dynamic'] = [*artists['ai_bars'], *artists['best_bars'], artists['improvement'],
+                          artists['fill'], *artists['efficiency'], artists['scatter_ai'],
+                          artists['scatter_best'], artists['line_ai'], artists['line_best']]
+    note_changed = artists['note'].get_visible() != data['example']
+    artists['note'].set_visible(data['example'])
+    return 'draw' if note_changed else 'blit'
+
+
+RADAR_CATEGORIES = ['Speed', 'Efficiency', 'Optimality', 'Consistency', 'Reliability', 'Learning']
+
+
+def build_radar(fig, data):
+    # Performance metrics
+    categories = RADAR_CATEGORIES
+    values = list(data['values'])
+    artists = {'note': fig.text(0.5, 0.01, EXAMPLE_NOTE, ha='center', color='#7c8db5',
+                                fontsize=9, visible=data['example'])}
+    
+    # Subplot 1: Radar Chart
+    ax1 = fig.add_subplot(1, 2, 1, projection='polar', facecolor='#0f1429')
+    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
+    values_plot = values + [values[0]]
+    angles += angles[:1]
+    
+    line, = ax1.plot(angles, values_plot, 'o-', linewidth=3, color='#2ecc71',
+                     markersize=10, markerfacecolor='#4dff91')
+    fill, = ax1.fill(angles, values_plot, alpha=0.25, color='#2ecc71')
+    ax1.set_xticks(angles[:-1])
+    ax1.set_xticklabels(categories, color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_ylim(0, 100)
+    ax1.set_yticks([20, 40, 60, 80, 100])
+    ax1.set_yticklabels(['20', '40', '60', '80', '100'], color='#ffffff', fontsize=9)
+    ax1.set_title('AI Performance Metrics', color='#00d4ff', fontsize=14,
+                 fontweight='bold', pad=20)
+    ax1.grid(True, color='#7c8db5', alpha=0.3)
+    
+    # Subplot 2: Horizontal Bar Chart
+    ax2 = fig.add_subplot(1, 2, 2, facecolor='#0f1429')
+    colors = ['#ff3b3b', '#2ecc71', '#FFD700', '#9b59b6', '#3498db', '#ff8c00']
+    y_pos = np.arange(len(categories))
+    
+    bars = ax2.barh(y_pos, values, color=colors, edgecolor='white',
+                   linewidth=2, height=0.6)
+    
+    # Add value labels
+    labels = []
+    for i, (bar, value) in enumerate(zip(bars, values)):
+        labels.append(ax2.text(value + 1, i, f'{value}%', va='center',
+                               color='#ffffff', fontweight='bold', fontsize=11))
+    
+    ax2.set_yticks(y_pos)
+    ax2.set_yticklabels(categories, color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_xlabel('Performance Score (%)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_title('Performance Breakdown', color='#00d4ff', fontsize=14,
+                 fontweight='bold', pad=20)
+    ax2.set_xlim(0, 105)
+    ax2.grid(True, alpha=0.2, color='#7c8db5', axis='x')
+    ax2.tick_params(colors='#ffffff')
+    ax2.invert_yaxis()
+    
+    artists.update(line=line, fill=fill, bars=bars, labels=labels)
+    artists['dynamic'] = [line, fill, *bars, *labels]
+    return artists
+
+
+def update_radar(artists, data):
+    values = list(data['values'])
+    angles = np.linspace(0, 2 * np.pi, len(values), endpoint=False).tolist()
+    values_plot = values + [values[0]]
+    angles += angles[:1]
+    artists['line'].set_data(angles, values_plot)
+    artists['fill'].set_xy(np.column_stack([angles, values_plot]))
+    for bar, label, value in zip(artists['bars'], artists['labels'], values):
+        bar.set_width(value)
+        label.set_x(value + 1)
+        label.set_text(f'{value}%')
+    note_changed = artists['note'].get_visible() != data['example']
+    artists['note'].set_visible(data['example'])
+    return 'draw' if note_changed else 'blit'
+
+
+def demo_series(data):
+    scramble = np.asarray(data['depth']).astype(int)
+    solution = np.asarray(data['length']).astype(int)
+    time_taken = np.asarray(data['seconds']).astype(float)
+    success_rate = np.asarray(data['solved']).mean() * 100
+    return np.arange(1, len(scramble) + 1), scramble, solution, time_taken, success_rate
+
+
+def demo_statistics(trials, scramble, solution, time_taken, success_rate):
+    return [
+        ("Total Trials:", f"{len(trials)}"),
+        ("", ""),
+        ("Avg Scramble Depth:", f"{scramble.mean():.1f}"),
+        ("Avg Solution Moves:", f"{solution.mean():.1f}"),
+        ("Avg Solution Time:", f"{time_taken.mean():.2f}s"),
+        ("", ""),
+        ("Min Solution Moves:", f"{solution.min()}"),
+        ("Max Solution Moves:", f"{solution.max()}"),
+        ("", ""),
+        ("Fastest Solve:", f"{time_taken.min():.2f}s"),
+        ("Slowest Solve:", f"{time_taken.max():.2f}s"),
+        ("", ""),
+        ("Success Rate:", f"{success_rate:.1f}%"),
+    ]
+
+
+def trend_line(scramble, solution):
+    z = np.polyfit(scramble, solution, 1) if len(set(scramble)) > 1 else [0, solution.mean()]
+    return np.poly1d(z)
+
+
+def build_demo(fig, data):
+    # Demo data: the last ten logged solves
+    trials, scramble, solution, time_taken, success_rate = demo_series(data)
+    artists = {'trials': len(trials),
+               'note': fig.text(0.5, 0.01, EXAMPLE_NOTE, ha='center', color='#7c8db5',
+                                fontsize=9, visible=data['example'])}
+    
+    # Subplot 1: Moves Comparison
+    ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
+    width = 0.35
+    x = trials
+    
+    bars1 = ax1.bar(x - width/2, scramble, width, label='Scramble Moves',
+                   color='#9b59b6', edgecolor='#bb79d6', linewidth=2)
+    bars2 = ax1.bar(x + width/2, solution, width, label='Solution Moves',
+                   color='#2ecc71', edgecolor='#4dff91', linewidth=2)
+    
+    ax1.set_xlabel('Trial Number', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Number of Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_title('Demo Trial Results', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax1.set_xticks(trials)
+    ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    ax1.grid(True, alpha=0.2, color='#7c8db5', axis='y')
+    ax1.tick_params(colors='#ffffff')
+    
+    # Subplot 2: Solution Time
+    ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
+    colors_time = plt.cm.plasma(time_taken / max(time_taken.max(), 1e-9))
+    bars = ax2.bar(trials, time_taken, color=colors_time,
+                  edgecolor='#00d4ff', linewidth=2)
+    ax2.set_xlabel('Trial Number', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Time (seconds)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_title('Solution Time per Trial', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax2.set_xticks(trials)
+    ax2.grid(True, alpha=0.2, color='#7c8db5', axis='y')
+    ax2.tick_params(colors='#ffffff')
+    
+    # Add average line
+    avg_time = time_taken.mean()
+    avg_line = ax2.axhline(y=avg_time, color='#FFD700', linestyle='--',
+                           linewidth=2, label=f'Average: {avg_time:.2f}s')
+    ax2.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    
+    # Subplot 3: Efficiency Scatter
+    ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
+    scatter = ax3.scatter(scramble, solution, s=time_taken / max(time_taken.max(), 1e-9) * 460,
+                          c=trials, cmap='viridis', alpha=0.6, edgecolors='#00d4ff', linewidth=2)
+    
+    # Trend line
+    p = trend_line(scramble, solution)
+    trend, = ax3.plot(scramble, p(scramble), "--", linewidth=2,
+                      color='#ff3b3b', label='Trend')
+    
+    ax3.set_xlabel('Scramble Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_title('Scramble vs Solution Correlation', color='#00d4ff',
+                 fontsize=13, fontweight='bold', pad=15)
+    ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
+    ax3.grid(True, alpha=0.2, color='#7c8db5')
+    ax3.tick_params(colors='#ffffff')
+    
+    # Subplot 4: Summary Stats
+    ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
+    ax4.axis('off')
+    ax4.set_xlim(0, 10)
+    ax4.set_ylim(0, 14)
+    
+    # Title
+    ax4.text(5, 13, "DEMO STATISTICS", 
+            ha='center', va='top', fontsize=13, fontweight='bold',
+            color='#00d4ff', fontfamily='monospace')
+    
+    # Draw border
+    from matplotlib.patches import Rectangle
+    rect = Rectangle((0.5, 0.5), 9, 11.5, linewidth=3, 
+                     edgecolor='#00ff88', facecolor='none')
+    ax4.add_patch(rect)
+    
+    # Create stats as separate text elements with larger spacing
+    stats_data = demo_statistics(trials, scramble, solution, time_taken, success_rate)
+    
+    # Add stats with proper spacing
+    y_position = 11
+    line_height = 0.8
+    
+    value_texts = []
+    for label, value in stats_data:
+        if label == "":
+            y_position -= line_height * 0.5
+            continue
+        
+        # Label on left
+        ax4.text(1.2, y_position, label, 
+                ha='left', va='center', fontsize=10,
+                color='#00ff88', fontfamily='monospace', fontweight='bold')
+        
+        # Value on right
+        value_texts.append(ax4.text(8.8, y_position, value, 
+                                    ha='right', va='center', fontsize=10,
+                                    color='#ffffff', fontfamily='monospace', fontweight='bold'))
+        
+        y_position -= line_height
+    
+    artists.update(scramble_bars=bars1, solution_bars=bars2, time_bars=bars, avg_line=avg_line,
+                   scatter=scatter, trend=trend, values=value_texts)
+    artists['dynamic'] = [*bars1, *bars2, *bars, avg_line, scatter, trend, *value_texts]
+    return artists
+
+
+def update_demo(artists, data):
+    trials, scramble, solution, time_taken, success_rate = demo_series(data)
+    if len(trials) != artists['trials']:
+        return 'rebuild'
+    
+    for bar, height in zip(artists['scramble_bars'], scramble):
+        bar.set_height(height)
+    for bar, height in zip(artists['solution_bars'], solution):
+        bar.set_height(height)
+    for bar, height, color in zip(artists['time_bars'], time_taken,
+                                  plt.cm.plasma(time_taken / max(time_taken.max(), 1e-9))):
+        bar.set_height(height)
+        bar.set_facecolor(color)
+    
+    # the average also appears in the legend, so this needs a full draw
+    avg_time = time_taken.mean()
+    artists['avg_line'].set_ydata([avg_time, avg_time])
+    artists['avg_line'].set_label(f'Average: {avg_time:.2f}s')
+    artists['avg_line'].axes.legend(facecolor='#2d3548', edgecolor='#00d4ff',
+                                    labelcolor='#ffffff')
+    
+    artists['scatter'].set_offsets(np.column_stack([scramble, solution]))
+    artists['scatter'].set_sizes(time_taken / max(time_taken.max(), 1e-9) * 460)
+    artists['trend'].set_data(scramble, trend_line(scramble, solution)(scramble))
+    
+    stats = [value for label, value in demo_statistics(trials, scramble, solution,
+                                                        time_taken, success_rate) if label]
+    for text, value in zip(artists['values'], stats):
+        text.set_text(value)
+    
+    for ax in {artists['scramble_bars'][0].axes, artists['time_bars'][0].axes,
+               artists['scatter'].axes}:
+        ax.relim()
+        ax.autoscale_view()
+    artists['note'].set_visible(data['example'])
+    return 'draw'
+
+
+LIVE_WINDOW = 200                    # most recent events plotted
+LIVE_FPS = 10                        # redraw cap of the live view
+
+
+def live_data(listener):
+    """The live view's data: the latest telemetry events and stream counters"""
+    events = listener.recent(LIVE_WINDOW)
+    return {'seconds': events['seconds'], 'moves': events['moves'], 'depth': events['depth'],
+            'solved': events['solved'], 'received': listener.received,
+            'dropped': listener.dropped, 'rate': listener.rate()}
+
+
+def live_statistics(data):
+    seconds = data['seconds'] * 1000
+    p50, p90 = np.percentile(seconds, [50, 90]) if len(seconds) else (0.0, 0.0)
+    solve_rate = data['solved'].mean() * 100 if len(seconds) else 0.0
+    return [
+        ("Events Received:", f"{data['received']}"),
+        ("Events Dropped:", f"{data['dropped']}"),
+        ("Events / second:", f"{data['rate']:.1f}"),
+        ("", ""),
+        ("Latency p50:", f"{p50:.1f}ms"),
+        ("Latency p90:", f"{p90:.1f}ms"),
+        ("Avg Solution Moves:", f"{data['moves'].mean() if len(seconds) else 0:.1f}"),
+        ("Success Rate:", f"{solve_rate:.1f}%"),
+    ]
+
+
+def grow_ylim(ax, values, floor=1.0):
+    """Raise the y limit (with headroom) only when values outgrow it, so most
+    updates keep the axes unchanged and can be blitted"""
+    top = max(float(np.max(values, initial=0)), floor)
+    if top > ax.get_ylim()[1]:
+        ax.set_ylim(0, top * 1.25)
+
+
+def build_live(fig, data):
+    ago = np.arange(-len(data['seconds']) + 1, 1)
+    
+    # Subplot 1: Latency
+    ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
+    latency, = ax1.plot(ago, data['seconds'] * 1000, color='#ff3b3b', linewidth=2)
+    ax1.set_xlim(-LIVE_WINDOW, 0)
+    ax1.set_ylim(0, 1)
+    grow_ylim(ax1, data['seconds'] * 1000)
+    ax1.set_xlabel('Solves Ago', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Latency (ms)', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax1.set_title('Live Solve Latency', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax1.grid(True, alpha=0.2, color='#7c8db5')
+    ax1.tick_params(colors='#ffffff')
+    
+    # Subplot 2: Solution Moves
+    ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
+    moves, = ax2.plot(ago, data['moves'], color='#2ecc71', linewidth=2)
+    ax2.set_xlim(-LIVE_WINDOW, 0)
+    ax2.set_ylim(0, 25)
+    grow_ylim(ax2, data['moves'])
+    ax2.set_xlabel('Solves Ago', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax2.set_title('Live Solution Length', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax2.grid(True, alpha=0.2, color='#7c8db5')
+    ax2.tick_params(colors='#ffffff')
+    
+    # Subplot 3: Depth vs Moves
+    ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
+    scatter = ax3.scatter(data['depth'], data['moves'], s=60, c='#9b59b6',
+                          alpha=0.6, edgecolors='#bb79d6', linewidth=1)
+    ax3.set_xlim(0, 21)
+    ax3.set_ylim(0, 25)
+    grow_ylim(ax3, data['moves'])
+    ax3.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
+    ax3.set_title('Scramble vs Solution (live)', color='#00d4ff', fontsize=13,
+                 fontweight='bold', pad=15)
+    ax3.grid(True, alpha=0.2, color='#7c8db5')
+    ax3.tick_params(colors='#ffffff')
+    
+    # Subplot 4: Stream Stats
+    ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
+    ax4.axis('off')
+    ax4.set_xlim(0, 10)
+    ax4.set_ylim(0, 14)
+    ax4.text(5, 13, "LIVE TELEMETRY", 
+            ha='center', va='top', fontsize=13, fontweight='bold',
+            color='#00d4ff', fontfamily='monospace')
+    from matplotlib.patches import Rectangle
+    ax4.add_patch(Rectangle((0.5, 0.5), 9, 11.5, linewidth=3, 
+                            edgecolor='#00ff88', facecolor='none'))
+    
+    y_position = 11
+    line_height = 1.1
+    value_texts = []
+    for label, value in live_statistics(data):
+        if label == "":
+            y_position -= line_height * 0.5
+            continue
+        ax4.text(1.2, y_position, label, 
+                ha='left', va='center', fontsize=10,
+                color='#00ff88', fontfamily='monospace', fontweight='bold')
+        value_texts.append(ax4.text(8.8, y_position, value, 
+                                    ha='right', va='center', fontsize=10,
+                                    color='#ffffff', fontfamily='monospace', fontweight='bold'))
+        y_position -= line_height
+    
+    artists = {'latency': latency, 'moves': moves, 'scatter': scatter, 'values': value_texts}
+    artists['dynamic'] = [latency, moves, scatter, *value_texts]
+    return artists
+
+
+def update_live(artists, data):
+    ago = np.arange(-len(data['seconds']) + 1, 1)
+    artists['latency'].set_data(ago, data['seconds'] * 1000)
+    grow_ylim(artists['latency'].axes, data['seconds'] * 1000)
+    artists['moves'].set_data(ago, data['moves'])
+    grow_ylim(artists['moves'].axes, data['moves'])
+    artists['scatter'].set_offsets(np.column_stack([data['depth'], data['moves']]))
+    grow_ylim(artists['scatter'].axes, data['moves'])
+    stats = [value for label, value in live_statistics(data) if label]
+    for text, value in zip(artists['values'], stats):
+        text.set_text(value)
+    return 'blit'
+
+
+def performance_scores(results):
+    """Radar scores (0-100) computed from the results store, or None when empty.
+    Speed: solves under 1 s. Efficiency: moves saved against the scramble.
+    Optimality: best-found / mean length. Consistency: 1 - coefficient of
+    variation of lengths. Reliability: solve rate. Learning: solve rate at
+    the last training evaluation."""
+    results.refresh()
+    overall = results.overall_summary()
+    if overall['count'] == 0:
+        return None
+    by_depth = results.depth_summary()
+    known = by_depth['depth'] > 0
+    weights = by_depth['count'][known]
+    mean_length = by_depth['mean_length'][known]
+    efficiency = optimality = 0.0
+    if weights.sum():
+        efficiency = np.average(1 - mean_length / by_depth['depth'][known], weights=weights)
+        optimality = np.average(by_depth['min_length'][known] / np.maximum(mean_length, 1),
+                                weights=weights)
+    consistency = 1 - overall['std_length'] / max(overall['mean_length'], 1)
+    epochs = results.epoch_summary()
+    learning = epochs['solve_rate'][-1] if len(epochs['epoch']) else 0.0
+    scores = [overall['fast_rate'], efficiency, optimality, consistency,
+              overall['solve_rate'], learning]
+    return [int(round(np.clip(score, 0, 1) * 100)) for score in scores]
+
+
+def load_view_data(name, results):
+    """Everything a view plots, loaded fresh from disk"""
+    if name == 'training':
+        metrics = load_training_metrics()
+        return dict(metrics or EXAMPLE_TRAINING_METRICS, example=metrics is None)
+    results.refresh()
+    if name == 'results':
+        summary = results.depth_summary()
+        known = summary['depth'] > 0
+        if not known.any():
+            return dict(EXAMPLE_DEPTH_SUMMARY, example=True)
+        return {'depth': summary['depth'][known], 'mean_length': summary['mean_length'][known],
+                'min_length': summary['min_length'][known], 'example': False}
+    if name == 'radar':
+        values = performance_scores(results)
+        return {'values': values or EXAMPLE_RADAR_VALUES, 'example': values is None}
+    records = results.recent(10)
+    if len(records) == 0:
+        return dict(EXAMPLE_DEMO_RECORDS, example=True)
+    data = {key: records[key] for key in ('depth', 'length', 'seconds', 'solved')}
+    data['example'] = False
+    return data
+
+
+VIEW_FUNCTIONS = {
+    'training': (build_training, update_training),
+    'results': (build_results, update_results),
+    'radar': (build_radar, update_radar),
+    'demo': (build_demo, update_demo),
+    'live': (build_live, update_live),
+}
+
+
+def data_fingerprint(data):
+    """Hashable summary of a view's input data, to tell whether it changed"""
+    return tuple((key, np.asarray(value).tobytes()) for key, value in sorted(data.items()))
+
+
+class DashboardView:
+    """One dashboard figure, built once and then updated in place.
+
+    On a Tk canvas the data artists are animated: a full draw renders the
+    static parts into a cached background, and an update that keeps every
+    axis limit only restores that background and blits the changed artists.
+    """
+    
+    def __init__(self, fig, build, update, data, interactive=False):
+        self.fig = fig
+        self.build = build
+        self.update_artists = update
+        self.interactive = interactive
+        self.canvas = None
+        self.widget = None
+        self.background = None
+        self.fingerprint = data_fingerprint(data)
+        self.artists = build(fig, data)
+        fig.tight_layout(pad=3.0)
+        self.set_animated()
+    
+    def set_animated(self):
+        for artist in self.artists['dynamic']:
+            artist.set_animated(self.interactive)
+    
+    def attach(self, canvas):
+        self.canvas = canvas
+        self.widget = canvas.get_tk_widget()
+        canvas.mpl_connect('draw_event', self.on_draw)
+        canvas.draw()
+    
+    def on_draw(self, event):
+        """After every full draw: cache the static background, add the data artists"""
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_dynamic()
+    
+    def draw_dynamic(self):
+        if self.interactive:
+            for artist in self.artists['dynamic']:
+                self.fig.draw_artist(artist)
+    
+    def limits(self):
+        return [ax.viewLim.bounds for ax in self.fig.axes]
+    
+    def update(self, data):
+        self.fingerprint = data_fingerprint(data)
+        before = self.limits()
+        mode = self.update_artists(self.artists, data)
+        if mode == 'rebuild':
+            self.fig.clear()
+            self.artists = self.build(self.fig, data)
+            self.fig.tight_layout(pad=3.0)
+            self.set_animated()
+        elif mode == 'blit' and self.limits() != before:
+            mode = 'draw'
+        
+        if self.canvas is None:
+            return
+        if mode == 'blit' and self.background is not None:
+            self.canvas.restore_region(self.background)
+            self.draw_dynamic()
+            self.canvas.blit(self.fig.bbox)
+        else:
+            self.canvas.draw()
+
+
+def build_view(name, data, interactive=False):
+    build, update = VIEW_FUNCTIONS[name]
+    fig = Figure(figsize=(14, 8), facecolor='#1a1f3a')
+    return DashboardView(fig, build, update, data, interactive)
+
+
+# ===== HEADLESS EXPORT =====
+# Renders the dashboard views to files with the Agg canvas, one worker
+# process per view, without ever creating a Tk root. A manifest in the
+# output directory records the data digest each file was rendered from, so
+# views whose data has not changed are skipped.
+
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runs', 'figures')
+EXPORT_FORMATS = ('png', 'svg', 'pdf')
+VIEW_NAMES = ('training', 'results', 'radar', 'demo')
+MANIFEST = 'manifest.json'
+
+
+def data_digest(data):
+    digest = hashlib.sha256()
+    for key, value in data_fingerprint(data):
+        digest.update(key.encode())
+        digest.update(value)
+    return digest.hexdigest()
+
+
+def export_view(name, data, out_dir, formats=('png',), dpi=100):
+    """Render one view to out_dir/<name>.<format> for every format; returns the paths"""
+    view = build_view(name, data)
+    FigureCanvasAgg(view.fig)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f'{name}.{fmt}')
+        view.fig.savefig(path, format=fmt, dpi=dpi, facecolor=view.fig.get_facecolor())
+        paths.append(path)
+    return paths
+
+
+def export_views(out_dir=EXPORT_DIR, views=VIEW_NAMES, formats=('png',), workers=None,
+                 dpi=100, force=False, results=None):
+    """Export views in parallel; returns {view: 'written' | 'unchanged'}"""
+    results = results if results is not None else ResultsStore()
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    status, jobs = {}, {}
+    for name in views:
+        data = load_view_data(name, results)
+        entry = {'digest': data_digest(data), 'dpi': dpi}
+        outputs = [os.path.join(out_dir, f'{name}.{fmt}') for fmt in formats]
+        if not force and all(manifest.get(name, {}).get(fmt) == entry for fmt in formats) \
+                and all(os.path.exists(path) for path in outputs):
+            status[name] = 'unchanged'
+        else:
+            jobs[name] = (data, entry)
+
+    if jobs:
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(workers) as pool:
+            futures = {name: pool.submit(export_view, name, data, out_dir, formats, dpi)
+                       for name, (data, entry) in jobs.items()}
+            for name, future in futures.items():
+                future.result()
+                manifest.setdefault(name, {}).update({fmt: jobs[name][1] for fmt in formats})
+                status[name] = 'written'
+
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return status
+
 
 class RubiksCubeGraphs:
     def __init__(self, root):
@@ -12,6 +837,18 @@ class RubiksCubeGraphs:
         self.root.geometry("1400x900")
         self.root.configure(bg='#0a0e27')
         
+        # Solve records and their per-depth / per-epoch aggregates
+        self.results = ResultsStore()
+        
+        # Figures are built once per view and kept; switching views only
+        # swaps which canvas is packed
+        self.views = {}
+        self.current_view = None
+        
+        # Live mode: telemetry socket, bound on first use
+        self.listener = None
+        self.live_after_id = None
+        
         # Create main container
         self.create_widgets()
         
@@ -42,7 +879,8 @@ class RubiksCubeGraphs:
             ("📈 Training Curves", self.show_training_curves),
             ("📊 Results Analysis", self.show_results_analysis),
             ("🎯 Performance Radar", self.show_comprehensive_analysis),
-            ("⚡ Demo Results", self.show_demo_results)
+            ("⚡ Demo Results", self.show_demo_results),
+            ("📡 Live", self.show_live)
         ]
         
         for text, command in buttons:
@@ -76,352 +914,86 @@ class RubiksCubeGraphs:
         button.bind('<Enter>', on_enter)
         button.bind('<Leave>', on_leave)
     
-    def clear_content(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    # ===== CACHED VIEWS =====
+    
+    def show_view(self, name, data=None):
+        """Show a view's cached canvas, building the figure on first use and
+        updating its artists in place when the data has changed"""
+        if data is None:
+            data = load_view_data(name, self.results)
+        view = self.views.get(name)
+        if view is None:
+            view = build_view(name, data, interactive=True)
+            view.attach(FigureCanvasTkAgg(view.fig, master=self.content_frame))
+            self.views[name] = view
+        
+        if self.current_view is not view:
+            if self.current_view is not None:
+                self.current_view.widget.pack_forget()
+            view.widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self.current_view = view
+        if view.fingerprint != data_fingerprint(data):
+            view.update(data)
     
     def show_training_curves(self):
-        self.clear_content()
-        
-        # Create figure with subplots
-        fig = Figure(figsize=(14, 8), facecolor='#1a1f3a')
-        
-        # Training data
-        epochs = np.array([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100])
-        loss = np.array([2.45, 2.1, 1.75, 1.42, 1.15, 0.92, 0.75, 0.61, 0.52, 0.45, 0.39])
-        accuracy = np.array([12, 22, 35, 48, 61, 72, 81, 87, 91, 94, 96])
-        solve_rate = np.array([5, 18, 32, 45, 58, 69, 78, 85, 90, 93, 96])
-        avg_moves = np.array([48, 42, 38, 34, 30, 27, 24, 22, 20, 19, 18])
-        
-        # Subplot 1: Loss
-        ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
-        ax1.plot(epochs, loss, color='#ff3b3b', linewidth=3, marker='o', 
-                markersize=8, markerfacecolor='#ff6b6b', label='Training Loss')
-        ax1.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_ylabel('Loss', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_title('Training Loss Curve', color='#00d4ff', fontsize=13, 
-                     fontweight='bold', pad=15)
-        ax1.grid(True, alpha=0.2, color='#7c8db5')
-        ax1.tick_params(colors='#ffffff')
-        ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        # Subplot 2: Accuracy
-        ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
-        ax2.plot(epochs, accuracy, color='#2ecc71', linewidth=3, marker='s',
-                markersize=8, markerfacecolor='#4dff91', label='Accuracy')
-        ax2.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_ylabel('Accuracy (%)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_title('Model Accuracy', color='#00d4ff', fontsize=13, 
-                     fontweight='bold', pad=15)
-        ax2.grid(True, alpha=0.2, color='#7c8db5')
-        ax2.tick_params(colors='#ffffff')
-        ax2.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        # Subplot 3: Solve Rate
-        ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
-        ax3.plot(epochs, solve_rate, color='#9b59b6', linewidth=3, marker='^',
-                markersize=8, markerfacecolor='#bb79d6', label='Solve Rate')
-        ax3.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_ylabel('Solve Rate (%)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_title('Cube Solve Success Rate', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax3.grid(True, alpha=0.2, color='#7c8db5')
-        ax3.tick_params(colors='#ffffff')
-        ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        # Subplot 4: Average Moves
-        ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
-        ax4.plot(epochs, avg_moves, color='#FFD700', linewidth=3, marker='D',
-                markersize=8, markerfacecolor='#FFE44D', label='Avg Moves')
-        ax4.set_xlabel('Epoch', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax4.set_ylabel('Average Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax4.set_title('Solution Efficiency', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax4.grid(True, alpha=0.2, color='#7c8db5')
-        ax4.tick_params(colors='#ffffff')
-        ax4.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        fig.tight_layout(pad=3.0)
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=self.content_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.show_view('training')
     
     def show_results_analysis(self):
-        self.clear_content()
-        
-        fig = Figure(figsize=(14, 8), facecolor='#1a1f3a')
-        
-        # Results data
-        scramble_depths = np.array([5, 8, 10, 12, 15, 18, 20])
-        human_avg = np.array([22, 35, 45, 56, 72, 88, 98])
-        ai_solution = np.array([8, 12, 15, 18, 23, 28, 31])
-        optimal = np.array([7, 10, 13, 15, 19, 23, 26])
-        improvement = np.array([64, 66, 67, 68, 68, 68, 68])
-        
-        # Subplot 1: Comparison Bar Chart
-        ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
-        x = np.arange(len(scramble_depths))
-        width = 0.25
-        
-        bars1 = ax1.bar(x - width, human_avg, width, label='Human Avg',
-                       color='#ff3b3b', edgecolor='#ff6b6b', linewidth=2)
-        bars2 = ax1.bar(x, ai_solution, width, label='AI Solution',
-                       color='#2ecc71', edgecolor='#4dff91', linewidth=2)
-        bars3 = ax1.bar(x + width, optimal, width, label='Optimal',
-                       color='#FFD700', edgecolor='#FFE44D', linewidth=2)
-        
-        ax1.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_ylabel('Number of Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_title('AI vs Human Performance', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(scramble_depths)
-        ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        ax1.grid(True, alpha=0.2, color='#7c8db5', axis='y')
-        ax1.tick_params(colors='#ffffff')
-        
-        # Subplot 2: Improvement Percentage
-        ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
-        ax2.plot(scramble_depths, improvement, color='#9b59b6', linewidth=3,
-                marker='o', markersize=10, markerfacecolor='#bb79d6')
-        ax2.fill_between(scramble_depths, improvement, alpha=0.3, color='#9b59b6')
-        ax2.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_ylabel('Improvement (%)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_title('AI Improvement Over Human', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax2.grid(True, alpha=0.2, color='#7c8db5')
-        ax2.tick_params(colors='#ffffff')
-        ax2.set_ylim([60, 75])
-        
-        # Subplot 3: Efficiency Ratio
-        ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
-        efficiency = (optimal / ai_solution) * 100
-        colors_gradient = plt.cm.viridis(efficiency / 100)
-        bars = ax3.bar(scramble_depths, efficiency, color=colors_gradient,
-                      edgecolor='#00d4ff', linewidth=2)
-        ax3.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_ylabel('Efficiency (%)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_title('AI Solution Optimality', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax3.grid(True, alpha=0.2, color='#7c8db5', axis='y')
-        ax3.tick_params(colors='#ffffff')
-        ax3.axhline(y=100, color='#FFD700', linestyle='--', linewidth=2, label='Optimal')
-        ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        # Subplot 4: Scatter Plot
-        ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
-        ax4.scatter(scramble_depths, ai_solution, s=200, c='#2ecc71',
-                   alpha=0.6, edgecolors='#4dff91', linewidth=2, label='AI Solution')
-        ax4.scatter(scramble_depths, optimal, s=200, c='#FFD700',
-                   alpha=0.6, edgecolors='#FFE44D', linewidth=2, label='Optimal')
-        ax4.plot(scramble_depths, ai_solution, color='#2ecc71', linewidth=2, alpha=0.5)
-        ax4.plot(scramble_depths, optimal, color='#FFD700', linewidth=2, alpha=0.5)
-        ax4.set_xlabel('Scramble Depth', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax4.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax4.set_title('AI vs Optimal Solution', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax4.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        ax4.grid(True, alpha=0.2, color='#7c8db5')
-        ax4.tick_params(colors='#ffffff')
-        
-        fig.tight_layout(pad=3.0)
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.content_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.show_view('results')
     
     def show_comprehensive_analysis(self):
-        self.clear_content()
-        
-        fig = Figure(figsize=(14, 8), facecolor='#1a1f3a')
-        
-        # Performance metrics
-        categories = ['Speed', 'Efficiency', 'Optimality', 'Consistency', 'Reliability', 'Learning']
-        values = [95, 92, 88, 96, 94, 90]
-        
-        # Subplot 1: Radar Chart
-        ax1 = fig.add_subplot(1, 2, 1, projection='polar', facecolor='#0f1429')
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        values_plot = values + [values[0]]
-        angles += angles[:1]
-        
-        ax1.plot(angles, values_plot, 'o-', linewidth=3, color='#2ecc71',
-                markersize=10, markerfacecolor='#4dff91')
-        ax1.fill(angles, values_plot, alpha=0.25, color='#2ecc71')
-        ax1.set_xticks(angles[:-1])
-        ax1.set_xticklabels(categories, color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_ylim(0, 100)
-        ax1.set_yticks([20, 40, 60, 80, 100])
-        ax1.set_yticklabels(['20', '40', '60', '80', '100'], color='#ffffff', fontsize=9)
-        ax1.set_title('AI Performance Metrics', color='#00d4ff', fontsize=14,
-                     fontweight='bold', pad=20)
-        ax1.grid(True, color='#7c8db5', alpha=0.3)
-        
-        # Subplot 2: Horizontal Bar Chart
-        ax2 = fig.add_subplot(1, 2, 2, facecolor='#0f1429')
-        colors = ['#ff3b3b', '#2ecc71', '#FFD700', '#9b59b6', '#3498db', '#ff8c00']
-        y_pos = np.arange(len(categories))
-        
-        bars = ax2.barh(y_pos, values, color=colors, edgecolor='white',
-                       linewidth=2, height=0.6)
-        
-        # Add value labels
-        for i, (bar, value) in enumerate(zip(bars, values)):
-            ax2.text(value + 1, i, f'{value}%', va='center',
-                    color='#ffffff', fontweight='bold', fontsize=11)
-        
-        ax2.set_yticks(y_pos)
-        ax2.set_yticklabels(categories, color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_xlabel('Performance Score (%)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_title('Performance Breakdown', color='#00d4ff', fontsize=14,
-                     fontweight='bold', pad=20)
-        ax2.set_xlim(0, 105)
-        ax2.grid(True, alpha=0.2, color='#7c8db5', axis='x')
-        ax2.tick_params(colors='#ffffff')
-        ax2.invert_yaxis()
-        
-        fig.tight_layout(pad=3.0)
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.content_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.show_view('radar')
     
     def show_demo_results(self):
-        self.clear_content()
-        
-        fig = Figure(figsize=(14, 8), facecolor='#1a1f3a')
-        
-        # Demo data
-        trials = np.arange(1, 11)
-        scramble = np.array([10, 15, 8, 12, 20, 7, 18, 10, 14, 16])
-        solution = np.array([15, 23, 12, 18, 31, 11, 28, 15, 21, 25])
-        time_taken = np.array([2.3, 3.5, 1.8, 2.7, 4.6, 1.6, 4.1, 2.2, 3.2, 3.8])
-        
-        # Subplot 1: Moves Comparison
-        ax1 = fig.add_subplot(2, 2, 1, facecolor='#0f1429')
-        width = 0.35
-        x = trials
-        
-        bars1 = ax1.bar(x - width/2, scramble, width, label='Scramble Moves',
-                       color='#9b59b6', edgecolor='#bb79d6', linewidth=2)
-        bars2 = ax1.bar(x + width/2, solution, width, label='Solution Moves',
-                       color='#2ecc71', edgecolor='#4dff91', linewidth=2)
-        
-        ax1.set_xlabel('Trial Number', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_ylabel('Number of Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax1.set_title('Demo Trial Results', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax1.set_xticks(trials)
-        ax1.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        ax1.grid(True, alpha=0.2, color='#7c8db5', axis='y')
-        ax1.tick_params(colors='#ffffff')
-        
-        # Subplot 2: Solution Time
-        ax2 = fig.add_subplot(2, 2, 2, facecolor='#0f1429')
-        colors_time = plt.cm.plasma(time_taken / time_taken.max())
-        bars = ax2.bar(trials, time_taken, color=colors_time,
-                      edgecolor='#00d4ff', linewidth=2)
-        ax2.set_xlabel('Trial Number', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_ylabel('Time (seconds)', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax2.set_title('Solution Time per Trial', color='#00d4ff', fontsize=13,
-                     fontweight='bold', pad=15)
-        ax2.set_xticks(trials)
-        ax2.grid(True, alpha=0.2, color='#7c8db5', axis='y')
-        ax2.tick_params(colors='#ffffff')
-        
-        # Add average line
-        avg_time = time_taken.mean()
-        ax2.axhline(y=avg_time, color='#FFD700', linestyle='--',
-                   linewidth=2, label=f'Average: {avg_time:.2f}s')
-        ax2.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        
-        # Subplot 3: Efficiency Scatter
-        ax3 = fig.add_subplot(2, 2, 3, facecolor='#0f1429')
-        efficiency_ratio = solution / scramble
-        ax3.scatter(scramble, solution, s=time_taken*100, c=trials,
-                   cmap='viridis', alpha=0.6, edgecolors='#00d4ff', linewidth=2)
-        
-        # Trend line
-        z = np.polyfit(scramble, solution, 1)
-        p = np.poly1d(z)
-        ax3.plot(scramble, p(scramble), "r--", linewidth=2,
-                color='#ff3b3b', label='Trend')
-        
-        ax3.set_xlabel('Scramble Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_ylabel('Solution Moves', color='#00d4ff', fontsize=11, fontweight='bold')
-        ax3.set_title('Scramble vs Solution Correlation', color='#00d4ff',
-                     fontsize=13, fontweight='bold', pad=15)
-        ax3.legend(facecolor='#2d3548', edgecolor='#00d4ff', labelcolor='#ffffff')
-        ax3.grid(True, alpha=0.2, color='#7c8db5')
-        ax3.tick_params(colors='#ffffff')
-        
-        # Subplot 4: Summary Stats
-        ax4 = fig.add_subplot(2, 2, 4, facecolor='#0f1429')
-        ax4.axis('off')
-        ax4.set_xlim(0, 10)
-        ax4.set_ylim(0, 14)
-        
-        # Title
-        ax4.text(5, 13, "DEMO STATISTICS", 
-                ha='center', va='top', fontsize=13, fontweight='bold',
-                color='#00d4ff', fontfamily='monospace')
-        
-        # Draw border
-        from matplotlib.patches import Rectangle
-        rect = Rectangle((0.5, 0.5), 9, 11.5, linewidth=3, 
-                         edgecolor='#00ff88', facecolor='none')
-        ax4.add_patch(rect)
-        
-        # Create stats as separate text elements with larger spacing
-        stats_data = [
-            ("Total Trials:", f"{len(trials)}"),
-            ("", ""),
-            ("Avg Scramble Depth:", f"{scramble.mean():.1f}"),
-            ("Avg Solution Moves:", f"{solution.mean():.1f}"),
-            ("Avg Solution Time:", f"{time_taken.mean():.2f}s"),
-            ("", ""),
-            ("Min Solution Moves:", f"{solution.min()}"),
-            ("Max Solution Moves:", f"{solution.max()}"),
-            ("", ""),
-            ("Fastest Solve:", f"{time_taken.min():.2f}s"),
-            ("Slowest Solve:", f"{time_taken.max():.2f}s"),
-            ("", ""),
-            ("Success Rate:", "100.0%"),
-        ]
-        
-        # Add stats with proper spacing
-        y_position = 11
-        line_height = 0.8
-        
-        for label, value in stats_data:
-            if label == "":
-                y_position -= line_height * 0.5
-                continue
-            
-            # Label on left
-            ax4.text(1.2, y_position, label, 
-                    ha='left', va='center', fontsize=10,
-                    color='#00ff88', fontfamily='monospace', fontweight='bold')
-            
-            # Value on right
-            ax4.text(8.8, y_position, value, 
-                    ha='right', va='center', fontsize=10,
-                    color='#ffffff', fontfamily='monospace', fontweight='bold')
-            
-            y_position -= line_height
-        
-        fig.tight_layout(pad=3.0)
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.content_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.show_view('demo')
+    
+    # ===== LIVE MODE =====
+    
+    def show_live(self):
+        if not TELEMETRY_AVAILABLE:
+            messagebox.showinfo("Live", "Live telemetry needs Unix datagram sockets, "
+                                        "which this platform does not have")
+            return
+        if self.listener is None:
+            self.listener = TelemetryListener()
+        self.listener.poll()
+        self.show_view('live', live_data(self.listener))
+        if self.live_after_id is None:
+            self.live_after_id = self.root.after(1000 // LIVE_FPS, self.live_tick)
+    
+    def live_tick(self):
+        """Drain the telemetry socket and redraw, at most LIVE_FPS times a second.
+        Stops once another view is shown; events keep buffering in the socket."""
+        if self.current_view is not self.views.get('live'):
+            self.live_after_id = None
+            return
+        if self.listener.poll():
+            self.show_view('live', live_data(self.listener))
+        self.live_after_id = self.root.after(1000 // LIVE_FPS, self.live_tick)
 
 def main():
+    parser = argparse.ArgumentParser(description="Rubik's cube AI analysis dashboard")
+    parser.add_argument('--export', nargs='?', const=EXPORT_DIR, metavar='DIR',
+                        help="render the views to files without opening a window")
+    parser.add_argument('--views', nargs='+', choices=VIEW_NAMES, default=VIEW_NAMES)
+    parser.add_argument('--formats', nargs='+', choices=EXPORT_FORMATS, default=['png'])
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="re-render unchanged views too")
+    args = parser.parse_args()
+
+    if args.export:
+        status = export_views(args.export, args.views, args.formats, args.workers,
+                              args.dpi, args.force)
+        for name in args.views:
+            print(f"{name}: {status[name]}")
+        return
+
     root = tk.Tk()
     app = RubiksCubeGraphs(root)
     root.mainloop()
+    if app.listener is not None:
+        app.listener.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
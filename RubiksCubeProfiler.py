@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import threading
+import numpy as np
+from collections import deque
+
+# ===== PROFILER =====
+# Stage timings, search counters and Tk frame latency for the solve pipeline.
+# Disabled by default: stage() then hands back one shared no-op context
+# manager and frame() returns at once, so instrumented code costs an
+# attribute check per stage, never per search node (the solvers keep their
+# own node counters, which stages only read when they close).
+
+TRACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runs', 'traces')
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, **counters):
+        pass
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'counters', 'start', 'cpu')
+
+    def __init__(self, profiler, name, counters):
+        self.profiler = profiler
+        self.name = name
+        self.counters = counters
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start,
+                             time.thread_time() - self.cpu, self.counters)
+        return False
+
+    def add(self, **counters):
+        """Attach counters (nodes expanded, table lookups, ...) to this stage"""
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+
+
+class Profiler:
+    """Collects spans (stage, start, wall, cpu, thread, counters) and frame
+    samples (lateness, render time, frames coalesced) in bounded buffers"""
+
+    def __init__(self, enabled=False, capacity=20000):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.spans = deque(maxlen=capacity)
+        self.frames = deque(maxlen=capacity)
+
+    def stage(self, name, **counters):
+        if not self.enabled:
+            return NULL_STAGE
+        return _Stage(self, name, counters)
+
+    def record(self, name, start, wall, cpu=0.0, counters=None):
+        self.spans.append((name, start, wall, cpu, threading.get_ident(), counters or {}))
+
+    def frame(self, start, lateness, render, coalesced):
+        """One rendered animation frame: how late its tick ran, how long the
+        render took, and how many due frames it stood in for"""
+        if self.enabled:
+            self.frames.append((start, lateness, render, coalesced, threading.get_ident()))
+
+    def clear(self):
+        self.spans.clear()
+        self.frames.clear()
+
+    # ----- reports -----
+
+    def stage_summary(self):
+        """{stage: {count, wall, cpu, last, last_cpu, p50, max, counters}} over buffered spans"""
+        grouped = {}
+        for name, _, wall, cpu, _, counters in list(self.spans):
+            entry = grouped.setdefault(name, {'walls': [], 'cpu': 0.0, 'counters': {}})
+            entry['walls'].append(wall)
+            entry['cpu'] += cpu
+            entry['last_cpu'] = cpu
+            for key, value in counters.items():
+                entry['counters'][key] = entry['counters'].get(key, 0) + value
+        summary = {}
+        for name, entry in grouped.items():
+            walls = np.array(entry['walls'])
+            summary[name] = {'count': len(walls), 'wall': float(walls.sum()), 'cpu': entry['cpu'],
+                             'last': float(walls[-1]), 'last_cpu': entry['last_cpu'],
+                             'p50': float(np.median(walls)),
+                             'max': float(walls.max()), 'counters': entry['counters']}
+        return summary
+
+    def frame_summary(self):
+        """Tick lateness and render time percentiles, and frames dropped by coalescing"""
+        if not self.frames:
+            return {'frames': 0, 'dropped': 0, 'late_p50': 0.0, 'late_p95': 0.0,
+                    'render_p50': 0.0, 'render_p95': 0.0}
+        _, lateness, render, coalesced, _ = np.array(list(self.frames)).T
+        late50, late95 = np.percentile(lateness, [50, 95])
+        render50, render95 = np.percentile(render, [50, 95])
+        return {'frames': len(lateness), 'dropped': int(coalesced.sum()),
+                'late_p50': float(late50), 'late_p95': float(late95),
+                'render_p50': float(render50), 'render_p95': float(render95)}
+
+    def overlay_text(self):
+        """Latest wall/CPU time per stage, counter totals and frame statistics"""
+        lines = [f"{'stage':<10}{'wall':>9}{'cpu':>9}{'p50':>9}"]
+        for name, entry in self.stage_summary().items():
+            lines.append(f"{name:<10}{entry['last'] * 1000:7.1f}ms{entry['last_cpu'] * 1000:7.1f}ms"
+                         f"{entry['p50'] * 1000:7.1f}ms")
+            for key, value in entry['counters'].items():
+                lines.append(f"  {key:<14}{value:>12,}")
+        frames = self.frame_summary()
+        lines.append(f"frames {frames['frames']}  dropped {frames['dropped']}")
+        lines.append(f"late p50/p95 {frames['late_p50'] * 1000:.1f}/{frames['late_p95'] * 1000:.1f}ms")
+        lines.append(f"render p50/p95 {frames['render_p50'] * 1000:.1f}/"
+                     f"{frames['render_p95'] * 1000:.1f}ms")
+        return '\n'.join(lines)
+
+    def dump(self, path=None):
+        """Write the buffers as a Chrome trace (chrome://tracing, Perfetto); returns the path"""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, time.strftime('trace-%Y%m%d-%H%M%S.json'))
+        pid = os.getpid()
+        events = []
+        for name, start, wall, cpu, thread, counters in list(self.spans):
+            events.append({'name': name, 'ph': 'X', 'pid': pid, 'tid': thread,
+                           'ts': (start - self.origin) * 1e6, 'dur': wall * 1e6,
+                           'args': dict(counters, cpu_ms=cpu * 1000)})
+        for start, lateness, render, coalesced, thread in list(self.frames):
+            events.append({'name': 'frame', 'ph': 'X', 'pid': pid, 'tid': thread,
+                           'ts': (start - self.origin) * 1e6, 'dur': render * 1e6,
+                           'args': {'late_ms': lateness * 1000, 'coalesced': int(coalesced)}})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms',
+                       'otherData': {'stages': self.stage_summary(),
+                                     'frames': self.frame_summary()}}, f)
+        return path
+
+
+# Shared by the solver, the scheduler and the GUI of one process
+PROFILER = Profiler()
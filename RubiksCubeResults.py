@@ -0,0 +1,320 @@
+import os
+import json
+import time
+try:
+    import fcntl
+except ImportError:                 # Windows: lock through msvcrt instead
+    fcntl = None
+    import msvcrt
+import numpy as np
+
+# ===== RESULTS STORE =====
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runs', 'results')
+
+# One fixed-size record per logged solve, appended to records.bin
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('epoch', '<i4'),         # training epoch, -1 outside training
+    ('seconds', '<f4'),
+    ('length', '<u2'),        # solution moves
+    ('depth', 'u1'),          # scramble depth, 0 when unknown
+    ('solver', 'u1'),         # index into ResultsStore.solvers
+    ('solved', '?'),
+])
+
+MAX_DEPTH = 40
+MAX_LENGTH = 100                                # longer solutions share the last bin
+SECONDS_BINS = np.logspace(-5, 2, 57)           # 8 bins per decade, 10us .. 100s
+REPLAY_CHUNK = 1 << 20
+
+
+class ResultsStore:
+    """Append-only log of solve records with running per-depth and per-epoch
+    aggregates.
+
+    Raw records go to records.bin; summary.npz holds, per solver and scramble
+    depth, counts, length/time sums and histograms (and per-epoch totals),
+    updated with each append. Readers only load the summary, so opening a
+    dashboard costs the same for a hundred records as for tens of millions.
+    A summary that lags the raw file (e.g. after a crash) is caught up from
+    the unsummarised tail on open.
+    """
+
+    def __init__(self, path=RESULTS_DIR):
+        self.path = path
+        self.records_path = os.path.join(path, 'records.bin')
+        self.summary_path = os.path.join(path, 'summary.npz')
+        self.solvers_path = os.path.join(path, 'solvers.json')
+        self.lock_path = os.path.join(path, 'lock')
+        self._load()
+        if self.stored_records() != self.records:
+            with self._locked():
+                self._catch_up()
+                self._save()
+
+    # ----- aggregates -----
+
+    def _empty(self):
+        self.solvers = []
+        self.records = 0
+        self.depth_count = np.zeros((0, MAX_DEPTH + 1), dtype=np.int64)
+        self.depth_solved = np.zeros((0, MAX_DEPTH + 1), dtype=np.int64)
+        self.depth_seconds = np.zeros((0, MAX_DEPTH + 1))
+        self.length_hist = np.zeros((0, MAX_DEPTH + 1, MAX_LENGTH + 1), dtype=np.int64)
+        self.seconds_hist = np.zeros((0, MAX_DEPTH + 1, len(SECONDS_BINS) + 1), dtype=np.int64)
+        self.epoch_count = np.zeros(0, dtype=np.int64)
+        self.epoch_solved = np.zeros(0, dtype=np.int64)
+        self.epoch_length = np.zeros(0)
+        self.epoch_seconds = np.zeros(0)
+
+    _ARRAYS = ('depth_count', 'depth_solved', 'depth_seconds', 'length_hist', 'seconds_hist',
+               'epoch_count', 'epoch_solved', 'epoch_length', 'epoch_seconds')
+
+    def _load(self):
+        self._empty()
+        if os.path.exists(self.solvers_path):
+            with open(self.solvers_path) as f:
+                self.solvers = json.load(f)
+        if not os.path.exists(self.summary_path):
+            return
+        with np.load(self.summary_path) as summary:
+            self.records = int(summary['records'])
+            for name in self._ARRAYS:
+                setattr(self, name, summary[name])
+
+    def _save(self):
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self.summary_path + '.tmp.npz'
+        np.savez(tmp_path, records=self.records,
+                 **{name: getattr(self, name) for name in self._ARRAYS})
+        os.replace(tmp_path, self.summary_path)
+
+    def _grow(self, solvers, epochs):
+        extra = solvers - len(self.depth_count)
+        if extra > 0:
+            for name in ('depth_count', 'depth_solved', 'depth_seconds',
+                         'length_hist', 'seconds_hist'):
+                array = getattr(self, name)
+                pad = np.zeros((extra,) + array.shape[1:], dtype=array.dtype)
+                setattr(self, name, np.concatenate([array, pad]))
+        extra = epochs - len(self.epoch_count)
+        if extra > 0:
+            for name in ('epoch_count', 'epoch_solved', 'epoch_length', 'epoch_seconds'):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros(extra, dtype=array.dtype)]))
+
+    def _aggregate(self, records):
+        """Fold a batch of raw records into the summary"""
+        epochs = records['epoch']
+        self._grow(int(records['solver'].max(initial=0)) + 1, int(epochs.max(initial=-1)) + 1)
+        solver = records['solver'].astype(np.intp)
+        depth = np.minimum(records['depth'], MAX_DEPTH).astype(np.intp)
+        solved = records['solved']
+        seconds = records['seconds'].astype(np.float64)
+        length = np.minimum(records['length'], MAX_LENGTH).astype(np.intp)
+
+        np.add.at(self.depth_count, (solver, depth), 1)
+        np.add.at(self.depth_solved, (solver, depth), solved)
+        np.add.at(self.depth_seconds, (solver, depth), seconds)
+        np.add.at(self.length_hist, (solver[solved], depth[solved], length[solved]), 1)
+        np.add.at(self.seconds_hist, (solver, depth, np.searchsorted(SECONDS_BINS, seconds)), 1)
+
+        training = epochs >= 0
+        epoch = epochs[training]
+        np.add.at(self.epoch_count, epoch, 1)
+        np.add.at(self.epoch_solved, epoch, solved[training])
+        np.add.at(self.epoch_length, epoch, np.where(solved, records['length'], 0)[training])
+        np.add.at(self.epoch_seconds, epoch, seconds[training])
+        self.records += len(records)
+
+    def _catch_up(self):
+        """Bring the summary in line with records.bin"""
+        stored = self.stored_records()
+        if stored < self.records:              # raw log was truncated: rebuild
+            solvers = self.solvers
+            self._empty()
+            self.solvers = solvers
+        with open(self.records_path, 'rb') as f:
+            f.seek(self.records * RECORD_DTYPE.itemsize)
+            while True:
+                chunk = np.fromfile(f, dtype=RECORD_DTYPE, count=REPLAY_CHUNK)
+                if len(chunk) == 0:
+                    break
+                self._aggregate(chunk)
+
+    def _locked(self):
+        os.makedirs(self.path, exist_ok=True)
+        return _FileLock(self.lock_path)
+
+    # ----- writing -----
+
+    def solver_index(self, name):
+        """Index of a solver name, registering new names (call under the lock)"""
+        if name not in self.solvers:
+            self.solvers.append(name)
+            tmp_path = self.solvers_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.solvers, f)
+            os.replace(tmp_path, self.solvers_path)
+        return self.solvers.index(name)
+
+    def append(self, solver, depth, length, seconds, solved=True, epoch=-1):
+        """Log one solve"""
+        self.append_many(solver, [depth], [length], [seconds], [solved], epoch)
+
+    def append_many(self, solver, depths, lengths, seconds, solved=None, epoch=-1):
+        """Log a batch of solves by one solver (one raw write, one summary write)"""
+        records = np.zeros(len(depths), dtype=RECORD_DTYPE)
+        records['timestamp'] = time.time()
+        records['epoch'] = epoch
+        records['seconds'] = seconds
+        records['length'] = np.minimum(lengths, np.iinfo(np.uint16).max)
+        records['depth'] = np.clip(depths, 0, 255)
+        records['solved'] = True if solved is None else solved
+
+        with self._locked():
+            # another process may have appended since we loaded
+            self._load()
+            if self.stored_records() != self.records:
+                self._catch_up()
+            records['solver'] = self.solver_index(solver)
+            with open(self.records_path, 'ab') as f:
+                records.tofile(f)
+            self._aggregate(records)
+            self._save()
+
+    # ----- reading -----
+
+    def __len__(self):
+        return self.records
+
+    def stored_records(self):
+        if not os.path.exists(self.records_path):
+            return 0
+        return os.path.getsize(self.records_path) // RECORD_DTYPE.itemsize
+
+    def refresh(self):
+        """Reload the summary written by other processes"""
+        self._load()
+
+    def depth_summary(self, solver=None):
+        """Per scramble depth: counts, solve rate, length and time statistics.
+        Covers one solver, or all of them when solver is None."""
+        if solver is None:
+            rows = slice(None)
+        elif solver in self.solvers:
+            rows = [self.solvers.index(solver)]
+        else:
+            rows = []
+        count = self.depth_count[rows].sum(axis=0)
+        solved = self.depth_solved[rows].sum(axis=0)
+        seconds = self.depth_seconds[rows].sum(axis=0)
+        lengths = self.length_hist[rows].sum(axis=0)
+        times = self.seconds_hist[rows].sum(axis=0)
+
+        depth = np.flatnonzero(count)
+        values = np.arange(MAX_LENGTH + 1)
+        n = np.maximum(lengths[depth].sum(axis=1), 1)
+        mean = (lengths[depth] * values).sum(axis=1) / n
+        var = (lengths[depth] * values ** 2).sum(axis=1) / n - mean ** 2
+        present = lengths[depth] > 0
+        return {
+            'depth': depth,
+            'count': count[depth],
+            'solve_rate': solved[depth] / count[depth],
+            'mean_length': mean,
+            'std_length': np.sqrt(np.maximum(var, 0)),
+            'min_length': np.where(present.any(axis=1), present.argmax(axis=1), 0),
+            'max_length': np.where(present.any(axis=1),
+                                   MAX_LENGTH - present[:, ::-1].argmax(axis=1), 0),
+            'mean_seconds': seconds[depth] / count[depth],
+            'p50_seconds': _histogram_quantile(times[depth], 0.5),
+            'p90_seconds': _histogram_quantile(times[depth], 0.9),
+        }
+
+    def overall_summary(self, fast_seconds=1.0):
+        """Totals over every logged solve; 'fast_rate' is the share under fast_seconds"""
+        count = int(self.depth_count.sum())
+        lengths = self.length_hist.sum(axis=(0, 1))
+        values = np.arange(MAX_LENGTH + 1)
+        n = max(int(lengths.sum()), 1)
+        mean = (lengths * values).sum() / n
+        times = self.seconds_hist.sum(axis=(0, 1))
+        fast = times[:np.searchsorted(SECONDS_BINS, fast_seconds) + 1].sum()
+        return {
+            'count': count,
+            'solve_rate': self.depth_solved.sum() / max(count, 1),
+            'mean_length': mean,
+            'std_length': np.sqrt(max((lengths * values ** 2).sum() / n - mean ** 2, 0)),
+            'mean_seconds': self.depth_seconds.sum() / max(count, 1),
+            'fast_rate': fast / max(count, 1),
+        }
+
+    def epoch_summary(self):
+        """Per training epoch: evaluation count, solve rate, mean length and time"""
+        epoch = np.flatnonzero(self.epoch_count)
+        count = self.epoch_count[epoch]
+        solved = self.epoch_solved[epoch]
+        return {
+            'epoch': epoch,
+            'count': count,
+            'solve_rate': solved / count,
+            'mean_length': self.epoch_length[epoch] / np.maximum(solved, 1),
+            'mean_seconds': self.epoch_seconds[epoch] / count,
+        }
+
+    def recent(self, n=10, solver=None):
+        """The last n raw records (of one solver), read from the end of the log"""
+        stored = self.stored_records()
+        if stored == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        window = n if solver is None else min(stored, max(n * 64, REPLAY_CHUNK // 16))
+        start = max(0, stored - window)
+        records = np.fromfile(self.records_path, dtype=RECORD_DTYPE, count=stored - start,
+                              offset=start * RECORD_DTYPE.itemsize)
+        if solver is not None:
+            if solver not in self.solvers:
+                return records[:0]
+            records = records[records['solver'] == self.solvers.index(solver)]
+        return records[-n:]
+
+
+def _histogram_quantile(histograms, q):
+    """Quantile of every row of a SECONDS_BINS histogram (upper bin edge)"""
+    if len(histograms) == 0:
+        return np.zeros(0)
+    edges = np.concatenate([SECONDS_BINS, [SECONDS_BINS[-1] * 10]])
+    cumulative = histograms.cumsum(axis=1)
+    target = q * cumulative[:, -1:]
+    return edges[(cumulative < target).sum(axis=1)]
+
+
+class _FileLock:
+    """Exclusive lock for the duration of a with block (one writer at a time):
+    flock on Unix, a one-byte msvcrt lock on Windows"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, 'a')
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        else:
+            self.file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:     # LK_LOCK gives up after 10 s; keep waiting
+                    pass
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
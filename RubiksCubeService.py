@@ -0,0 +1,229 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from RubiksCubeSolver import ENGINES, init_solve_worker, solve_job
+from RubiksCubeEngine import METRICS
+
+# Local solve service. Runs without a display: only the solver module is
+# imported, never Tk. Protocol is plain HTTP/1.1 over TCP or a Unix socket:
+#
+#   POST /solve    {"scramble": "R U2 F'"} or {"state": [54 colours]}
+#                  -> one JSON result
+#   POST /solve    {"jobs": [{...}, {...}]}
+#                  -> chunked application/x-ndjson, one line per job in
+#                     completion order, each tagged with the job's "index"
+#   GET  /metrics  queue depth, throughput and latency percentiles
+#   GET  /health
+
+MAX_BODY_BYTES = 64 << 20
+LATENCY_WINDOW = 4096
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class SolverService:
+    """Fans solve jobs out to a process pool and keeps service metrics"""
+
+    def __init__(self, workers=None, engine='Two-Phase', metric='HTM', time_limit=1.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(self.workers, initializer=init_solve_worker,
+                                        initargs=(engine, metric, time_limit))
+        self.started = time.time()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    async def solve(self, job):
+        """Solve one job in the pool; latency includes time spent queued"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self.pending += 1
+        try:
+            result = await loop.run_in_executor(self.pool, solve_job, job)
+        except Exception as error:
+            # a crashed or broken worker fails this job, not the connection
+            result = {'error': f'{type(error).__name__}: {error}'}
+        finally:
+            self.pending -= 1
+        self.latencies.append(time.perf_counter() - start)
+        if 'error' in result:
+            self.failed += 1
+        else:
+            self.completed += 1
+        return result
+
+    def metrics(self):
+        uptime = time.time() - self.started
+        latencies = np.array(self.latencies)
+        if len(latencies):
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            mean = latencies.mean()
+        else:
+            p50 = p95 = p99 = mean = 0.0
+        return {
+            'workers': self.workers,
+            'in_flight': min(self.pending, self.workers),
+            'queue_depth': max(0, self.pending - self.workers),
+            'completed': self.completed,
+            'failed': self.failed,
+            'uptime': round(uptime, 3),
+            'throughput': round((self.completed + self.failed) / max(uptime, 1e-9), 3),
+            'latency': {'mean': mean, 'p50': p50, 'p95': p95, 'p99': p99,
+                        'window': len(latencies)},
+        }
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    # ----- HTTP -----
+
+    async def handle(self, reader, writer):
+        try:
+            request = await read_request(reader)
+            if request is None:
+                return
+            method, path, body = request
+            if path == '/health':
+                await send_json(writer, 200, {'status': 'ok'})
+            elif path == '/metrics':
+                await send_json(writer, 200, self.metrics())
+            elif path == '/solve':
+                if method != 'POST':
+                    await send_json(writer, 405, {'error': 'use POST'})
+                else:
+                    await self.handle_solve(writer, body)
+            else:
+                await send_json(writer, 404, {'error': f'no route {path}'})
+        except HTTPError as error:
+            await send_json(writer, error.status, {'error': str(error)})
+        except ConnectionError:
+            pass
+        except Exception as error:
+            # last resort: answer instead of dropping the connection
+            try:
+                await send_json(writer, 500, {'error': f'{type(error).__name__}: {error}'})
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+
+    async def handle_solve(self, writer, body):
+        try:
+            payload = json.loads(body or b'{}')
+        except json.JSONDecodeError as error:
+            raise HTTPError(400, f'invalid JSON: {error}')
+        if not isinstance(payload, dict):
+            raise HTTPError(400, 'expected a JSON object')
+
+        jobs = payload.get('jobs')
+        if jobs is None:
+            result = await self.solve(payload)
+            await send_json(writer, 400 if 'error' in result else 200, result)
+            return
+        if not isinstance(jobs, list) or not all(isinstance(j, dict) for j in jobs):
+            raise HTTPError(400, "'jobs' must be a list of objects")
+
+        # Stream each result as soon as its worker finishes
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n'
+                     b'Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n')
+
+        async def indexed(i, job):
+            result = await self.solve(job)
+            result['index'] = i
+            return result
+
+        tasks = [asyncio.ensure_future(indexed(i, job)) for i, job in enumerate(jobs)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                line = json.dumps(await finished).encode() + b'\n'
+                writer.write(b'%x\r\n%s\r\n' % (len(line), line))
+                await writer.drain()
+            writer.write(b'0\r\n\r\n')
+            await writer.drain()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def read_request(reader):
+    """(method, path, body) of one HTTP/1.1 request, None on an empty connection"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(400, 'malformed request line')
+
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = header.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            if not value.strip().isdigit():
+                raise HTTPError(400, 'bad Content-Length')
+            length = int(value)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f'body larger than {MAX_BODY_BYTES} bytes')
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), target.split('?')[0], body
+
+
+async def send_json(writer, status, payload):
+    body = json.dumps(payload).encode()
+    writer.write(f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                 f'Content-Type: application/json\r\n'
+                 f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode() + body)
+    await writer.drain()
+
+
+async def serve(service, host='127.0.0.1', port=8765, unix_path=None):
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        where = f'http://{host}:{port}'
+    print(f"Solver service on {where} with {service.workers} workers", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Rubik's cube solve service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='serve on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--engine', choices=ENGINES, default='Two-Phase')
+    parser.add_argument('--metric', choices=METRICS, default='HTM')
+    parser.add_argument('--time-limit', type=float, default=1.0)
+    args = parser.parse_args()
+
+    service = SolverService(args.workers, args.engine, args.metric, args.time_limit)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1195 @@
+import os
+import sys
+import json
+import time
+import heapq
+import argparse
+import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import combinations
+from RubiksCubeEngine import (MOVES, QUARTER_MOVES, MOVE_INDEX, INVERSE_MOVES, FACE_NAMES, NUM_STICKERS,
+                              MOVE_TABLE, solved_state, apply_moves, is_solved,
+                              is_solved_batch, normalize_moves, move_count, METRICS,
+                              apply_sequence, invert_moves)
+from RubiksCubeEncoding import (MOVE_CUBIES, N_CORNER_PERM, N_CORNER_ORI, N_CORNER_COORD,
+                                stickers_to_cubies, stickers_to_cubies_batch,
+                                encode_batch, encode_cubies_batch, decode_cubies_batch,
+                                apply_move_cubies_batch, KeyTable, parse_facelets,
+                                validate_state,
+                                rank_permutation_batch, unrank_permutation_batch,
+                                rank_orientation_batch, unrank_orientation_batch,
+                                rank_partial_permutation_batch,
+                                unrank_partial_permutation_batch)
+from RubiksCubeTelemetry import TelemetryPublisher, TELEMETRY_AVAILABLE
+from RubiksCubeProfiler import PROFILER
+from RubiksCubeSymmetry import (canonical_form, to_canonical_solution,
+                                from_canonical_solution)
+from RubiksCubeResults import ResultsStore
+from RubiksCubeTraining import ValueNetwork, CHECKPOINT_PATH
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+
+# Face of every move and its opposite, used to prune redundant sequences
+MOVE_FACE = [FACE_NAMES.index(m[0]) for m in MOVES]
+OPPOSITE_FACE = [1, 0, 3, 2, 5, 4]
+
+# Edge pattern databases track six edges each (Korf's split of the 12 edges)
+EDGE_GROUPS = [(0, 1, 2, 3, 4, 5), (6, 7, 8, 9, 10, 11)]
+N_EDGE_POSITIONS = 12 * 11 * 10 * 9 * 8 * 7   # 665280 placements of 6 edges
+N_EDGE_GROUP_ORI = 2 ** 6
+N_CORNER_STATES = N_CORNER_PERM * N_CORNER_ORI
+N_EDGE_GROUP_STATES = N_EDGE_POSITIONS * N_EDGE_GROUP_ORI
+
+UNVISITED = 255
+
+
+# ===== COORDINATE MOVE TABLES =====
+
+def build_corner_move_tables():
+    """(40320, 18) corner permutation and (2187, 18) corner twist tables"""
+    perms = unrank_permutation_batch(np.arange(N_CORNER_PERM), 8).astype(np.intp)
+    twists = unrank_orientation_batch(np.arange(N_CORNER_ORI), 3, 8).astype(np.intp)
+    perm_table = np.empty((N_CORNER_PERM, len(MOVES)), dtype=np.int32)
+    twist_table = np.empty((N_CORNER_ORI, len(MOVES)), dtype=np.int32)
+    for m, (move_cp, move_co, _, _) in enumerate(MOVE_CUBIES):
+        perm_table[:, m] = rank_permutation_batch(perms[:, move_cp])
+        twist_table[:, m] = rank_orientation_batch((twists[:, move_cp] + move_co) % 3, 3)
+    return perm_table, twist_table
+
+
+def build_edge_group_move_tables():
+    """(665280, 18) placement table and matching orientation flip masks.
+
+    A coordinate tracks where each of six chosen edges sits and whether it is
+    flipped; the flip bits belong to the edges, so a move only XORs them.
+    """
+    positions = unrank_partial_permutation_batch(
+        np.arange(N_EDGE_POSITIONS), 12, 6).astype(np.intp)
+    position_table = np.empty((N_EDGE_POSITIONS, len(MOVES)), dtype=np.int32)
+    flip_table = np.empty((N_EDGE_POSITIONS, len(MOVES)), dtype=np.uint8)
+    bits = 1 << np.arange(5, -1, -1)
+    for m, (_, _, move_ep, move_eo) in enumerate(MOVE_CUBIES):
+        destination = np.argsort(move_ep)     # edge at slot p moves to slot destination[p]
+        moved = destination[positions]
+        position_table[:, m] = rank_partial_permutation_batch(moved, 12)
+        flip_table[:, m] = move_eo[moved] @ bits
+    return position_table, flip_table
+
+
+def corner_coordinate(cp, co):
+    return int(rank_permutation_batch([cp])[0]) * N_CORNER_ORI + \
+        int(rank_orientation_batch([co], 3)[0])
+
+
+def edge_group_coordinate(ep, eo, group):
+    """Placement/flip coordinate of one six-edge group"""
+    slots = [int(np.flatnonzero(ep == edge)[0]) for edge in group]
+    flips = 0
+    for slot in slots:
+        flips = (flips << 1) | int(eo[slot])
+    return int(rank_partial_permutation_batch([slots], 12)[0]) * N_EDGE_GROUP_ORI + flips
+
+
+# ===== PATTERN DATABASES =====
+
+def build_pattern_database(size, start, neighbours, chunk=1 << 20, log=None,
+                           max_depth=None):
+    """Breadth-first distances from `start` over a coordinate space.
+
+    With max_depth the search stops there and every state left unvisited gets
+    max_depth + 1, which is still a lower bound on its distance.
+    """
+    depth = np.full(size, UNVISITED, dtype=np.uint8)
+    depth[start] = 0
+    level = 0
+    while max_depth is None or level < max_depth:
+        frontier = np.flatnonzero(depth == level)
+        if len(frontier) == 0:
+            break
+        if log:
+            log(f"  depth {level:>2}: {len(frontier):>10} states")
+        for i in range(0, len(frontier), chunk):
+            children = neighbours(frontier[i:i + chunk]).ravel()
+            children = children[depth[children] == UNVISITED]
+            depth[children] = level + 1
+        level += 1
+    if max_depth is not None:
+        depth[depth == UNVISITED] = max_depth + 1
+    return depth
+
+
+class PatternDatabases:
+    """Corner + two six-edge pattern databases, memory-mapped from TABLE_DIR"""
+
+    FILES = ['corner_perm_moves', 'corner_twist_moves', 'edge_position_moves',
+             'edge_flip_moves', 'corner_pdb', 'edge_pdb_0', 'edge_pdb_1']
+
+    def __init__(self, table_dir=TABLE_DIR):
+        self.table_dir = table_dir
+        self.tables = {}
+
+    def path(self, name):
+        return os.path.join(self.table_dir, name + '.npy')
+
+    def exists(self):
+        return all(os.path.exists(self.path(name)) for name in self.FILES)
+
+    def load(self):
+        """Memory-map the tables (nothing is read until a lookup touches it)"""
+        for name in self.FILES:
+            # plain ndarray views skip np.memmap's per-lookup overhead
+            self.tables[name] = np.load(self.path(name), mmap_mode='r').view(np.ndarray)
+        return self
+
+    def build(self, log=print, max_depth=None):
+        """Generate every table and save it; only needed once per checkout.
+        max_depth truncates the databases (weaker but much faster to build)."""
+        os.makedirs(self.table_dir, exist_ok=True)
+        start = time.time()
+        corner_perm, corner_twist = build_corner_move_tables()
+        edge_position, edge_flip = build_edge_group_move_tables()
+        tables = {
+            'corner_perm_moves': corner_perm,
+            'corner_twist_moves': corner_twist,
+            'edge_position_moves': edge_position,
+            'edge_flip_moves': edge_flip,
+        }
+        log(f"Move tables built in {time.time() - start:.1f}s")
+
+        def corner_neighbours(coords):
+            perm, twist = np.divmod(coords, N_CORNER_ORI)
+            return corner_perm[perm].astype(np.int64) * N_CORNER_ORI + corner_twist[twist]
+
+        def edge_neighbours(coords):
+            position, flips = np.divmod(coords, N_EDGE_GROUP_ORI)
+            return edge_position[position].astype(np.int64) * N_EDGE_GROUP_ORI + \
+                (edge_flip[position] ^ flips[:, None].astype(np.uint8))
+
+        log("Corner pattern database:")
+        tables['corner_pdb'] = build_pattern_database(
+            N_CORNER_STATES, 0, corner_neighbours, log=log, max_depth=max_depth)
+        solved_ep, solved_eo = np.arange(12), np.zeros(12, dtype=np.int8)
+        for g, group in enumerate(EDGE_GROUPS):
+            log(f"Edge pattern database {g}:")
+            tables[f'edge_pdb_{g}'] = build_pattern_database(
+                N_EDGE_GROUP_STATES, edge_group_coordinate(solved_ep, solved_eo, group),
+                edge_neighbours, log=log, max_depth=max_depth)
+
+        for name, table in tables.items():
+            np.save(self.path(name), table)
+        log(f"Tables written to {self.table_dir} in {time.time() - start:.1f}s")
+        return self.load()
+
+
+# ===== IDA* SEARCH =====
+
+class IDAStarSolver:
+    """IDA* over cubie coordinates with a max-of-pattern-databases heuristic.
+
+    weight=1 gives optimal solutions; larger weights trade optimality for far
+    fewer expanded nodes (weighted IDA*, f = g + weight * h). A weighted
+    solution is at most `weight` times the optimal length, and in practice
+    a few moves over it.
+
+    The search gives up (returns None) after max_nodes expansions or
+    time_limit seconds, whichever comes first.
+    """
+
+    # the clock is read once per this many expanded nodes
+    CLOCK_INTERVAL = 256
+
+    def __init__(self, databases, weight=1.0, max_nodes=None, time_limit=None):
+        self.db = databases
+        self.weight = weight
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.deadline = None
+        self.nodes = 0
+
+    def coordinates(self, state):
+        cp, co, ep, eo = stickers_to_cubies(state)
+        return (corner_coordinate(cp, co),
+                edge_group_coordinate(ep, eo, EDGE_GROUPS[0]),
+                edge_group_coordinate(ep, eo, EDGE_GROUPS[1]))
+
+    def heuristic(self, corner, edge0, edge1):
+        t = self.db.tables
+        return int(max(t['corner_pdb'][corner], t['edge_pdb_0'][edge0],
+                       t['edge_pdb_1'][edge1]))
+
+    def children(self, corner, edge0, edge1):
+        """Coordinates and heuristic of all 18 children in a few vector lookups"""
+        t = self.db.tables
+        perm, twist = divmod(corner, N_CORNER_ORI)
+        corners = t['corner_perm_moves'][perm].astype(np.int64) * N_CORNER_ORI + \
+            t['corner_twist_moves'][twist]
+        edges = []
+        for coord in (edge0, edge1):
+            position, flips = divmod(coord, N_EDGE_GROUP_ORI)
+            edges.append(t['edge_position_moves'][position].astype(np.int64) * N_EDGE_GROUP_ORI +
+                         (t['edge_flip_moves'][position] ^ flips))
+        h = np.maximum(np.maximum(t['corner_pdb'][corners], t['edge_pdb_0'][edges[0]]),
+                       t['edge_pdb_1'][edges[1]])
+        return corners.tolist(), edges[0].tolist(), edges[1].tolist(), h.tolist()
+
+    def solve(self, state, max_depth=30):
+        """Return a move list solving `state`, or None if the node or time budget runs out"""
+        self.nodes = 0
+        self.deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        root = self.coordinates(state)
+        h = self.heuristic(*root)
+        bound = self.weight * h
+        path = []
+        while bound <= max_depth * self.weight:
+            result = self._search(root, h, 0, bound, -1, path)
+            if result is True:
+                return [MOVES[m] for m in path]
+            if result is None or result == float('inf'):
+                return None
+            bound = result
+        return None
+
+    def _search(self, node, h, g, bound, last_face, path):
+        if h == 0:
+            return True
+        self.nodes += 1
+        if self.max_nodes and self.nodes > self.max_nodes:
+            return None
+        if (self.deadline is not None and self.nodes % self.CLOCK_INTERVAL == 0
+                and time.perf_counter() > self.deadline):
+            return None
+
+        corners, edges0, edges1, hs = self.children(*node)
+        minimum = float('inf')
+        # most promising children first so weighted searches finish early
+        for m in sorted(range(len(MOVES)), key=hs.__getitem__):
+            face = MOVE_FACE[m]
+            # never turn the same face twice, and fix the order of opposite faces
+            if face == last_face or (face == OPPOSITE_FACE[last_face] and face < last_face):
+                continue
+            f = g + 1 + self.weight * hs[m]
+            if f > bound:
+                minimum = min(minimum, f)
+                continue
+            path.append(m)
+            result = self._search((corners[m], edges0[m], edges1[m]), hs[m], g + 1,
+                                  bound, face, path)
+            if result is True or result is None:
+                return result
+            path.pop()
+            minimum = min(minimum, result)
+        return minimum
+
+
+def load_pattern_database_solver(weight=2.0, max_nodes=300_000, time_limit=1.0,
+                                 table_dir=TABLE_DIR):
+    """Weighted IDA* solver over memory-mapped tables, or None if they were never built.
+
+    The search expands about 35k nodes a second, so within the default
+    one-second budget it solves states up to roughly 12-14 moves; deeper
+    scrambles give up on time and CubeSolver falls back to the two-phase
+    search. weight=1 with no budget gives optimal solutions but can take
+    minutes.
+    """
+    databases = PatternDatabases(table_dir)
+    if not databases.exists():
+        return None
+    return IDAStarSolver(databases.load(), weight=weight, max_nodes=max_nodes,
+                         time_limit=time_limit)
+
+
+# ===== TWO-PHASE SOLVER =====
+
+# Phase 2 keeps the cube in <U, D, R2, L2, F2, B2>
+PHASE2_MOVES = [MOVES.index(m) for m in ['U', "U'", 'U2', 'D', "D'", 'D2',
+                                         'R2', 'L2', 'F2', 'B2']]
+PHASE2_MOVE_SET = set(PHASE2_MOVES)
+
+# Phase 1 tracks which 4 of the 12 edge slots hold the FR/FL/BL/BR slice edges
+SLICE_EDGES = (8, 9, 10, 11)
+SLICE_COMBINATIONS = list(combinations(range(12), 4))
+SLICE_INDEX = {combo: i for i, combo in enumerate(SLICE_COMBINATIONS)}
+N_SLICE = len(SLICE_COMBINATIONS)                 # 495
+SOLVED_SLICE = SLICE_INDEX[SLICE_EDGES]
+N_FLIP = 2 ** 11
+N_UD_EDGE_PERM = N_CORNER_PERM                    # 8! arrangements of U/D edges
+N_SLICE_PERM = 24
+
+
+def build_two_phase_move_tables():
+    """Coordinate move tables for both phases (phase 2 tables use PHASE2_MOVES)"""
+    flips = unrank_orientation_batch(np.arange(N_FLIP), 2, 12).astype(np.intp)
+    flip_table = np.empty((N_FLIP, len(MOVES)), dtype=np.int16)
+    slice_table = np.empty((N_SLICE, len(MOVES)), dtype=np.int16)
+    for m, (_, _, move_ep, move_eo) in enumerate(MOVE_CUBIES):
+        flip_table[:, m] = rank_orientation_batch((flips[:, move_ep] + move_eo) % 2, 2)
+        destination = np.argsort(move_ep)
+        for i, combo in enumerate(SLICE_COMBINATIONS):
+            slice_table[i, m] = SLICE_INDEX[tuple(sorted(destination[list(combo)]))]
+
+    ud_perms = unrank_permutation_batch(np.arange(N_UD_EDGE_PERM), 8).astype(np.intp)
+    slice_perms = unrank_permutation_batch(np.arange(N_SLICE_PERM), 4).astype(np.intp)
+    ud_table = np.empty((N_UD_EDGE_PERM, len(PHASE2_MOVES)), dtype=np.int32)
+    slice_perm_table = np.empty((N_SLICE_PERM, len(PHASE2_MOVES)), dtype=np.int8)
+    for k, m in enumerate(PHASE2_MOVES):
+        move_ep = MOVE_CUBIES[m][2]
+        ud_table[:, k] = rank_permutation_batch(ud_perms[:, move_ep[:8]])
+        slice_perm_table[:, k] = rank_permutation_batch(slice_perms[:, move_ep[8:] - 8])
+    return flip_table, slice_table, ud_table, slice_perm_table
+
+
+class TwoPhaseSolver:
+    """Kociemba-style two-phase search over coordinate move and pruning tables.
+
+    Tables are built offline into TABLE_DIR and only read from disk the first
+    time solve() runs. The search keeps looking for shorter solutions until
+    its time limit and records when each improvement was found.
+    """
+
+    FILES = ['tp_twist_moves', 'tp_flip_moves', 'tp_slice_moves', 'tp_corner_perm_moves',
+             'tp_ud_edge_moves', 'tp_slice_perm_moves', 'tp_slice_twist_prune',
+             'tp_slice_flip_prune', 'tp_corner_prune', 'tp_ud_edge_prune']
+
+    def __init__(self, table_dir=TABLE_DIR):
+        self.table_dir = table_dir
+        self.loaded = False
+        self.first_solution_time = None
+        self.solutions = []
+        self.phase1_nodes = 0
+        self.phase2_nodes = 0
+
+    def path(self, name):
+        return os.path.join(self.table_dir, name + '.npy')
+
+    def exists(self):
+        return all(os.path.exists(self.path(name)) for name in self.FILES)
+
+    def load(self):
+        """Read the tables on first use; move tables become nested lists and
+        pruning tables bytes, which are the fastest things to index from Python"""
+        if self.loaded:
+            return self
+        t = {name: np.load(self.path(name)) for name in self.FILES}
+        self.twist_moves = t['tp_twist_moves'].tolist()
+        self.flip_moves = t['tp_flip_moves'].tolist()
+        self.slice_moves = t['tp_slice_moves'].tolist()
+        self.corner_moves = t['tp_corner_perm_moves'].tolist()
+        self.ud_edge_moves = t['tp_ud_edge_moves'].tolist()
+        self.slice_perm_moves = t['tp_slice_perm_moves'].tolist()
+        self.slice_twist_prune = t['tp_slice_twist_prune'].tobytes()
+        self.slice_flip_prune = t['tp_slice_flip_prune'].tobytes()
+        self.corner_prune = t['tp_corner_prune'].tobytes()
+        self.ud_edge_prune = t['tp_ud_edge_prune'].tobytes()
+        self.loaded = True
+        return self
+
+    def build(self, log=print):
+        """Generate the move and pruning tables and save them"""
+        os.makedirs(self.table_dir, exist_ok=True)
+        start = time.time()
+        corner_perm, twist = build_corner_move_tables()
+        flip, slc, ud_edge, slice_perm = build_two_phase_move_tables()
+        phase2_corner = corner_perm[:, PHASE2_MOVES]
+        tables = {
+            'tp_twist_moves': twist.astype(np.int16), 'tp_flip_moves': flip,
+            'tp_slice_moves': slc, 'tp_corner_perm_moves': phase2_corner,
+            'tp_ud_edge_moves': ud_edge, 'tp_slice_perm_moves': slice_perm,
+        }
+
+        def paired(first_table, second_table, second_size):
+            def neighbours(coords):
+                a, b = np.divmod(coords, second_size)
+                return first_table[a].astype(np.int64) * second_size + second_table[b]
+            return neighbours
+
+        log("Phase 1 pruning tables")
+        tables['tp_slice_twist_prune'] = build_pattern_database(
+            N_SLICE * N_CORNER_ORI, SOLVED_SLICE * N_CORNER_ORI,
+            paired(slc, twist, N_CORNER_ORI))
+        tables['tp_slice_flip_prune'] = build_pattern_database(
+            N_SLICE * N_FLIP, SOLVED_SLICE * N_FLIP, paired(slc, flip, N_FLIP))
+        log("Phase 2 pruning tables")
+        tables['tp_corner_prune'] = build_pattern_database(
+            N_SLICE_PERM * N_CORNER_PERM, 0,
+            paired(slice_perm, phase2_corner, N_CORNER_PERM))
+        tables['tp_ud_edge_prune'] = build_pattern_database(
+            N_SLICE_PERM * N_UD_EDGE_PERM, 0,
+            paired(slice_perm, ud_edge, N_UD_EDGE_PERM))
+
+        for name, table in tables.items():
+            np.save(self.path(name), table)
+        log(f"Two-phase tables written to {self.table_dir} in {time.time() - start:.1f}s")
+        return self.load()
+
+    def solve(self, state, time_limit=1.0, max_length=30):
+        """Best solution found within time_limit seconds, or None"""
+        self.load()
+        self.start = time.perf_counter()
+        self.deadline = self.start + time_limit
+        self.first_solution_time = None
+        self.solutions = []
+        self.phase1_nodes = 0
+        self.phase2_nodes = 0
+        self.best = None
+        self.max_length = max_length
+        self.state = state
+
+        cp, co, ep, eo = stickers_to_cubies(state)
+        twist = int(rank_orientation_batch([co], 3)[0])
+        flip = int(rank_orientation_batch([eo], 2)[0])
+        slc = SLICE_INDEX[tuple(int(i) for i in np.flatnonzero(ep >= 8))]
+
+        self._moves = []
+        for depth in range(max_length + 1):
+            if self.best is not None and depth >= len(self.best):
+                break
+            if self._phase1(twist, flip, slc, depth, -1) or self.timed_out():
+                break
+        return self.best
+
+    def timed_out(self):
+        return self.best is not None and time.perf_counter() > self.deadline
+
+    def _phase1(self, twist, flip, slc, depth, last_face):
+        """Depth-limited phase 1; returns True once the search should stop"""
+        self.phase1_nodes += 1
+        if depth == 0:
+            if twist == 0 and flip == 0 and slc == SOLVED_SLICE and \
+                    (not self._moves or self._moves[-1] not in PHASE2_MOVE_SET):
+                return self._start_phase2()
+            return False
+        if self.timed_out():
+            return True
+
+        twist_row, flip_row, slice_row = self.twist_moves[twist], \
+            self.flip_moves[flip], self.slice_moves[slc]
+        for m in range(len(MOVES)):
+            face = MOVE_FACE[m]
+            if face == last_face or (face == OPPOSITE_FACE[last_face] and face < last_face):
+                continue
+            t, f, s = twist_row[m], flip_row[m], slice_row[m]
+            if self.slice_twist_prune[s * N_CORNER_ORI + t] >= depth or \
+                    self.slice_flip_prune[s * N_FLIP + f] >= depth:
+                continue
+            self._moves.append(m)
+            stop = self._phase1(t, f, s, depth - 1, face)
+            self._moves.pop()
+            if stop:
+                return True
+        return False
+
+    def _start_phase2(self):
+        limit = (len(self.best) if self.best is not None else self.max_length + 1) \
+            - 1 - len(self._moves)
+        if limit < 0:
+            return False
+        cp, _, ep, _ = stickers_to_cubies(apply_moves(self.state, [MOVES[m] for m in self._moves]))
+        corner = int(rank_permutation_batch([cp])[0])
+        ud_edge = int(rank_permutation_batch([ep[:8]])[0])
+        slice_perm = int(rank_permutation_batch([ep[8:] - 8])[0])
+        last_face = MOVE_FACE[self._moves[-1]] if self._moves else -1
+
+        phase2 = []
+        for depth in range(limit + 1):
+            if self._phase2(corner, ud_edge, slice_perm, depth, last_face, phase2):
+                moves = [MOVES[m] for m in self._moves + phase2]
+                self.best = moves
+                elapsed = time.perf_counter() - self.start
+                if self.first_solution_time is None:
+                    self.first_solution_time = elapsed
+                self.solutions.append((elapsed, len(moves)))
+                break
+        # stop as soon as phase 1 alone is as long as the best total
+        return self.timed_out()
+
+    def _phase2(self, corner, ud_edge, slice_perm, depth, last_face, path):
+        self.phase2_nodes += 1
+        base = slice_perm * N_CORNER_PERM
+        if max(self.corner_prune[base + corner], self.ud_edge_prune[base + ud_edge]) > depth:
+            return False
+        if depth == 0:
+            return True
+        corner_row, edge_row, slice_row = self.corner_moves[corner], \
+            self.ud_edge_moves[ud_edge], self.slice_perm_moves[slice_perm]
+        for k, m in enumerate(PHASE2_MOVES):
+            face = MOVE_FACE[m]
+            if face == last_face or (face == OPPOSITE_FACE[last_face] and face < last_face):
+                continue
+            path.append(m)
+            if self._phase2(corner_row[k], edge_row[k], slice_row[k], depth - 1, face, path):
+                return True
+            path.pop()
+        return False
+
+
+def load_two_phase_solver(table_dir=TABLE_DIR):
+    """Two-phase solver whose tables load lazily, or None if they were never built"""
+    solver = TwoPhaseSolver(table_dir)
+    return solver if solver.exists() else None
+
+
+# ===== BATCH WEIGHTED A* =====
+
+def pattern_database_heuristic(databases):
+    """Batched admissible heuristic from the IDA* pattern databases"""
+    t = databases.tables
+    bits = 1 << np.arange(5, -1, -1)
+
+    def heuristic(states):
+        cp, co, ep, eo = stickers_to_cubies_batch(states)
+        corner = rank_permutation_batch(cp) * N_CORNER_ORI + rank_orientation_batch(co, 3)
+        h = t['corner_pdb'][corner]
+        slot_of_edge = np.argsort(ep, axis=1)
+        for g, group in enumerate(EDGE_GROUPS):
+            slots = slot_of_edge[:, group]
+            flips = np.take_along_axis(eo, slots, axis=1).astype(np.int64) @ bits
+            coord = rank_partial_permutation_batch(slots, 12) * N_EDGE_GROUP_ORI + flips
+            h = np.maximum(h, t[f'edge_pdb_{g}'][coord])
+        return h.astype(np.float32)
+
+    return heuristic
+
+
+def value_network_heuristic(network):
+    """Batched cost-to-go from a trained ValueNetwork (0 on solved states)"""
+
+    def heuristic(states):
+        h = np.maximum(network.predict(states), 0.0)
+        h[is_solved_batch(states)] = 0.0
+        return h
+
+    return heuristic
+
+
+class BatchWeightedAStar:
+    """Batch Weighted A* (BWAS) with f = weight * g + h.
+
+    Each iteration pops the batch_size best open nodes, expands all of their
+    children with one gather and scores every new child with a single call to
+    heuristic(states) -> costs. Nodes live in preallocated arrays (state,
+    parent, move, path cost) capped at max_nodes, so memory is fixed up front.
+    The search gives up when the store fills or after time_limit seconds.
+    """
+
+    def __init__(self, heuristic, weight=0.6, batch_size=1000, max_nodes=1_000_000,
+                 moves=MOVES, time_limit=None):
+        self.heuristic = heuristic
+        self.weight = weight
+        self.batch_size = batch_size
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.moves = [MOVES.index(m) for m in moves]
+        self.nodes = 0
+        self.iterations = 0
+
+    def solve(self, state):
+        """Move list solving `state`, or None if the node store fills up or time runs out"""
+        deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        capacity = self.max_nodes
+        states = np.empty((capacity, NUM_STICKERS), dtype=np.uint8)
+        parent = np.empty(capacity, dtype=np.int32)
+        move = np.empty(capacity, dtype=np.int8)
+        cost = np.empty(capacity, dtype=np.int16)
+        closed = np.zeros(capacity, dtype=bool)
+        seen = KeyTable(capacity)
+        move_table = MOVE_TABLE[self.moves]
+
+        states[0] = state
+        parent[0], move[0], cost[0] = -1, -1, 0
+        seen.get_or_insert(encode_batch(states[:1]))
+        self.nodes, self.iterations = 1, 0
+        if is_solved(state):
+            return []
+        open_heap = [(float(self.heuristic(states[:1])[0]), 0)]
+
+        while open_heap:
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            self.iterations += 1
+            batch = []
+            while open_heap and len(batch) < self.batch_size:
+                _, node = heapq.heappop(open_heap)
+                if not closed[node]:
+                    closed[node] = True
+                    batch.append(node)
+            if not batch:
+                break
+            batch = np.array(batch)
+
+            children = states[batch][:, move_table].reshape(-1, NUM_STICKERS)
+            child_parent = np.repeat(batch, len(self.moves))
+            child_move = np.tile(np.array(self.moves, dtype=np.int8), len(batch))
+            child_cost = cost[child_parent] + 1
+
+            # keep only the cheapest copy of every distinct child in the batch
+            child_keys = encode_batch(children)
+            _, inverse = np.unique(child_keys, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            order = np.lexsort((child_cost, inverse))
+            first = order[np.r_[0, np.flatnonzero(np.diff(inverse[order])) + 1]]
+            ids, inserted = seen.get_or_insert(child_keys[first])
+            if seen.count > capacity:
+                return None
+
+            # a cheaper path to a known node reopens it in place
+            better = ~inserted
+            better[better] = child_cost[first[better]] < cost[ids[better]]
+            reopened = ids[better]
+            parent[reopened] = child_parent[first[better]]
+            move[reopened] = child_move[first[better]]
+            cost[reopened] = child_cost[first[better]]
+            closed[reopened] = False
+
+            # new nodes were given consecutive ids, which index the store directly
+            fresh = first[inserted]
+            slots = ids[inserted]
+            states[slots] = children[fresh]
+            parent[slots] = child_parent[fresh]
+            move[slots] = child_move[fresh]
+            cost[slots] = child_cost[fresh]
+            self.nodes = seen.count
+
+            goal = slots[is_solved_batch(children[fresh])]
+            if len(goal):
+                return self._path(int(goal[0]), parent, move)
+
+            scored = np.concatenate([slots, reopened])
+            h = self.heuristic(states[scored])
+            f = self.weight * cost[scored] + h
+            for value, node in zip(f.tolist(), scored.tolist()):
+                heapq.heappush(open_heap, (value, node))
+        return None
+
+    def _path(self, node, parent, move):
+        path = []
+        while parent[node] >= 0:
+            path.append(MOVES[move[node]])
+            node = parent[node]
+        return path[::-1]
+
+
+def load_batch_weighted_astar(heuristic='pdb', table_dir=TABLE_DIR,
+                              checkpoint_path=CHECKPOINT_PATH, **options):
+    """BWAS guided by the pattern databases ('pdb') or the trained value
+    network ('network'), or None if those were never built"""
+    if heuristic == 'network':
+        if not os.path.exists(checkpoint_path):
+            return None
+        # the network learned quarter-turn costs, so it searches quarter turns
+        return BatchWeightedAStar(value_network_heuristic(ValueNetwork.load(checkpoint_path)),
+                                  moves=QUARTER_MOVES, **options)
+    databases = PatternDatabases(table_dir)
+    if not databases.exists():
+        return None
+    return BatchWeightedAStar(pattern_database_heuristic(databases.load()), **options)
+
+
+# ===== BIDIRECTIONAL SEARCH =====
+
+# A packed key needs 67 bits (27 corner + 40 edge), more than one uint64 holds
+# (the cube group itself has 4.3e19 > 2^64 elements). The top corner bits pick
+# one of six buckets, and the rest of the key is one uint64 inside it.
+KEY_BUCKET_SHIFT = 24
+EDGE_KEY_BITS = 40
+N_KEY_BUCKETS = ((N_CORNER_COORD - 1) >> KEY_BUCKET_SHIFT) + 1
+
+# Growth of a BFS level in the half-turn metric, to refuse expansions that
+# would not fit in max_states before allocating them
+LEVEL_GROWTH = 13.5
+
+
+def split_keys(keys):
+    """(bucket, uint64 key within the bucket) of (N, 2) packed keys"""
+    corner, edge = keys[:, 0], keys[:, 1]
+    bucket = (corner >> np.uint64(KEY_BUCKET_SHIFT)).astype(np.intp)
+    low = ((corner & np.uint64((1 << KEY_BUCKET_SHIFT) - 1)) << np.uint64(EDGE_KEY_BITS)) | edge
+    return bucket, low
+
+
+class SortedKeySet:
+    """A set of states as N_KEY_BUCKETS sorted uint64 arrays: 8 bytes a state,
+    membership by binary search"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+
+    @classmethod
+    def from_keys(cls, keys):
+        bucket, low = split_keys(keys)
+        return cls([np.unique(low[bucket == b]) for b in range(N_KEY_BUCKETS)])
+
+    def __len__(self):
+        return sum(len(b) for b in self.buckets)
+
+    def nbytes(self):
+        return sum(b.nbytes for b in self.buckets)
+
+    def contains(self, keys):
+        """Boolean mask of the (N, 2) packed keys that are in the set"""
+        bucket, low = split_keys(keys)
+        found = np.zeros(len(low), dtype=bool)
+        for b, values in enumerate(self.buckets):
+            rows = np.flatnonzero(bucket == b)
+            if len(rows) and len(values):
+                at = np.minimum(np.searchsorted(values, low[rows]), len(values) - 1)
+                found[rows] = values[at] == low[rows]
+        return found
+
+    def keys(self):
+        """(N, 2) packed keys, sorted"""
+        parts = []
+        mask = np.uint64((1 << EDGE_KEY_BITS) - 1)
+        for b, values in enumerate(self.buckets):
+            corner = (np.uint64(b) << np.uint64(KEY_BUCKET_SHIFT)) | \
+                (values >> np.uint64(EDGE_KEY_BITS))
+            parts.append(np.stack([corner, values & mask], axis=1))
+        return np.concatenate(parts)
+
+
+def neighbour_keys(keys):
+    """(18, N, 2) packed keys of every move applied to every state"""
+    cubies = decode_cubies_batch(keys)
+    return np.stack([encode_cubies_batch(*apply_move_cubies_batch(*cubies, m))
+                     for m in range(len(MOVES))])
+
+
+class BidirectionalSearch:
+    """Optimal solver meeting a breadth-first search from the state with one
+    from the solved cube.
+
+    Every BFS level is a SortedKeySet; the next level is the level's
+    neighbours minus the two levels before it, so no global visited set is
+    needed. The smaller frontier is always expanded. Levels grown from the
+    solved cube up to goal_cache_depth are kept for later solves (depth 6
+    holds 8.2M keys, 66 MB).
+
+    With the defaults this solves states of up to 12 moves (6 + 6, about
+    17M stored keys). Each further move needs one 7-move level, about 100M
+    keys (800 MB): 13 moves takes max_depth=13 and max_states of about
+    125M, 14 moves about 240M.
+    """
+
+    def __init__(self, max_depth=12, max_states=30_000_000, goal_cache_depth=6,
+                 chunk=1 << 16):
+        self.max_depth = max_depth
+        self.max_states = max_states
+        self.goal_cache_depth = goal_cache_depth
+        self.chunk = chunk
+        self.goal_levels = [SortedKeySet.from_keys(encode_batch(solved_state()[None]))]
+        self.nodes = 0
+
+    def expand(self, levels):
+        """Next BFS level after levels[-1]"""
+        frontier = levels[-1].keys()
+        parts = [[] for _ in range(N_KEY_BUCKETS)]
+        for i in range(0, len(frontier), self.chunk):
+            bucket, low = split_keys(neighbour_keys(frontier[i:i + self.chunk]).reshape(-1, 2))
+            for b in range(N_KEY_BUCKETS):
+                parts[b].append(np.unique(low[bucket == b]))
+        self.nodes += len(frontier)
+        level = SortedKeySet([np.unique(np.concatenate(p)) for p in parts])
+        for older in levels[-2:]:
+            for b, values in enumerate(level.buckets):
+                level.buckets[b] = values[~np.isin(values, older.buckets[b], assume_unique=True)]
+        return level
+
+    def solve(self, state):
+        """Optimal move list solving `state`, or None past max_depth or max_states"""
+        self.nodes = 0
+        start = encode_batch(np.asarray(state, dtype=np.uint8)[None])
+        if self.goal_levels[0].contains(start)[0]:
+            return []
+        forward = [SortedKeySet.from_keys(start)]
+        backward = self.goal_levels[:1]
+        while len(forward) + len(backward) - 2 < self.max_depth:
+            # cached goal levels are free; otherwise grow the smaller frontier
+            cached = len(backward) < len(self.goal_levels)
+            if not cached:
+                stored = sum(len(level) for level in forward + backward)
+                smaller = min(len(backward[-1]), len(forward[-1]))
+                if stored + LEVEL_GROWTH * smaller > self.max_states:
+                    return None
+            if cached or len(backward[-1]) <= len(forward[-1]):
+                if cached:
+                    level = self.goal_levels[len(backward)]
+                else:
+                    level = self.expand(backward)
+                    if len(backward) <= self.goal_cache_depth:
+                        self.goal_levels.append(level)
+                backward = backward + [level]
+                new, other = backward[-1], forward[-1]
+            else:
+                forward.append(self.expand(forward))
+                new, other = forward[-1], backward[-1]
+            # every shorter pairing of levels was checked when its later level
+            # was built, so a meeting here is at optimal depth
+            keys = new.keys()
+            meet = np.flatnonzero(other.contains(keys))
+            if len(meet):
+                middle = keys[meet[:1]]
+                return invert_moves(self._walk(middle, forward)) + self._walk(middle, backward)
+        return None
+
+    def _walk(self, key, levels):
+        """Moves taking `key` (in levels[-1]) back through the levels to their root"""
+        moves = []
+        for level in reversed(levels[:-1]):
+            neighbours = neighbour_keys(key)[:, 0]
+            m = int(np.flatnonzero(level.contains(neighbours))[0])
+            moves.append(MOVES[m])
+            key = neighbours[m:m + 1]
+        return moves
+
+
+# ===== SOLUTION CACHE =====
+
+class SolutionCache:
+    """Bounded LRU of solutions keyed by the canonical form of a state under
+    the 48 cube symmetries and inversion. A hit on any symmetric or inverse
+    variant translates the stored solution back through that symmetry."""
+
+    def __init__(self, capacity=10000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, state):
+        key, sym, inverted = canonical_form(state)
+        stored = self.entries.get(key)
+        if stored is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return from_canonical_solution([MOVES[m] for m in stored], sym, inverted)
+
+    def put(self, state, solution):
+        key, sym, inverted = canonical_form(state)
+        canonical = to_canonical_solution(solution, sym, inverted)
+        self.entries[key] = bytes(MOVES.index(m) for m in canonical)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self):
+        return self.hits / max(1, self.hits + self.misses)
+
+    def memory_bytes(self):
+        """Approximate footprint of keys, solutions and dictionary slots"""
+        return sys.getsizeof(self.entries) + sum(
+            sys.getsizeof(key) + sys.getsizeof(value) for key, value in self.entries.items())
+
+
+# ===== HEADLESS SOLVER =====
+
+# BWAS is Batch Weighted A* over the pattern databases, BWAS-Net the same
+# search guided by the value network of RubiksCubeTraining
+ENGINES = ('Two-Phase', 'IDA*', 'BWAS', 'BWAS-Net', 'Bidirectional', 'Inverse')
+
+
+class CubeSolver:
+    """Display-free solve pipeline shared by the GUI, the service and the CLI.
+
+    A state goes through the solution cache, then the selected engine; when the
+    scramble is known its normalized inverse is the baseline, and the searched
+    solution is only kept when it is shorter in the chosen metric.
+    """
+
+    def __init__(self, engine='Two-Phase', metric='HTM', time_limit=1.0,
+                 cache_capacity=10000, table_dir=TABLE_DIR, telemetry=True):
+        self.engine = engine
+        self.metric = metric
+        self.time_limit = time_limit
+        self.search_solver = load_pattern_database_solver(time_limit=time_limit,
+                                                          table_dir=table_dir)
+        self.two_phase_solver = load_two_phase_solver(table_dir)
+        self.bidirectional_solver = BidirectionalSearch()
+        self.table_dir = table_dir
+        self.bwas_solvers = {}          # per BWAS engine, loaded on first use
+        self.cache = SolutionCache(capacity=cache_capacity)
+        self.last_engine = None
+        self.last_search = None
+        self.fallback_from = None       # engine that gave up on the last search
+        # per-solve events for the dashboard's live mode (RubiksCubeTelemetry)
+        self.telemetry = TelemetryPublisher() if telemetry and TELEMETRY_AVAILABLE else None
+
+    def solve(self, state, scramble=None):
+        """Solution of `state` as a list of moves, or None if no engine found one"""
+        start = time.perf_counter()
+        with PROFILER.stage('cache'):
+            cached = self.cache.get(state)
+        if cached is not None:
+            self.last_engine = 'Cache'
+            solution = normalize_moves(cached, self.metric)
+        else:
+            with PROFILER.stage('search') as stage:
+                solution = self.search(state, scramble)
+                stage.add(**self.search_counters())
+            if solution is not None:
+                with PROFILER.stage('normalize'):
+                    solution = normalize_moves(solution, self.metric)
+                    self.cache.put(state, solution)
+
+        if self.telemetry is not None:
+            self.telemetry.publish(self.last_engine, len(scramble or ()),
+                                   move_count(solution or (), self.metric),
+                                   time.perf_counter() - start, solution is not None)
+        return solution
+
+    def search_counters(self):
+        """Work done by the engine of the last search"""
+        if self.last_search == 'Two-Phase':
+            return {'phase1_nodes': self.two_phase_solver.phase1_nodes,
+                    'phase2_nodes': self.two_phase_solver.phase2_nodes}
+        if self.last_search == 'IDA*':
+            # every expansion reads 18 children from each of the 3 pattern databases
+            return {'nodes': self.search_solver.nodes,
+                    'table_lookups': 54 * self.search_solver.nodes}
+        if self.last_search == 'Bidirectional':
+            return {'nodes': self.bidirectional_solver.nodes}
+        solver = self.bwas_solvers.get(self.last_search)
+        if solver is not None:
+            return {'nodes': solver.nodes, 'iterations': solver.iterations}
+        return {}
+
+    def weighted_astar(self, engine):
+        """The BWAS solver of `engine`, or None without its tables or network"""
+        if engine not in self.bwas_solvers:
+            self.bwas_solvers[engine] = load_batch_weighted_astar(
+                'network' if engine == 'BWAS-Net' else 'pdb', self.table_dir,
+                time_limit=self.time_limit)
+        return self.bwas_solvers[engine]
+
+    def search(self, state, scramble=None):
+        baseline = None
+        if scramble is not None:
+            baseline = normalize_moves([INVERSE_MOVES[m] for m in reversed(scramble)],
+                                       self.metric)
+
+        engine = self.engine
+        if engine == 'Inverse' and baseline is None:
+            engine = 'Two-Phase'            # nothing to invert without the scramble
+        searched = None
+        self.last_search = engine
+        self.fallback_from = None
+        if engine == 'Two-Phase' and self.two_phase_solver is not None:
+            searched = self.two_phase_solver.solve(state, time_limit=self.time_limit)
+        elif engine == 'IDA*' and self.search_solver is not None:
+            searched = self.search_solver.solve(state)
+        elif engine in ('BWAS', 'BWAS-Net') and self.weighted_astar(engine) is not None:
+            searched = self.weighted_astar(engine).solve(state)
+        elif engine == 'Bidirectional':
+            searched = self.bidirectional_solver.solve(state)
+        if (searched is None and engine not in ('Two-Phase', 'Inverse')
+                and self.two_phase_solver is not None):
+            # IDA* or BWAS ran out of nodes (or their tables are missing), or the
+            # state was deeper than the bidirectional search reaches: the
+            # two-phase search finds a solution at any depth
+            self.fallback_from = engine
+            self.last_search = engine = 'Two-Phase'
+            searched = self.two_phase_solver.solve(state, time_limit=self.time_limit)
+
+        if searched is not None and (baseline is None or move_count(searched, self.metric)
+                                     < move_count(baseline, self.metric)):
+            self.last_engine = engine
+            return searched
+        self.last_engine = 'Inverse'
+        return baseline
+
+
+def parse_job(job):
+    """(state, scramble) from a job dict holding a 'scramble' and/or a 'state'.
+
+    A scramble is a move string ("R U2 F'") or list applied to the solved cube;
+    a state is 54 sticker colours 0-5 in face order U D L R F B, or a
+    'facelets' string naming every sticker's face ("UUUUUUUUUDDD...").
+    """
+    if not isinstance(job, dict):
+        raise ValueError("a job must be a JSON object")
+    if job.get('facelets') is not None:
+        job = dict(job, state=parse_facelets(job['facelets']))
+
+    scramble = job.get('scramble')
+    if isinstance(scramble, str):
+        scramble = scramble.split()
+    if scramble is not None:
+        if not isinstance(scramble, list) or not all(isinstance(m, str) for m in scramble):
+            raise ValueError("scramble must be a move string or a list of moves")
+        unknown = [m for m in scramble if m not in MOVE_INDEX]
+        if unknown:
+            raise ValueError(f"unknown moves: {' '.join(unknown)}")
+
+    if job.get('state') is not None:
+        state = validate_state(job['state'])
+        if scramble is not None and not (apply_sequence(solved_state(), scramble) == state).all():
+            raise ValueError("scramble does not produce the given state")
+    elif scramble is not None:
+        state = apply_sequence(solved_state(), scramble)
+    else:
+        raise ValueError("job needs a 'state' or a 'scramble'")
+    return state, scramble
+
+
+# Per-process solver of a worker pool (see init_solve_worker)
+_worker_solver = None
+
+
+def init_solve_worker(engine='Two-Phase', metric='HTM', time_limit=1.0, cache_capacity=10000,
+                      table_dir=TABLE_DIR):
+    global _worker_solver
+    _worker_solver = CubeSolver(engine, metric, time_limit, cache_capacity, table_dir)
+
+
+def solve_job(job):
+    """Solve one job dict in a pool worker; returns a JSON-ready result dict"""
+    if _worker_solver is None:
+        init_solve_worker()
+    start = time.perf_counter()
+    try:
+        state, scramble = parse_job(job)
+        solution = _worker_solver.solve(state, scramble)
+    except ValueError as error:
+        return {'error': str(error)}
+    except Exception as error:
+        # one broken job must not take the rest of a batch down with it
+        return {'error': f'{type(error).__name__}: {error}'}
+    if solution is None:
+        return {'error': 'no solution found', 'seconds': time.perf_counter() - start}
+    return {
+        'solution': ' '.join(solution),
+        'length': move_count(solution, _worker_solver.metric),
+        'metric': _worker_solver.metric,
+        'engine': _worker_solver.last_engine,
+        'verified': is_solved(apply_sequence(state, solution)),
+        'seconds': round(time.perf_counter() - start, 6),
+    }
+
+
+def solve_jobs(jobs):
+    """Solve a chunk of jobs in one worker round trip"""
+    return [solve_job(job) for job in jobs]
+
+
+# ===== BATCH COMMAND LINE =====
+
+def line_to_job(line):
+    """A 54-letter facelet string or a move sequence"""
+    if len(line) == NUM_STICKERS and ' ' not in line:
+        return {'facelets': line}
+    return {'scramble': line}
+
+
+def read_chunks(lines, chunk_size):
+    """Lists of (line number, text) for the non-blank input lines"""
+    chunk = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append((number, line))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def batch_solve(lines, output, workers=None, engine='Two-Phase', metric='HTM',
+                time_limit=1.0, chunk_size=32, results=None, table_dir=TABLE_DIR):
+    """Solve a stream of input lines in a process pool, writing JSON lines in
+    input order. At most a few chunks per worker are in flight, so memory stays
+    bounded however long the input is. Solves are also logged to `results`
+    (a ResultsStore) when given. Returns the run summary."""
+    workers = workers or os.cpu_count() or 1
+    window = workers * 4
+    summary = {'jobs': 0, 'solved': 0, 'failed': 0, 'moves': 0}
+    start = time.perf_counter()
+
+    def write(chunk, chunk_results):
+        logged = {}
+        for (number, line), result in zip(chunk, chunk_results):
+            summary['jobs'] += 1
+            if 'error' in result:
+                summary['failed'] += 1
+            else:
+                summary['solved'] += 1
+                summary['moves'] += result['length']
+                # scramble depth is unknown (0) for facelet input
+                depth = 0 if 'facelets' in line_to_job(line) else len(line.split())
+                logged.setdefault(result['engine'], []).append(
+                    (depth, result['length'], result['seconds'], result['verified']))
+            output.write(json.dumps(dict(line=number, input=line, **result)) + '\n')
+        if results is not None:
+            for solver, rows in logged.items():
+                depths, lengths, seconds, verified = zip(*rows)
+                results.append_many(solver, depths, lengths, seconds, verified)
+
+    with ProcessPoolExecutor(workers, initializer=partial(init_solve_worker, table_dir=table_dir),
+                             initargs=(engine, metric, time_limit)) as pool:
+        in_flight = deque()
+        for chunk in read_chunks(lines, chunk_size):
+            jobs = [line_to_job(line) for _, line in chunk]
+            in_flight.append((chunk, pool.submit(solve_jobs, jobs)))
+            if len(in_flight) >= window:
+                chunk, future = in_flight.popleft()
+                write(chunk, future.result())
+        while in_flight:
+            chunk, future = in_flight.popleft()
+            write(chunk, future.result())
+    output.flush()
+
+    elapsed = time.perf_counter() - start
+    summary.update(
+        seconds=round(elapsed, 3),
+        jobs_per_second=round(summary['jobs'] / max(elapsed, 1e-9), 2),
+        mean_length=round(summary['moves'] / max(1, summary['solved']), 2),
+        metric=metric, workers=workers)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rubik's cube solver tables and batch solving")
+    parser.add_argument('--build-tables', action='store_true',
+                        help='build the two-phase tables and the pattern databases')
+    parser.add_argument('--batch', metavar='FILE',
+                        help="solve every line of FILE ('-' for stdin): a scramble "
+                             "or a 54-letter facelet string")
+    parser.add_argument('--output', metavar='FILE', default='-',
+                        help="JSON lines destination ('-' for stdout)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--engine', choices=ENGINES, default='Two-Phase')
+    parser.add_argument('--metric', choices=METRICS, default='HTM')
+    parser.add_argument('--time-limit', type=float, default=1.0,
+                        help='seconds per solve for the two-phase engine')
+    parser.add_argument('--chunk-size', type=int, default=32)
+    parser.add_argument('--log-results', action='store_true',
+                        help='also log every solve to the results store read by RubiksCubeGraphs')
+    args = parser.parse_args()
+
+    if args.build_tables:
+        TwoPhaseSolver().build()
+        PatternDatabases().build()
+    elif args.batch:
+        source = sys.stdin if args.batch == '-' else open(args.batch)
+        output = sys.stdout if args.output == '-' else open(args.output, 'w')
+        try:
+            summary = batch_solve(source, output, args.workers, args.engine, args.metric,
+                                  args.time_limit, args.chunk_size,
+                                  ResultsStore() if args.log_results else None)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+        print(json.dumps(summary), file=sys.stderr)
+    else:
+        parser.print_usage()
+
+
+if __name__ == "__main__":
+    main()
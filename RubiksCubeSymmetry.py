@@ -0,0 +1,272 @@
+import numpy as np
+from itertools import permutations, product
+from RubiksCubeEngine import (NUM_STICKERS, MOVES, apply_moves, solved_state, invert_moves,
+                              sticker_positions)
+from RubiksCubeEncoding import (CORNER_FACELETS, CORNER_COLORS, EDGE_FACELETS, EDGE_COLORS,
+                                N_EDGE_COORD, KeyTable, stickers_to_cubies_batch,
+                                cubies_to_stickers_batch, encode_batch,
+                                encode_cubies_batch, decode_cubies_batch)
+
+# ===== STICKER GEOMETRY =====
+
+# Outward normal of every face (x: L->R, y: D->U, z: B->F)
+FACE_NORMALS = np.array([
+    [0, 1, 0], [0, -1, 0], [-1, 0, 0], [1, 0, 0], [0, 0, 1], [0, 0, -1],
+])
+
+
+# (54, 3) integer centre of every sticker (faces sit at +-3, cubies at -2/0/2),
+# the 3x3 case of the engine's NxN geometry
+STICKER_POSITIONS = sticker_positions(3)
+_POSITION_INDEX = {tuple(p): i for i, p in enumerate(STICKER_POSITIONS)}
+
+
+# ===== SYMMETRY TABLES =====
+
+def symmetry_matrices():
+    """The 48 signed permutation matrices, identity first"""
+    matrices = []
+    for perm in permutations(range(3)):
+        for signs in product((1, -1), repeat=3):
+            matrix = np.zeros((3, 3), dtype=int)
+            matrix[range(3), perm] = signs
+            matrices.append(matrix)
+    matrices.sort(key=lambda m: not np.array_equal(m, np.eye(3, dtype=int)))
+    return matrices
+
+
+def build_symmetry_tables():
+    """Sticker gather indices, colour maps and move maps of all 48 symmetries.
+
+    A symmetry k turns state s into COLOR_MAP[k][s[STICKER_MAP[k]]], i.e. the
+    cube is rotated/reflected and recoloured so that the solved cube is fixed.
+    Moves conjugate as T(apply(s, m)) == apply(T(s), MOVE_MAP[k][m]).
+    """
+    matrices = symmetry_matrices()
+    sticker_map = np.empty((len(matrices), NUM_STICKERS), dtype=np.intp)
+    color_map = np.empty((len(matrices), 6), dtype=np.uint8)
+    for k, matrix in enumerate(matrices):
+        destination = [_POSITION_INDEX[tuple(matrix @ p)] for p in STICKER_POSITIONS]
+        sticker_map[k] = np.argsort(destination)
+        for face, normal in enumerate(FACE_NORMALS):
+            moved = matrix @ normal
+            color_map[k, face] = next(f for f, n in enumerate(FACE_NORMALS)
+                                      if np.array_equal(n, moved))
+
+    # Identify every conjugated move by its action on a few random states
+    rng = np.random.default_rng(0)
+    probes = [apply_moves(solved_state(), [MOVES[i] for i in rng.integers(0, 18, 25)])
+              for _ in range(3)]
+    move_map = np.empty((len(matrices), len(MOVES)), dtype=np.intp)
+    for k in range(len(matrices)):
+        def transform(s):
+            return color_map[k][s[sticker_map[k]]]
+        for m, move in enumerate(MOVES):
+            targets = [transform(apply_moves(p, [move])) for p in probes]
+            move_map[k, m] = next(
+                c for c, candidate in enumerate(MOVES)
+                if all(np.array_equal(apply_moves(transform(p), [candidate]), t)
+                       for p, t in zip(probes, targets)))
+
+    inverse = np.array([next(j for j, other in enumerate(matrices)
+                             if np.array_equal(other @ matrix, np.eye(3, dtype=int)))
+                        for matrix in matrices])
+    determinant = np.array([int(round(np.linalg.det(m))) for m in matrices])
+    return sticker_map, color_map, move_map, inverse, determinant
+
+
+SYM_STICKER_MAP, SYM_COLOR_MAP, SYM_MOVE_MAP, SYM_INVERSE, SYM_DETERMINANT = \
+    build_symmetry_tables()
+NUM_SYMMETRIES = len(SYM_STICKER_MAP)
+ROTATIONS = np.flatnonzero(SYM_DETERMINANT == 1)      # the 24 proper rotations
+
+
+def transform_state(state, sym):
+    """State seen through symmetry `sym`"""
+    return SYM_COLOR_MAP[sym][np.asarray(state)[SYM_STICKER_MAP[sym]]]
+
+
+def symmetric_states(state):
+    """(48, 54) batch of every symmetric image of a single state"""
+    gathered = np.asarray(state)[SYM_STICKER_MAP]
+    return SYM_COLOR_MAP[np.arange(NUM_SYMMETRIES)[:, None], gathered]
+
+
+def transform_moves(moves, sym):
+    """Move sequence conjugated by symmetry `sym`"""
+    return [MOVES[SYM_MOVE_MAP[sym][MOVES.index(m)]] for m in moves]
+
+
+def invert_state_batch(states):
+    """Group inverse of every state: if solved + X gives s, solved + X' gives s^-1"""
+    cp, co, ep, eo = [a.astype(np.intp) for a in stickers_to_cubies_batch(states)]
+    rows = np.arange(len(cp))[:, None]
+    inv_cp, inv_co = np.empty_like(cp), np.empty_like(co)
+    inv_ep, inv_eo = np.empty_like(ep), np.empty_like(eo)
+    inv_cp[rows, cp] = np.arange(8)
+    inv_co[rows, cp] = (-co) % 3
+    inv_ep[rows, ep] = np.arange(12)
+    inv_eo[rows, ep] = eo
+    return cubies_to_stickers_batch(inv_cp, inv_co, inv_ep, inv_eo)
+
+
+# ===== CANONICAL FORM =====
+
+def canonical_form(state, use_inverse=True):
+    """(key, sym, inverted) of the smallest packed key among the state's
+    symmetric images (and those of its inverse when use_inverse is set)"""
+    images = symmetric_states(state)
+    if use_inverse:
+        images = np.concatenate([images, symmetric_states(invert_state_batch(
+            np.asarray(state)[None])[0])])
+    keys = encode_batch(images)
+    best = int(np.lexsort((keys[:, 1], keys[:, 0]))[0])
+    key = int(keys[best, 0]) * N_EDGE_COORD + int(keys[best, 1])
+    return key, best % NUM_SYMMETRIES, best >= NUM_SYMMETRIES
+
+
+def to_canonical_solution(solution, sym, inverted):
+    """Express a solution of the original state in the canonical frame"""
+    if inverted:
+        solution = invert_moves(solution)
+    return transform_moves(solution, sym)
+
+
+def from_canonical_solution(solution, sym, inverted):
+    """Translate a canonical-frame solution back to the original state"""
+    solution = transform_moves(solution, SYM_INVERSE[sym])
+    return invert_moves(solution) if inverted else solution
+
+
+# ===== SYMMETRY REDUCTION =====
+
+def build_cubie_conjugation(facelets, colors):
+    """Cubie-level form of every symmetry for one cubie type.
+
+    With base = len(colors[0]), a cubie c in slot i with orientation o moves to
+    slot SLOT[k][i] as cubie CUBIE[k][c] with orientation
+    (sign * o + SLOT_TWIST[k][i] - CUBIE_TWIST[k][c]) % base, where sign is -1
+    for reflections (they reverse the clockwise order of a corner's stickers).
+    """
+    n = len(facelets)
+    slot_lookup = {frozenset(f): j for j, f in enumerate(facelets.tolist())}
+    cubie_lookup = {frozenset(c): j for j, c in enumerate(colors.tolist())}
+    slot_map = np.empty((NUM_SYMMETRIES, n), dtype=np.intp)
+    slot_twist = np.empty((NUM_SYMMETRIES, n), dtype=np.intp)
+    cubie_map = np.empty((NUM_SYMMETRIES, n), dtype=np.intp)
+    cubie_twist = np.empty((NUM_SYMMETRIES, n), dtype=np.intp)
+    for k in range(NUM_SYMMETRIES):
+        destination = np.argsort(SYM_STICKER_MAP[k])
+        for i in range(n):
+            moved = destination[facelets[i]]
+            j = slot_lookup[frozenset(moved.tolist())]
+            slot_map[k, i] = j
+            slot_twist[k, i] = list(facelets[j]).index(moved[0])
+            recoloured = SYM_COLOR_MAP[k][colors[i]]
+            c = cubie_lookup[frozenset(recoloured.tolist())]
+            cubie_map[k, i] = c
+            cubie_twist[k, i] = list(colors[c]).index(recoloured[0])
+    return slot_map, slot_twist, cubie_map, cubie_twist
+
+
+CORNER_CONJUGATION = build_cubie_conjugation(CORNER_FACELETS, CORNER_COLORS)
+EDGE_CONJUGATION = build_cubie_conjugation(EDGE_FACELETS, EDGE_COLORS)
+_SYM_SIGN = SYM_DETERMINANT.astype(np.intp)
+
+
+def _conjugate(perm, ori, tables, syms, base):
+    slot_map, slot_twist, cubie_map, cubie_twist = (t[syms] for t in tables)
+    perm = np.asarray(perm, dtype=np.intp)[:, None, :]               # (N, 1, n)
+    ori = np.asarray(ori, dtype=np.intp)[:, None, :]
+    rows = np.arange(len(syms))[:, None]
+    cubies = cubie_map[rows, perm]                                   # (N, S, n)
+    twists = (_SYM_SIGN[syms][:, None] * ori + slot_twist - cubie_twist[rows, perm]) % base
+    new_perm = np.empty_like(cubies)
+    new_ori = np.empty_like(twists)
+    index = np.indices(cubies.shape)
+    new_perm[index[0], index[1], slot_map] = cubies
+    new_ori[index[0], index[1], slot_map] = twists
+    return new_perm, new_ori
+
+
+def conjugate_cubies_batch(cp, co, ep, eo, syms=None):
+    """Cubie arrays of every state under every symmetry: shapes (N, S, 8|12)"""
+    syms = np.arange(NUM_SYMMETRIES) if syms is None else np.asarray(syms)
+    new_cp, new_co = _conjugate(cp, co, CORNER_CONJUGATION, syms, 3)
+    new_ep, new_eo = _conjugate(ep, eo, EDGE_CONJUGATION, syms, 2)
+    return new_cp, new_co, new_ep, new_eo
+
+
+def _classify_cubies(cubies, syms, chunk):
+    count = len(cubies[0])
+    representatives = np.empty((count, 2), dtype=np.uint64)
+    chosen = np.empty(count, dtype=np.intp)
+    for start in range(0, count, chunk):
+        part = [a[start:start + chunk] for a in cubies]
+        images = conjugate_cubies_batch(*part, syms=syms)
+        size = len(part[0])
+        keys = encode_cubies_batch(*(a.reshape(size * len(syms), -1) for a in images))
+        keys = keys.reshape(size, len(syms), 2)
+        # lexicographic minimum over the symmetry axis
+        corner_min = keys[:, :, 0].min(axis=1, keepdims=True)
+        edge = np.where(keys[:, :, 0] == corner_min, keys[:, :, 1], np.uint64(2 ** 63))
+        best = edge.argmin(axis=1)
+        representatives[start:start + size] = keys[np.arange(size), best]
+        chosen[start:start + size] = syms[best]
+    return representatives, chosen
+
+
+def classify_batch(states, syms=None, chunk=4096):
+    """Class representative key (N, 2) and symmetry index (N,) of a sticker batch.
+
+    The representative is transform_state(states[i], sym[i]); pass `syms` (e.g.
+    ROTATIONS) to reduce by a subgroup instead of all 48 symmetries.
+    """
+    syms = np.arange(NUM_SYMMETRIES) if syms is None else np.asarray(syms)
+    return _classify_cubies(stickers_to_cubies_batch(states), syms, chunk)
+
+
+def classify_keys_batch(keys, syms=None, chunk=4096):
+    """Same as classify_batch, starting from (N, 2) packed keys"""
+    syms = np.arange(NUM_SYMMETRIES) if syms is None else np.asarray(syms)
+    return _classify_cubies(decode_cubies_batch(keys), syms, chunk)
+
+
+def class_representative(state, syms=None):
+    """(packed key, symmetry index) of a single state's class representative"""
+    keys, chosen = classify_batch(np.asarray(state)[None], syms)
+    return int(keys[0, 0]) * N_EDGE_COORD + int(keys[0, 1]), int(chosen[0])
+
+
+class SymmetryReducedTable:
+    """Position table that stores one value per symmetry class.
+
+    Lookups classify the whole query batch and resolve the representatives
+    through a KeyTable, so every symmetric variant shares a single entry.
+    """
+
+    def __init__(self, capacity, syms=None, dtype=np.int16):
+        self.syms = np.arange(NUM_SYMMETRIES) if syms is None else np.asarray(syms)
+        self.index = KeyTable(capacity)
+        self.values = np.empty(capacity, dtype=dtype)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.index.count
+
+    def insert(self, states, values):
+        """Store values; states in the same class keep the first value seen"""
+        keys, _ = classify_batch(states, self.syms)
+        keys, first = np.unique(keys, axis=0, return_index=True)
+        # refuse the whole batch before touching the index, so a full table stays usable
+        if self.index.count + int((self.index.get(keys) < 0).sum()) > self.capacity:
+            raise ValueError("symmetry-reduced table is full")
+        ids, inserted = self.index.get_or_insert(keys)
+        self.values[ids[inserted]] = np.asarray(values)[first[inserted]]
+
+    def lookup(self, states, default=-1):
+        keys, _ = classify_batch(states, self.syms)
+        ids = self.index.get(keys)
+        out = np.full(len(ids), default, dtype=self.values.dtype)
+        out[ids >= 0] = self.values[ids[ids >= 0]]
+        return out
@@ -0,0 +1,137 @@
+import os
+import time
+import socket
+import struct
+import tempfile
+import numpy as np
+
+# ===== LIVE TELEMETRY =====
+# Solver processes publish one small datagram per solve to a Unix datagram
+# socket; the dashboard's live mode binds that socket and drains it. The
+# kernel's socket buffer is the queue between them: publishing is a single
+# non-blocking sendto, and when the buffer is full the event is dropped and
+# counted instead of waiting. Events nobody is listening for are counted
+# apart, so the dropped count only measures a listener falling behind.
+#
+# Unix datagram sockets do not exist on Windows; there TELEMETRY_AVAILABLE is
+# False, solvers publish nothing and the dashboard has no live mode.
+
+TELEMETRY_AVAILABLE = hasattr(socket, 'AF_UNIX') and hasattr(os, 'getuid')
+TELEMETRY_SOCKET = (os.path.join(tempfile.gettempdir(), f'rubiks-telemetry-{os.getuid()}.sock')
+                    if TELEMETRY_AVAILABLE else None)
+
+# timestamp, pid, events dropped so far by this publisher, scramble depth,
+# solution moves, latency, solved, solver name
+EVENT = struct.Struct('<dIIHHf?15s')
+
+EVENT_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('pid', '<u4'),
+    ('dropped', '<u4'),
+    ('depth', '<u2'),
+    ('moves', '<u2'),
+    ('seconds', '<f4'),
+    ('solved', '?'),
+    ('solver', 'S15'),
+])
+assert EVENT_DTYPE.itemsize == EVENT.size
+
+
+class TelemetryPublisher:
+    """Fire-and-forget per-solve events; never blocks the caller"""
+
+    def __init__(self, path=TELEMETRY_SOCKET):
+        self.path = path
+        self.pid = os.getpid()
+        self.sent = 0
+        self.dropped = 0                # buffer full: the listener fell behind
+        self.unheard = 0                # no listener bound to the socket
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+    def publish(self, solver, depth, moves, seconds, solved=True):
+        event = EVENT.pack(time.time(), self.pid, self.dropped & 0xFFFFFFFF,
+                           min(depth, 0xFFFF), min(moves, 0xFFFF), seconds, solved,
+                           solver.encode()[:15])
+        try:
+            self.sock.sendto(event, self.path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # no listener, or the listener went away
+            self.unheard += 1
+            return False
+        except OSError:
+            self.dropped += 1
+            return False
+        self.sent += 1
+        return True
+
+    def close(self):
+        self.sock.close()
+
+
+class TelemetryListener:
+    """Binds the telemetry socket and keeps the latest events in a ring buffer.
+
+    poll() drains whatever has arrived without blocking. Publishers report
+    how many events they had to drop, so `dropped` covers events lost while
+    this listener was behind.
+    """
+
+    def __init__(self, path=TELEMETRY_SOCKET, capacity=4096, recv_buffer=1 << 20):
+        self.path = path
+        self.ring = np.zeros(capacity, dtype=EVENT_DTYPE)
+        self.received = 0
+        self.publisher_drops = {}
+        self.started = time.time()
+
+        if os.path.exists(path):
+            os.unlink(path)                       # stale socket of a previous listener
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer)
+        self.sock.bind(path)
+        self.sock.setblocking(False)
+
+    def poll(self, max_events=4096):
+        """Read pending events into the ring; returns how many arrived"""
+        capacity = len(self.ring)
+        view = self.ring.view(np.uint8).reshape(capacity, EVENT.size)
+        count = 0
+        while count < max_events:
+            try:
+                nbytes = self.sock.recv_into(view[self.received % capacity])
+            except BlockingIOError:
+                break
+            if nbytes != EVENT.size:
+                continue
+            event = self.ring[self.received % capacity]
+            self.publisher_drops[int(event['pid'])] = int(event['dropped'])
+            self.received += 1
+            count += 1
+        return count
+
+    @property
+    def dropped(self):
+        return sum(self.publisher_drops.values())
+
+    def recent(self, n=None):
+        """The last n events (all buffered events by default), oldest first"""
+        capacity = len(self.ring)
+        n = min(n or capacity, self.received, capacity)
+        end = self.received % capacity
+        if n <= end:
+            return self.ring[end - n:end]
+        return np.concatenate([self.ring[capacity - (n - end):], self.ring[:end]])
+
+    def rate(self, window=5.0):
+        """Events per second over the last `window` seconds"""
+        events = self.recent()
+        if len(events) == 0:
+            return 0.0
+        now = time.time()
+        span = min(window, now - self.started)
+        return float((events['timestamp'] >= now - window).sum()) / max(span, 1e-9)
+
+    def close(self):
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
@@ -0,0 +1,445 @@
+import os
+import json
+import time
+import queue
+import argparse
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from RubiksCubeEngine import (NUM_STICKERS, QUARTER_MOVES, MOVE_TABLE, solved_state,
+                              apply_move_batch, is_solved_batch, normalize_moves, move_count)
+from RubiksCubeResults import ResultsStore
+
+
+# ===== CURRICULUM =====
+
+class CurriculumSchedule:
+    """Scramble-depth distribution that deepens as training goes on.
+
+    At a given epoch depths are drawn uniformly from 1..max_depth(epoch), where
+    max_depth ramps linearly from start_depth to end_depth over ramp_epochs.
+    """
+
+    def __init__(self, start_depth=5, end_depth=30, ramp_epochs=50):
+        self.start_depth = start_depth
+        self.end_depth = end_depth
+        self.ramp_epochs = ramp_epochs
+
+    def max_depth(self, epoch):
+        progress = min(1.0, epoch / max(1, self.ramp_epochs))
+        return int(round(self.start_depth + progress * (self.end_depth - self.start_depth)))
+
+    def sample(self, rng, count, epoch):
+        return rng.integers(1, self.max_depth(epoch) + 1, size=count).astype(np.uint8)
+
+
+def scramble_batch(depths, rng, num_moves=len(QUARTER_MOVES), moves=None):
+    """(N, 54) states, each scrambled by its own number of random moves, or
+    by the first depths[i] entries of row i of a given (N, max depth) moves"""
+    states = np.tile(solved_state(), (len(depths), 1))
+    for step in range(int(depths.max(initial=0))):
+        active = np.flatnonzero(depths > step)
+        step_moves = rng.integers(0, num_moves, size=len(active)) if moves is None \
+            else moves[active, step]
+        states[active] = apply_move_batch(states[active], step_moves)
+    return states
+
+
+def reduced_lengths(moves, depths):
+    """QTM length of every scramble after cancelling redundant moves: an upper
+    bound on the distance to solved that is close to exact at shallow depths"""
+    return np.array([move_count(normalize_moves([QUARTER_MOVES[m] for m in row[:d]], 'QTM'),
+                                'QTM') for row, d in zip(moves.tolist(), depths.tolist())])
+
+
+# ===== SHARED-MEMORY GENERATOR =====
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _worker(worker_id, seed, schedule, batch_size, num_slots, states_name, depths_name,
+            free_slots, ready_slots, epoch):
+    """Fill free slots with fresh batches until told to stop (slot None)"""
+    rng = np.random.default_rng([seed, worker_id])
+    states_shm, states = _attach(states_name, (num_slots, batch_size, NUM_STICKERS), np.uint8)
+    depths_shm, depths = _attach(depths_name, (num_slots, batch_size), np.uint8)
+    try:
+        while True:
+            slot = free_slots.get()
+            if slot is None:
+                break
+            current = epoch.value
+            depths[slot] = schedule.sample(rng, batch_size, current)
+            states[slot] = scramble_batch(depths[slot], rng)
+            ready_slots.put((slot, current))
+    finally:
+        del states, depths
+        states_shm.close()
+        depths_shm.close()
+
+
+class ScrambleDataGenerator:
+    """Streams (states, depths) training batches produced by worker processes.
+
+    Workers write straight into a ring of shared-memory slots; the consumer
+    gets NumPy views of a filled slot, and the slot is handed back to the
+    workers when the next batch is requested. The main process never builds
+    per-state Python objects. num_workers=0 generates in-process instead.
+    """
+
+    def __init__(self, batch_size=10000, num_workers=None, num_slots=None,
+                 schedule=None, seed=0):
+        self.batch_size = batch_size
+        self.num_workers = max(1, (os.cpu_count() or 2) - 1) if num_workers is None \
+            else num_workers
+        self.num_slots = num_slots or max(2, 2 * self.num_workers)
+        self.schedule = schedule or CurriculumSchedule()
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.epoch = mp.Value('i', 0)
+        self.workers = []
+        self._held = None
+
+    def set_epoch(self, epoch):
+        """Batches produced from now on follow this epoch of the curriculum"""
+        self.epoch.value = epoch
+
+    def start(self):
+        if self.num_workers == 0 or self.workers:
+            return self
+        shape = (self.num_slots, self.batch_size)
+        self._states_shm = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(shape)) * NUM_STICKERS)
+        self._depths_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self.states = np.ndarray(shape + (NUM_STICKERS,), dtype=np.uint8,
+                                 buffer=self._states_shm.buf)
+        self.depths = np.ndarray(shape, dtype=np.uint8, buffer=self._depths_shm.buf)
+
+        self.free_slots = mp.Queue()
+        self.ready_slots = mp.Queue()
+        for slot in range(self.num_slots):
+            self.free_slots.put(slot)
+        for worker_id in range(self.num_workers):
+            process = mp.Process(target=_worker, daemon=True, args=(
+                worker_id, self.seed, self.schedule, self.batch_size, self.num_slots,
+                self._states_shm.name, self._depths_shm.name,
+                self.free_slots, self.ready_slots, self.epoch))
+            process.start()
+            self.workers.append(process)
+        return self
+
+    def next_batch(self, timeout=60):
+        """(states, depths) arrays valid until the following call"""
+        if self.num_workers == 0:
+            depths = self.schedule.sample(self.rng, self.batch_size, self.epoch.value)
+            return scramble_batch(depths, self.rng), depths
+        if not self.workers:
+            self.start()
+        if self._held is not None:
+            self.free_slots.put(self._held)
+            self._held = None
+        deadline = time.monotonic() + timeout
+        while self._held is None:
+            try:
+                slot, epoch = self.ready_slots.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise RuntimeError("training data workers stopped producing batches")
+            if epoch == self.epoch.value:
+                self._held = slot
+            else:
+                # filled before set_epoch(): refill it at the current curriculum
+                self.free_slots.put(slot)
+        return self.states[self._held], self.depths[self._held]
+
+    def __iter__(self):
+        while True:
+            yield self.next_batch()
+
+    def stop(self):
+        if not self.workers:
+            return
+        for _ in self.workers:
+            self.free_slots.put(None)
+        for process in self.workers:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.workers = []
+        self._held = None
+        del self.states, self.depths
+        for shm in (self._states_shm, self._depths_shm):
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ===== VALUE NETWORK =====
+
+RUNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runs')
+CHECKPOINT_PATH = os.path.join(RUNS_DIR, 'value_network.npz')
+METRICS_PATH = os.path.join(RUNS_DIR, 'training_metrics.json')
+
+# Centre stickers never move, so only the other 48 are fed to the network
+_FEATURE_STICKERS = np.array([i for i in range(NUM_STICKERS) if i % 9 != 4])
+NUM_FEATURES = len(_FEATURE_STICKERS) * 6
+
+
+def one_hot(states):
+    """(N, 288) float32 one-hot encoding of the 48 movable stickers"""
+    stickers = np.asarray(states)[:, _FEATURE_STICKERS]
+    return (stickers[:, :, None] == np.arange(6, dtype=np.uint8)).reshape(
+        len(stickers), -1).astype(np.float32)
+
+
+class ValueNetwork:
+    """Fully connected ReLU network estimating cost-to-go from sticker states"""
+
+    def __init__(self, hidden=(512, 256), seed=0):
+        rng = np.random.default_rng(seed)
+        sizes = [NUM_FEATURES, *hidden, 1]
+        self.params = {}
+        for i, (n_in, n_out) in enumerate(zip(sizes[:-1], sizes[1:])):
+            self.params[f'W{i}'] = (rng.standard_normal((n_in, n_out)) *
+                                    np.sqrt(2.0 / n_in)).astype(np.float32)
+            self.params[f'b{i}'] = np.zeros(n_out, dtype=np.float32)
+        self.num_layers = len(sizes) - 1
+        self.adam_m = {k: np.zeros_like(v) for k, v in self.params.items()}
+        self.adam_v = {k: np.zeros_like(v) for k, v in self.params.items()}
+        self.step = 0
+
+    def forward(self, x, keep=False):
+        activations = [x]
+        for i in range(self.num_layers):
+            x = x @ self.params[f'W{i}'] + self.params[f'b{i}']
+            if i < self.num_layers - 1:
+                np.maximum(x, 0, out=x)
+            if keep:
+                activations.append(x)
+        return (x[:, 0], activations) if keep else x[:, 0]
+
+    def predict(self, states, chunk=65536):
+        """Cost-to-go for a (N, 54) batch; usable directly as a search heuristic"""
+        states = np.asarray(states)
+        out = np.empty(len(states), dtype=np.float32)
+        for i in range(0, len(states), chunk):
+            out[i:i + chunk] = self.forward(one_hot(states[i:i + chunk]))
+        return out
+
+    __call__ = predict
+
+    def train_step(self, x, targets, learning_rate=1e-3, beta1=0.9, beta2=0.999, eps=1e-8):
+        """One Adam step on mean squared error; returns the loss"""
+        predictions, activations = self.forward(x, keep=True)
+        error = predictions - targets
+        grad = (2.0 / len(x)) * error[:, None].astype(np.float32)
+
+        grads = {}
+        for i in range(self.num_layers - 1, -1, -1):
+            grads[f'W{i}'] = activations[i].T @ grad
+            grads[f'b{i}'] = grad.sum(axis=0)
+            if i > 0:
+                grad = (grad @ self.params[f'W{i}'].T) * (activations[i] > 0)
+
+        self.step += 1
+        correction1 = 1 - beta1 ** self.step
+        correction2 = 1 - beta2 ** self.step
+        for key, g in grads.items():
+            self.adam_m[key] = beta1 * self.adam_m[key] + (1 - beta1) * g
+            self.adam_v[key] = beta2 * self.adam_v[key] + (1 - beta2) * g * g
+            self.params[key] -= learning_rate * (self.adam_m[key] / correction1) / \
+                (np.sqrt(self.adam_v[key] / correction2) + eps)
+        return float(np.mean(error ** 2))
+
+    def copy(self):
+        clone = ValueNetwork.__new__(ValueNetwork)
+        clone.params = {k: v.copy() for k, v in self.params.items()}
+        clone.num_layers = self.num_layers
+        return clone
+
+    def save(self, path, **extra):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        arrays = dict(self.params)
+        arrays.update({f'adam_m_{k}': v for k, v in self.adam_m.items()})
+        arrays.update({f'adam_v_{k}': v for k, v in self.adam_v.items()})
+        # write then rename so an interrupted save never corrupts the checkpoint
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, step=self.step, **arrays, **extra)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        network = cls.__new__(cls)
+        network.params = {k: data[k] for k in data.files if k[0] in 'Wb'}
+        network.num_layers = len(network.params) // 2
+        network.adam_m = {k: data[f'adam_m_{k}'] for k in network.params}
+        network.adam_v = {k: data[f'adam_v_{k}'] for k in network.params}
+        network.step = int(data['step'])
+        network.epoch = int(data['epoch']) if 'epoch' in data.files else 0
+        return network
+
+
+# ===== DEEP APPROXIMATE VALUE ITERATION =====
+
+_CHILD_MOVES = np.arange(len(QUARTER_MOVES))
+
+
+def bellman_targets(network, states):
+    """min over the 12 children of 1 + V(child), with V(solved) = 0"""
+    children = states[:, MOVE_TABLE[_CHILD_MOVES]].reshape(-1, NUM_STICKERS)
+    values = network.predict(children)
+    values[is_solved_batch(children)] = 0.0
+    targets = (1.0 + values.reshape(len(states), -1)).min(axis=1)
+    targets[is_solved_batch(states)] = 0.0
+    return targets
+
+
+def greedy_rollout(network, states, max_steps):
+    """Follow the network's best child for every cube at once.
+
+    Returns (solved mask, moves used) per cube.
+    """
+    states = states.copy()
+    moves_used = np.zeros(len(states), dtype=np.int32)
+    solved = is_solved_batch(states)
+    for _ in range(max_steps):
+        active = np.flatnonzero(~solved)
+        if len(active) == 0:
+            break
+        children = states[active][:, MOVE_TABLE[_CHILD_MOVES]]
+        flat = children.reshape(-1, NUM_STICKERS)
+        values = network.predict(flat)
+        values[is_solved_batch(flat)] = -1.0
+        best = values.reshape(len(active), -1).argmin(axis=1)
+        states[active] = children[np.arange(len(active)), best]
+        moves_used[active] += 1
+        solved[active] = is_solved_batch(states[active])
+    return solved, moves_used
+
+
+def load_training_metrics(path=METRICS_PATH):
+    """Per-epoch metrics written by ValueIterationTrainer, or None"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return {key: np.array(values) for key, values in json.load(f).items()}
+
+
+class ValueIterationTrainer:
+    """CPU-only deep approximate value iteration for the cost-to-go network.
+
+    Every epoch the target network is frozen, `updates_per_epoch` batches
+    from the curriculum generator are regressed onto their Bellman targets,
+    and loss / accuracy / solve rate / average moves are appended to the
+    metrics file the analysis dashboard reads. The evaluation rollouts are
+    also logged per cube to `results` (a ResultsStore) when one is given. A
+    checkpoint is written after every epoch and training resumes from it.
+    """
+
+    def __init__(self, batch_size=5000, updates_per_epoch=50, learning_rate=1e-3,
+                 schedule=None, num_workers=None, eval_size=500, hidden=(512, 256),
+                 checkpoint_path=CHECKPOINT_PATH, metrics_path=METRICS_PATH, seed=0,
+                 results=None):
+        self.batch_size = batch_size
+        self.updates_per_epoch = updates_per_epoch
+        self.learning_rate = learning_rate
+        self.schedule = schedule or CurriculumSchedule()
+        self.num_workers = num_workers
+        self.eval_size = eval_size
+        self.checkpoint_path = checkpoint_path
+        self.metrics_path = metrics_path
+        self.results = results
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+
+        if os.path.exists(checkpoint_path):
+            self.network = ValueNetwork.load(checkpoint_path)
+            self.start_epoch = self.network.epoch + 1
+        else:
+            self.network = ValueNetwork(hidden, seed=seed)
+            self.start_epoch = 0
+        metrics = load_training_metrics(metrics_path) if self.start_epoch else None
+        self.metrics = {key: values.tolist() for key, values in metrics.items()} if metrics \
+            else {'epoch': [], 'loss': [], 'accuracy': [], 'solve_rate': [], 'avg_moves': []}
+
+    def evaluate(self, epoch, loss):
+        """Accuracy: % of fresh states whose predicted cost-to-go is within one
+        move of their reduced scramble length. Solve rate / avg moves: greedy
+        rollouts at the current max depth."""
+        depth = self.schedule.max_depth(epoch)
+        depths = self.rng.integers(1, depth + 1, size=self.eval_size).astype(np.uint8)
+        moves = self.rng.integers(0, len(QUARTER_MOVES), size=(self.eval_size, depth))
+        states = scramble_batch(depths, self.rng, moves=moves)
+        error = np.abs(self.network.predict(states) - reduced_lengths(moves, depths))
+        accuracy = float((error <= 1.0).mean() * 100)
+
+        hard = scramble_batch(np.full(self.eval_size, depth, dtype=np.uint8), self.rng)
+        start = time.perf_counter()
+        solved, moves = greedy_rollout(self.network, hard, max_steps=2 * depth)
+        if self.results is not None:
+            seconds = (time.perf_counter() - start) / len(hard)
+            self.results.append_many('Value Network', np.full(len(hard), depth), moves,
+                                     np.full(len(hard), seconds), solved, epoch=epoch)
+        solve_rate = float(solved.mean() * 100)
+        avg_moves = float(moves[solved].mean()) if solved.any() else 0.0
+        return {'epoch': epoch, 'loss': loss, 'accuracy': accuracy,
+                'solve_rate': solve_rate, 'avg_moves': avg_moves}
+
+    def train(self, epochs=100, log=print):
+        generator = ScrambleDataGenerator(self.batch_size, num_workers=self.num_workers,
+                                          schedule=self.schedule, seed=self.seed)
+        try:
+            for epoch in range(self.start_epoch, epochs):
+                generator.set_epoch(epoch)
+                target_network = self.network.copy()
+                losses = []
+                for _ in range(self.updates_per_epoch):
+                    states, _ = generator.next_batch()
+                    targets = bellman_targets(target_network, states)
+                    losses.append(self.network.train_step(one_hot(states), targets,
+                                                          self.learning_rate))
+                result = self.evaluate(epoch, float(np.mean(losses)))
+                for key, value in result.items():
+                    self.metrics[key].append(value)
+                self.save_metrics()
+                self.network.save(self.checkpoint_path, epoch=epoch)
+                log(f"epoch {epoch:>3}  loss {result['loss']:.3f}  "
+                    f"acc {result['accuracy']:5.1f}%  solved {result['solve_rate']:5.1f}%  "
+                    f"moves {result['avg_moves']:.1f}")
+        finally:
+            generator.stop()
+        return self.metrics
+
+    def save_metrics(self):
+        os.makedirs(os.path.dirname(self.metrics_path), exist_ok=True)
+        tmp_path = self.metrics_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.metrics, f)
+        os.replace(tmp_path, self.metrics_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the cost-to-go value network")
+    parser.add_argument('--epochs', type=int, default=100)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--updates', type=int, default=50, help="updates per epoch")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="data generator processes (default: one per CPU but one; "
+                             "0 generates in-process)")
+    parser.add_argument('--lr', type=float, default=1e-3)
+    args = parser.parse_args()
+    trainer = ValueIterationTrainer(batch_size=args.batch_size, updates_per_epoch=args.updates,
+                                    learning_rate=args.lr, num_workers=args.workers,
+                                    results=ResultsStore())
+    trainer.train(args.epochs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+import sys
+import pytest
+
+# The modules live flat in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Depth of the pattern databases built for a fresh checkout: every state
+# within it keeps its exact distance, deeper ones get a lower bound
+TEST_PATTERN_DEPTH = 6
+
+
+@pytest.fixture(scope='session')
+def table_dir(tmp_path_factory):
+    """Solver tables: TABLE_DIR when `RubiksCubeSolver.py --build-tables` was
+    run, otherwise (or with RUBIKS_FRESH_TABLES=1) the full two-phase tables
+    and depth-limited pattern databases built into a temporary directory,
+    which takes about ten seconds"""
+    from RubiksCubeSolver import TABLE_DIR, TwoPhaseSolver, PatternDatabases
+    if not os.environ.get('RUBIKS_FRESH_TABLES') and TwoPhaseSolver().exists() \
+            and PatternDatabases().exists():
+        return TABLE_DIR
+    path = str(tmp_path_factory.mktemp('tables'))
+    TwoPhaseSolver(path).build(log=lambda *args: None)
+    PatternDatabases(path).build(log=lambda *args: None, max_depth=TEST_PATTERN_DEPTH)
+    return path
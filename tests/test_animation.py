@@ -0,0 +1,114 @@
+import time
+from RubiksCubeAnimation import Frame, AnimationScheduler
+
+
+class FakeRoot:
+    """Records root.after calls instead of running a Tk main loop"""
+
+    def __init__(self):
+        self.scheduled = []
+        self.cancelled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append((delay, callback))
+        return len(self.scheduled)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+
+def make_scheduler(interval_ms=1000):
+    rendered = []
+    scheduler = AnimationScheduler(FakeRoot(), lambda frame: rendered.append(frame.step),
+                                   interval_ms=interval_ms, budget_ms=1000)
+    return scheduler, rendered
+
+
+def frames(count):
+    return [Frame(None, 'R', step) for step in range(1, count + 1)]
+
+
+def test_one_frame_per_interval():
+    scheduler, rendered = make_scheduler()
+    scheduler.play(frames(3))
+    scheduler.tick()
+    scheduler.tick()                # the next frame is not due for a second
+    assert rendered == [1]
+    assert scheduler.root.scheduled[-1][0] > 900
+
+
+def test_late_ticks_coalesce_due_frames():
+    scheduler, rendered = make_scheduler(interval_ms=100)
+    done = []
+    scheduler.play(frames(5), done.append)
+    scheduler.next_due = time.perf_counter() - 1.0
+    scheduler.tick()
+    assert rendered == [5]
+    assert scheduler.frames_rendered == 1
+    assert scheduler.frames_coalesced == 4
+    assert done == [True]
+    assert scheduler.is_idle()
+
+
+def test_skip_jumps_to_the_last_frame():
+    scheduler, rendered = make_scheduler()
+    done = []
+    scheduler.play(frames(6), done.append)
+    scheduler.tick()
+    scheduler.skip()
+    scheduler.tick()
+    assert rendered == [1, 6]
+    assert done == [True]
+    assert not scheduler.skipping
+
+
+def test_cancel_keeps_the_last_shown_frame():
+    scheduler, rendered = make_scheduler()
+    done = []
+    scheduler.play(frames(6), done.append)
+    scheduler.tick()
+    scheduler.cancel()
+    scheduler.tick()
+    assert rendered == [1]
+    assert done == [False]
+    assert scheduler.is_idle()
+
+
+def test_callbacks_run_after_the_frames_queued_before_them():
+    scheduler, rendered = make_scheduler()
+    seen = []
+    scheduler.play(frames(2))
+    scheduler.call(lambda: seen.append(list(rendered)))
+    scheduler.next_due = time.perf_counter() - 10.0
+    scheduler.tick()
+    assert seen == [[2]]
+
+
+def test_pause_holds_frames_but_runs_callbacks():
+    scheduler, rendered = make_scheduler()
+    done, called = [], []
+    scheduler.pause()
+    scheduler.play(frames(2), done.append)
+    scheduler.call(lambda: called.append(True))
+    scheduler.tick()
+    assert called == [True]
+    assert rendered == [] and done == []
+    assert not scheduler.is_idle()
+
+    assert scheduler.toggle_pause() is False
+    scheduler.tick()
+    assert rendered == [1]
+    scheduler.next_due = time.perf_counter() - 1.0
+    scheduler.tick()
+    assert rendered == [1, 2]
+    assert done == [True]
+
+
+def test_start_and_stop():
+    scheduler, _ = make_scheduler()
+    scheduler.start()
+    scheduler.start()
+    assert len(scheduler.root.scheduled) == 1
+    scheduler.stop()
+    assert scheduler.root.cancelled == [1]
+    assert scheduler.after_id is None
@@ -0,0 +1,29 @@
+import sys
+import pytest
+from RubiksCubeBenchmark import max_rss_bytes, flatten, compare
+
+
+def test_max_rss_units(monkeypatch):
+    resource = pytest.importorskip('resource')
+    kilobytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    monkeypatch.setattr(sys, 'platform', 'linux')
+    assert max_rss_bytes() >= kilobytes * 1024
+    monkeypatch.setattr(sys, 'platform', 'darwin')
+    assert max_rss_bytes() < kilobytes * 1024
+
+
+def test_max_rss_without_the_resource_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'resource', None)
+    assert max_rss_bytes() is None
+
+
+def test_compare_flags_regressions_both_ways():
+    baseline = {'results': {'solve': {'depths': {'5': {'seconds': {'p50': 1.0}}}},
+                            'apply_move': {'batch_moves_per_second': 100.0}}}
+    current = {'results': {'solve': {'depths': {'5': {'seconds': {'p50': 1.5}}}},
+                           'apply_move': {'batch_moves_per_second': 50.0}}}
+    assert flatten(current['results']) == {'solve.depths.5.seconds.p50': 1.5,
+                                           'apply_move.batch_moves_per_second': 50.0}
+    names = [name for name, *_ in compare(baseline, current, tolerance=0.2)]
+    assert names == ['apply_move.batch_moves_per_second', 'solve.depths.5.seconds.p50']
+    assert compare(baseline, baseline) == []
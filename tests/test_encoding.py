@@ -0,0 +1,109 @@
+import random
+import numpy as np
+import pytest
+from RubiksCubeEngine import MOVES, solved_state, apply_move_batch
+from RubiksCubeEncoding import (encode_batch, decode_batch, encode_state, decode_state,
+                                state_key, key_to_state, stickers_to_cubies_batch,
+                                cubies_to_stickers_batch, KeyTable, CORNER_FACELETS,
+                                EDGE_FACELETS, state_errors, validate_state,
+                                parse_facelets, to_facelets)
+
+
+def random_states(count, depth=25, seed=0):
+    rng = np.random.default_rng(seed)
+    states = np.tile(solved_state(), (count, 1))
+    for _ in range(depth):
+        states = apply_move_batch(states, rng.integers(0, len(MOVES), size=count))
+    return states
+
+
+def test_batch_round_trip():
+    states = random_states(500)
+    assert (decode_batch(encode_batch(states)) == states).all()
+
+
+def test_cubie_round_trip():
+    states = random_states(200)
+    assert (cubies_to_stickers_batch(*stickers_to_cubies_batch(states)) == states).all()
+
+
+def test_solved_state_encodes_to_zero():
+    assert (encode_batch(solved_state()[None]) == 0).all()
+
+
+def test_single_state_round_trips():
+    state = random_states(1, seed=1)[0]
+    assert (decode_state(encode_state(state)) == state).all()
+    assert (key_to_state(state_key(state)) == state).all()
+
+
+def test_distinct_states_get_distinct_keys():
+    states = np.unique(random_states(1000, depth=3), axis=0)
+    assert len(np.unique(encode_batch(states), axis=0)) == len(states)
+
+
+def test_key_table_assigns_dense_ids():
+    keys = np.unique(encode_batch(random_states(300, depth=4)), axis=0)
+    table = KeyTable(len(keys))
+    ids, inserted = table.get_or_insert(keys)
+    assert inserted.all()
+    assert sorted(ids.tolist()) == list(range(len(keys)))
+    assert (table.get(keys) == ids).all()
+
+    again, inserted = table.get_or_insert(keys[::-1])
+    assert not inserted.any()
+    assert (again == ids[::-1]).all()
+    assert table.count == len(keys)
+
+
+def test_key_table_misses():
+    keys = encode_batch(random_states(50, seed=2))
+    table = KeyTable(10)
+    table.get_or_insert(keys[:1])
+    assert table.get(keys[:1])[0] == 0
+    rng = random.Random(3)
+    absent = np.array([[rng.getrandbits(40), rng.getrandbits(40)] for _ in range(20)],
+                      dtype=np.uint64)
+    assert (table.get(absent) == -1).all()
+
+
+# ===== STATE VALIDATION =====
+
+def test_valid_states_have_no_errors():
+    for state in random_states(20, seed=4):
+        assert state_errors(state) == []
+        assert (validate_state(state.tolist()) == state).all()
+
+
+def corrupted(facelets, order):
+    state = random_states(1, seed=5)[0]
+    state[facelets] = state[np.asarray(facelets)[order]]
+    return state
+
+
+@pytest.mark.parametrize('state, message', [
+    (corrupted(CORNER_FACELETS[0], [1, 2, 0]), 'twisted'),
+    (corrupted(EDGE_FACELETS[0], [1, 0]), 'flipped'),
+    (corrupted(np.concatenate(EDGE_FACELETS[:2]), [2, 3, 0, 1]), 'parity'),
+    (np.zeros(54, dtype=np.uint8), 'stickers of'),
+    (np.arange(54) % 7, 'colours 0-5'),
+    (np.zeros(53, dtype=np.uint8), '54 sticker'),
+])
+def test_unreachable_states_are_rejected(state, message):
+    with pytest.raises(ValueError, match=message):
+        validate_state(state)
+
+
+def test_facelets_round_trip():
+    state = random_states(1, seed=6)[0]
+    text = to_facelets(state)
+    assert len(text) == 54 and set(text) <= set('UDLRFB')
+    assert (parse_facelets(text) == state).all()
+    assert (parse_facelets(' '.join(text[i:i + 9].lower() for i in range(0, 54, 9)))
+            == state).all()
+
+
+@pytest.mark.parametrize('text', [None, 'U' * 53, 'X' * 54, 'U' * 54])
+def test_bad_facelets_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_facelets(text)
@@ -0,0 +1,189 @@
+import random
+import numpy as np
+import pytest
+from RubiksCubeEngine import (MOVES, QUARTER_MOVES, MOVE_INDEX, INVERSE_MOVES, MOVE_TABLE,
+                              solved_state, apply_move, apply_moves, is_solved,
+                              move_indices, apply_move_batch, is_solved_batch, BatchCubeEnv,
+                              normalize_moves, move_count, IDENTITY, sequence_permutation,
+                              apply_sequence, sequence_states, invert_moves,
+                              MIN_CUBE_SIZE, MAX_CUBE_SIZE, CubeModel, cube_model)
+
+
+@pytest.mark.parametrize('moves, expected', [
+    (['U', 'U'], ['U2']),
+    (['U', "U'"], []),
+    (['U2', 'U2'], []),
+    (['U', 'U2'], ["U'"]),
+    (['U', 'D', "U'"], ['D']),
+    (['D', 'U'], ['U', 'D']),
+    (['U', 'R', "R'", "U'"], []),
+    (['R', 'U', 'D', "U'", "R'"], ['R', 'D', "R'"]),
+    (['F', 'B', 'F', "B'"], ['F2']),
+])
+def test_normalize_moves(moves, expected):
+    assert normalize_moves(moves) == expected
+
+
+def test_normalize_moves_qtm_splits_half_turns():
+    assert normalize_moves(['R', 'R', "U'"], 'QTM') == ['R', 'R', "U'"]
+    assert normalize_moves(['U2', 'R'], 'QTM') == ['U', 'U', 'R']
+
+
+def test_normalize_moves_keeps_the_state():
+    rng = random.Random(0)
+    for _ in range(200):
+        moves = [rng.choice(MOVES) for _ in range(rng.randint(0, 30))]
+        normal = normalize_moves(moves)
+        assert len(normal) <= len(moves)
+        assert (apply_moves(solved_state(), normal) == apply_moves(solved_state(), moves)).all()
+        assert normalize_moves(normal) == normal
+
+
+def test_normalized_inverse_solves_the_scramble():
+    rng = random.Random(1)
+    for _ in range(50):
+        scramble = [rng.choice(MOVES) for _ in range(20)]
+        solution = normalize_moves([INVERSE_MOVES[m] for m in reversed(scramble)])
+        assert is_solved(apply_moves(apply_moves(solved_state(), scramble), solution))
+
+
+def test_move_count():
+    moves = ['R', 'U2', "F'"]
+    assert move_count(moves) == 3
+    assert move_count(moves, 'HTM') == 3
+    assert move_count(moves, 'QTM') == 4
+    assert move_count([]) == 0
+
+
+# ===== MOVE SEQUENCES =====
+
+def random_moves(rng, length):
+    return [rng.choice(MOVES) for _ in range(length)]
+
+
+def test_sequence_permutation_matches_apply_moves():
+    rng = random.Random(2)
+    state = apply_moves(solved_state(), random_moves(rng, 10))
+    for length in [0, 1, 2, 3, 7, 20, 33]:
+        moves = random_moves(rng, length)
+        assert (apply_sequence(state, moves) == apply_moves(state, moves)).all()
+    assert (sequence_permutation([]) == IDENTITY).all()
+
+
+def test_sequence_permutation_is_cached_and_read_only():
+    moves = ['R', 'U', "R'", "U'", 'F2']
+    perm = sequence_permutation(moves)
+    assert sequence_permutation(tuple(moves)) is perm
+    assert not perm.flags.writeable
+    with pytest.raises(ValueError):
+        perm[0] = 0
+    assert not sequence_permutation(['U']).flags.writeable
+    assert (sequence_permutation(['U']) == MOVE_TABLE[MOVE_INDEX['U']]).all()
+
+
+def test_sequence_permutation_composes():
+    rng = random.Random(3)
+    first, second = random_moves(rng, 9), random_moves(rng, 14)
+    combined = sequence_permutation(first)[sequence_permutation(second)]
+    assert (sequence_permutation(first + second) == combined).all()
+
+
+def test_invert_moves():
+    rng = random.Random(4)
+    moves = random_moves(rng, 25)
+    assert invert_moves([]) == []
+    assert invert_moves(['R', 'U2', "F'"]) == ['F', 'U2', "R'"]
+    assert invert_moves(invert_moves(moves)) == moves
+    assert (sequence_permutation(moves + invert_moves(moves)) == IDENTITY).all()
+
+
+def test_sequence_states():
+    rng = random.Random(5)
+    moves = random_moves(rng, 12)
+    states = sequence_states(solved_state(), moves)
+    assert states.shape == (len(moves) + 1, len(solved_state()))
+    assert states.dtype == solved_state().dtype
+    for k in range(len(moves) + 1):
+        assert (states[k] == apply_moves(solved_state(), moves[:k])).all()
+    assert sequence_states(solved_state(), []).shape == (1, len(solved_state()))
+
+
+# ===== BATCHED ENVIRONMENT =====
+
+def test_move_indices():
+    assert move_indices(['U', "R'", 'F2']).tolist() == [0, 9, 16]
+    assert move_indices(np.array([[0, 17]])).tolist() == [[0, 17]]
+
+
+def test_batch_moves_match_single_moves():
+    rng = random.Random(0)
+    states = np.stack([apply_moves(solved_state(), [rng.choice(MOVES) for _ in range(10)])
+                       for _ in range(len(MOVES))])
+    moved = apply_move_batch(states, MOVES)
+    for state, move, after in zip(states, MOVES, moved):
+        assert (after == apply_move(state, move)).all()
+    assert moved.dtype == np.uint8
+
+
+def test_is_solved_batch():
+    states = np.stack([solved_state(), apply_move(solved_state(), 'R'), solved_state()])
+    assert is_solved_batch(states).tolist() == [True, False, True]
+
+
+def test_batch_env_scramble_and_undo():
+    env = BatchCubeEnv(64, seed=0)
+    assert env.is_solved().all()
+    history = []
+    for _ in range(10):
+        moves = env.random_moves()
+        history.append(moves)
+        env.step(moves)
+    assert not env.is_solved().any()
+    assert max(m.max() for m in history) < len(QUARTER_MOVES)
+    for moves in reversed(history):
+        env.step([MOVE_INDEX[INVERSE_MOVES[MOVES[m]]] for m in moves])
+    assert env.is_solved().all()
+
+    env.scramble(5, num_moves=len(MOVES))
+    env.reset()
+    assert env.is_solved().all()
+
+
+# ===== NxN MODEL =====
+
+def test_three_by_three_model_matches_the_engine():
+    model = cube_model(3)
+    assert model.moves[:len(MOVES)] == MOVES
+    assert (model.move_table[:len(MOVES)] == MOVE_TABLE).all()
+    assert (model.solved_state() == solved_state()).all()
+
+
+@pytest.mark.parametrize('n', range(MIN_CUBE_SIZE, MAX_CUBE_SIZE + 1))
+def test_cube_model_moves(n):
+    model = cube_model(n)
+    solved = model.solved_state()
+    assert len(solved) == 6 * n * n
+    assert len(model.moves) == len(MOVES) * ((n + 1) // 2)
+    for move in model.quarter_moves():
+        perm = model.move_perms[move]
+        assert sorted(perm.tolist()) == list(range(len(solved)))
+        assert (perm != np.arange(len(solved))).any()
+        assert (model.apply_moves(solved, [move] * 4) == solved).all()
+        assert (model.apply_moves(solved, [move, model.inverse_moves[move]]) == solved).all()
+
+
+@pytest.mark.parametrize('n', [2, 4, 5])
+def test_cube_model_inverse_sequence(n):
+    model = cube_model(n)
+    rng = random.Random(n)
+    scramble = [rng.choice(model.moves) for _ in range(30)]
+    state = model.apply_moves(model.solved_state(), scramble)
+    assert (np.bincount(state, minlength=6) == n * n).all()
+    assert (model.apply_moves(state, model.invert_moves(scramble)) == model.solved_state()).all()
+    assert (model.sequence_states(model.solved_state(), scramble)[-1] == state).all()
+
+
+@pytest.mark.parametrize('n', [1, 8])
+def test_cube_model_rejects_unsupported_sizes(n):
+    with pytest.raises(ValueError):
+        CubeModel(n)
@@ -0,0 +1,116 @@
+import os
+import json
+import pytest
+from RubiksCubeResults import ResultsStore
+
+pytest.importorskip('tkinter')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from RubiksCubeGraphs import (export_views, load_view_data, data_digest, data_fingerprint,
+                              build_view, MANIFEST, EXAMPLE_DEPTH_SUMMARY, EXAMPLE_RADAR_VALUES)
+
+VIEWS = ('results', 'demo')
+
+
+def test_export_writes_files_and_manifest(tmp_path):
+    out = str(tmp_path / 'figures')
+    results = ResultsStore(str(tmp_path / 'results'))
+    status = export_views(out, VIEWS, formats=('png', 'svg'), workers=1, results=results)
+    assert status == {'results': 'written', 'demo': 'written'}
+
+    for name in VIEWS:
+        with open(os.path.join(out, f'{name}.png'), 'rb') as f:
+            assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+        with open(os.path.join(out, f'{name}.svg')) as f:
+            assert '<svg' in f.read()
+
+    with open(os.path.join(out, MANIFEST)) as f:
+        manifest = json.load(f)
+    for name in VIEWS:
+        entry = {'digest': data_digest(load_view_data(name, results)), 'dpi': 100}
+        assert manifest[name] == {'png': entry, 'svg': entry}
+
+
+def test_export_skips_unchanged_views(tmp_path):
+    out = str(tmp_path / 'figures')
+    results = ResultsStore(str(tmp_path / 'results'))
+    export_views(out, VIEWS, workers=1, results=results)
+    assert export_views(out, VIEWS, workers=1, results=results) == \
+        {'results': 'unchanged', 'demo': 'unchanged'}
+
+    # new data, a new format, a new dpi, a deleted file or force all re-render
+    results.append('Two-Phase', 5, 7, 0.01)
+    assert export_views(out, VIEWS, workers=1, results=results) == \
+        {'results': 'written', 'demo': 'written'}
+    assert export_views(out, ('demo',), formats=('pdf',), workers=1,
+                        results=results) == {'demo': 'written'}
+    assert export_views(out, ('demo',), dpi=50, workers=1, results=results) == {'demo': 'written'}
+    os.remove(os.path.join(out, 'results.png'))
+    assert export_views(out, ('results',), workers=1, results=results) == {'results': 'written'}
+    assert export_views(out, ('results',), workers=1, results=results, force=True) == \
+        {'results': 'written'}
+
+
+class RecordingCanvas(FigureCanvasAgg):
+    """An Agg canvas that records full draws and blits"""
+
+    def __init__(self, fig):
+        super().__init__(fig)
+        self.calls = []
+
+    def get_tk_widget(self):
+        return None
+
+    def draw(self):
+        self.calls.append('draw')
+        super().draw()
+
+    def blit(self, bbox=None):
+        self.calls.append('blit')
+
+
+def radar_data(values, example=False):
+    return {'values': values, 'example': example}
+
+
+def test_view_update_blits_changed_artists():
+    view = build_view('radar', radar_data(EXAMPLE_RADAR_VALUES), interactive=True)
+    canvas = RecordingCanvas(view.fig)
+    view.attach(canvas)
+    assert canvas.calls == ['draw'] and view.background is not None
+    assert all(artist.get_animated() for artist in view.artists['dynamic'])
+
+    line, bars = view.artists['line'], view.artists['bars']
+    data = radar_data([50, 60, 70, 80, 90, 40])
+    view.update(data)
+    assert canvas.calls == ['draw', 'blit']
+    assert view.artists['line'] is line and view.artists['bars'] == bars
+    assert [bar.get_width() for bar in bars] == data['values']
+    assert view.fingerprint == data_fingerprint(data)
+
+    # the example note appearing changes more than the data artists
+    view.update(radar_data([50, 60, 70, 80, 90, 40], example=True))
+    assert canvas.calls == ['draw', 'blit', 'draw']
+
+
+def test_view_update_redraws_when_limits_change():
+    data = dict(EXAMPLE_DEPTH_SUMMARY, example=False)
+    view = build_view('results', data, interactive=True)
+    canvas = RecordingCanvas(view.fig)
+    view.attach(canvas)
+    bars = view.artists['ai_bars']
+
+    view.update(dict(data, mean_length=data['mean_length'] * 10))
+    assert canvas.calls == ['draw', 'draw']
+    assert view.artists['ai_bars'] is bars
+    assert bars[0].get_height() == data['mean_length'][0] * 10
+
+
+def test_view_rebuilds_when_the_layout_changes():
+    data = dict(EXAMPLE_DEPTH_SUMMARY, example=False)
+    view = build_view('results', data)
+    bars = view.artists['ai_bars']
+    fewer = {key: value[:3] for key, value in EXAMPLE_DEPTH_SUMMARY.items()}
+    view.update(dict(fewer, example=False))
+    assert view.artists['ai_bars'] is not bars
+    assert len(view.artists['ai_bars']) == 3
+    assert not any(artist.get_animated() for artist in view.artists['dynamic'])
@@ -0,0 +1,205 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('tkinter')
+from RubiksCubeGUI import RubiksCubeGUI
+from RubiksCubeEngine import cube_model, apply_moves, solved_state
+
+
+class FakeCanvas:
+    """Hands out item ids and records fill changes instead of drawing"""
+
+    def __init__(self):
+        self.items = 0
+        self.fills = {}
+        self.configured = []
+
+    def create_rectangle(self, *coords, **options):
+        self.items += 1
+        self.fills[self.items] = options.get('fill')
+        return self.items
+
+    def create_text(self, *coords, **options):
+        self.items += 1
+        return self.items
+
+    def delete(self, *items):
+        pass
+
+    def itemconfig(self, item, **options):
+        self.configured.append(item)
+        self.fills[item] = options['fill']
+
+
+class FakeWidget:
+    """Stands in for the timeline Scale and the StringVars"""
+
+    def __init__(self, value=0):
+        self.value = value
+        self.options = {}
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def config(self, **options):
+        self.options.update(options)
+
+
+def bare_gui(n=3):
+    """A RubiksCubeGUI without a Tk window: only the drawing state"""
+    gui = RubiksCubeGUI.__new__(RubiksCubeGUI)
+    gui.cube_size = n
+    gui.model = cube_model(n)
+    gui.cube_state = gui.create_solved_state()
+    gui.colors = {face: f'colour{face}' for face in range(6)}
+    gui.cube_canvas = FakeCanvas()
+    gui.sticker_items = None
+    gui.rendered_state = None
+    return gui
+
+
+def sticker_fills(gui):
+    return [gui.cube_canvas.fills[item] for item in gui.sticker_items]
+
+
+def test_first_draw_creates_and_colours_every_sticker():
+    gui = bare_gui()
+    gui.draw_cube()
+    assert len(gui.sticker_items) == 54
+    assert len(set(gui.sticker_items)) == 54
+    assert len(gui.cube_canvas.configured) == 54
+    assert sticker_fills(gui) == [f'colour{face}' for face in gui.cube_state]
+
+
+def test_redraw_recolours_only_changed_stickers():
+    gui = bare_gui()
+    gui.draw_cube()
+    items = gui.sticker_items
+    created = gui.cube_canvas.items
+
+    gui.cube_canvas.configured = []
+    gui.draw_cube()
+    assert gui.cube_canvas.configured == []
+
+    before = gui.cube_state
+    gui.cube_state = gui.apply_move(before, 'R')
+    gui.draw_cube()
+    changed = [items[i] for i in range(54) if gui.cube_state[i] != before[i]]
+    assert sorted(gui.cube_canvas.configured) == sorted(changed)
+    assert 0 < len(changed) < 54
+    assert gui.sticker_items is items
+    assert gui.cube_canvas.items == created
+    assert sticker_fills(gui) == [f'colour{face}' for face in gui.cube_state]
+
+
+def test_redraw_ignores_later_changes_to_the_drawn_array():
+    gui = bare_gui()
+    gui.draw_cube()
+    gui.cube_state[0] = 5           # mutated in place after drawing
+    gui.cube_canvas.configured = []
+    gui.draw_cube()
+    assert gui.cube_canvas.configured == [gui.sticker_items[0]]
+
+
+@pytest.mark.parametrize('n', [2, 4])
+def test_other_sizes_get_their_own_net(n):
+    gui = bare_gui(n)
+    gui.draw_cube()
+    assert len(gui.sticker_items) == 6 * n * n
+    assert sticker_fills(gui) == [f'colour{face}' for face in gui.cube_state]
+
+
+# ===== TIMELINE =====
+
+SCRAMBLE = ['R', 'U', "F'", 'L2']
+SOLUTION = ['L2', 'F', "U'", "R'"]
+
+
+def timeline_gui():
+    gui = bare_gui()
+    gui.is_animating = False
+    gui.timeline_scale = FakeWidget()
+    gui.timeline_var = FakeWidget()
+    gui.current_move_var = FakeWidget()
+    gui.status_var = FakeWidget()
+    gui.timeline_pos = 0
+    gui.frame_offset = 0
+    gui.scramble_moves = SCRAMBLE
+    gui.set_timeline(SCRAMBLE + SOLUTION)
+    gui.draw_cube()
+    return gui
+
+
+def shows_row(gui, pos):
+    """The shown state is row `pos` of the timeline itself, not a copy"""
+    return np.shares_memory(gui.cube_state, gui.timeline) and \
+        (gui.cube_state == gui.timeline[pos]).all()
+
+
+def test_timeline_holds_every_state():
+    gui = timeline_gui()
+    moves = SCRAMBLE + SOLUTION
+    assert gui.timeline.shape == (len(moves) + 1, 54)
+    assert gui.timeline_scale.options['to'] == len(moves)
+    for k in range(len(moves) + 1):
+        assert (gui.timeline[k] == apply_moves(solved_state(), moves[:k])).all()
+
+    start = apply_moves(solved_state(), ['B'])
+    gui.set_timeline(['U'], start=start)
+    assert (gui.timeline[0] == start).all()
+
+
+def test_seek_shows_a_timeline_row():
+    gui = timeline_gui()
+    gui.seek(3)
+    assert shows_row(gui, 3)
+    assert gui.timeline_pos == 3 and gui.timeline_scale.get() == 3
+    assert gui.timeline_var.get() == '3/8'
+    assert gui.current_move_var.get() == "➤ F'"
+    assert 'scramble' in gui.status_var.get()
+    assert sticker_fills(gui) == [f'colour{face}' for face in gui.timeline[3]]
+
+    gui.seek(6)
+    assert 'solution' in gui.status_var.get()
+    gui.seek(100)
+    assert gui.timeline_pos == 8 and shows_row(gui, 8)
+    assert (gui.cube_state == solved_state()).all()
+    gui.seek(-5)
+    assert gui.timeline_pos == 0 and gui.current_move_var.get() == ''
+
+
+def test_seek_to_the_shown_position_does_not_redraw():
+    gui = timeline_gui()
+    gui.seek(2)
+    gui.cube_canvas.configured = []
+    gui.seek(2)
+    assert gui.cube_canvas.configured == []
+
+
+def test_seek_is_ignored_while_animating():
+    gui = timeline_gui()
+    gui.seek(2)
+    gui.is_animating = True
+    gui.timeline_scale.set(5)           # the user dragged the scale
+    gui.seek(5)
+    assert gui.timeline_pos == 2 and gui.timeline_scale.get() == 2
+    assert shows_row(gui, 2)
+
+
+def test_frames_are_timeline_rows():
+    gui = timeline_gui()
+    frames = gui.build_frames(SOLUTION, '⚡')
+    assert [frame.step for frame in frames] == [1, 2, 3, 4]
+    assert [frame.move for frame in frames] == SOLUTION
+    for k, frame in enumerate(frames):
+        assert np.shares_memory(frame.state, gui.timeline)
+        assert (frame.state == gui.timeline[len(SCRAMBLE) + k + 1]).all()
+
+    gui.frame_offset = len(SCRAMBLE)
+    gui.show_frame(frames[1])
+    assert gui.timeline_pos == len(SCRAMBLE) + 2
+    assert gui.played_steps == 2
+    assert sticker_fills(gui) == [f'colour{face}' for face in frames[1].state]
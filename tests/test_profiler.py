@@ -0,0 +1,81 @@
+import json
+import time
+from RubiksCubeProfiler import Profiler, NULL_STAGE
+from RubiksCubeAnimation import Frame, AnimationScheduler
+from test_animation import FakeRoot
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    assert profiler.stage('solve') is NULL_STAGE
+    with profiler.stage('solve') as stage:
+        stage.add(nodes=10)
+    profiler.frame(0.0, 0.1, 0.01, 2)
+    assert not profiler.spans and not profiler.frames
+    assert profiler.stage_summary() == {}
+    assert profiler.frame_summary()['frames'] == 0
+
+
+def test_stage_summary_times_and_counters():
+    profiler = Profiler(enabled=True)
+    for nodes in [10, 20, 30]:
+        with profiler.stage('search', lookups=1) as stage:
+            stage.add(nodes=nodes)
+            stage.add(nodes=1)
+    with profiler.stage('cache'):
+        time.sleep(0.01)
+
+    summary = profiler.stage_summary()
+    assert set(summary) == {'search', 'cache'}
+    search = summary['search']
+    assert search['count'] == 3
+    assert search['counters'] == {'lookups': 3, 'nodes': 63}
+    assert 0 <= search['p50'] <= search['max'] <= search['wall']
+    assert summary['cache']['last'] >= 0.01
+    assert 'search' in profiler.overlay_text()
+
+    profiler.clear()
+    assert profiler.stage_summary() == {}
+
+
+def test_spans_are_bounded():
+    profiler = Profiler(enabled=True, capacity=5)
+    for _ in range(8):
+        with profiler.stage('step'):
+            pass
+    assert profiler.stage_summary()['step']['count'] == 5
+
+
+def test_scheduler_reports_frame_latency_and_drops():
+    profiler = Profiler(enabled=True)
+    rendered = []
+    scheduler = AnimationScheduler(FakeRoot(), lambda frame: rendered.append(frame.step),
+                                   interval_ms=100, budget_ms=1000, profiler=profiler)
+    scheduler.play([Frame(None, 'R', step) for step in range(1, 6)])
+    scheduler.next_due = time.perf_counter() - 1.0
+    scheduler.tick()
+    assert rendered == [5]
+
+    frames = profiler.frame_summary()
+    assert frames['frames'] == 1
+    assert frames['dropped'] == 4
+    assert frames['late_p50'] >= 0.9
+    assert frames['render_p50'] >= 0.0
+
+
+def test_dump_writes_a_chrome_trace(tmp_path):
+    profiler = Profiler(enabled=True)
+    with profiler.stage('solve') as stage:
+        stage.add(nodes=7)
+    profiler.frame(time.perf_counter(), 0.02, 0.005, 1)
+
+    path = profiler.dump(str(tmp_path / 'trace.json'))
+    with open(path) as f:
+        trace = json.load(f)
+    solve, frame = trace['traceEvents']
+    assert solve['name'] == 'solve' and solve['ph'] == 'X'
+    assert solve['args']['nodes'] == 7 and 'cpu_ms' in solve['args']
+    assert frame['name'] == 'frame'
+    assert frame['args'] == {'late_ms': 20.0, 'coalesced': 1}
+    assert trace['otherData']['stages']['solve']['counters'] == {'nodes': 7}
+    assert trace['otherData']['frames']['frames'] == 1
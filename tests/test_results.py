@@ -0,0 +1,136 @@
+import os
+import numpy as np
+import pytest
+from RubiksCubeResults import ResultsStore, RECORD_DTYPE
+
+
+def fill(store, seed=0, count=200):
+    """Log random solves by two solvers; returns the raw columns"""
+    rng = np.random.default_rng(seed)
+    depths = rng.integers(1, 21, size=count)
+    lengths = rng.integers(1, 30, size=count)
+    seconds = rng.uniform(1e-4, 2.0, size=count)
+    solved = rng.random(count) < 0.9
+    half = count // 2
+    store.append_many('Two-Phase', depths[:half], lengths[:half], seconds[:half], solved[:half])
+    store.append_many('IDA*', depths[half:], lengths[half:], seconds[half:], solved[half:])
+    return depths, lengths, seconds, solved
+
+
+def summaries(store):
+    return [store.depth_summary(), store.depth_summary('Two-Phase'),
+            store.overall_summary(), store.epoch_summary()]
+
+
+def assert_same_summaries(first, second):
+    for a, b in zip(first, second):
+        assert a.keys() == b.keys()
+        for key in a:
+            assert np.allclose(a[key], b[key]), key
+
+
+def test_append_and_summarise(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    store.append('Two-Phase', 5, 7, 0.01)
+    store.append('Two-Phase', 5, 9, 0.03)
+    store.append('Two-Phase', 5, 0, 2.0, solved=False)
+    store.append('IDA*', 8, 10, 0.5)
+    assert len(store) == store.stored_records() == 4
+    assert store.solvers == ['Two-Phase', 'IDA*']
+
+    summary = store.depth_summary('Two-Phase')
+    assert summary['depth'].tolist() == [5]
+    assert summary['count'].tolist() == [3]
+    assert summary['solve_rate'][0] == pytest.approx(2 / 3)
+    assert summary['mean_length'][0] == pytest.approx(8.0)
+    assert summary['min_length'][0] == 7 and summary['max_length'][0] == 9
+    assert summary['mean_seconds'][0] == pytest.approx(2.04 / 3, rel=1e-5)
+    assert store.depth_summary()['depth'].tolist() == [5, 8]
+    assert store.depth_summary('Unknown')['depth'].tolist() == []
+    assert store.overall_summary()['count'] == 4
+
+
+def test_summary_matches_the_raw_records(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    depths, lengths, seconds, solved = fill(store)
+    summary = store.depth_summary()
+    for i, depth in enumerate(summary['depth']):
+        rows = depths == depth
+        assert summary['count'][i] == rows.sum()
+        assert summary['solve_rate'][i] == pytest.approx(solved[rows].mean())
+        assert summary['mean_length'][i] == pytest.approx(lengths[rows & solved].mean())
+        assert summary['mean_seconds'][i] == pytest.approx(seconds[rows].mean(), rel=1e-5)
+    overall = store.overall_summary()
+    assert overall['count'] == len(depths)
+    assert overall['solve_rate'] == pytest.approx(solved.mean())
+    assert overall['fast_rate'] >= (seconds < 1.0).mean()
+
+
+def test_batched_and_single_appends_agree(tmp_path):
+    batched = ResultsStore(str(tmp_path / 'batched'))
+    single = ResultsStore(str(tmp_path / 'single'))
+    depths, lengths, seconds, solved = fill(batched, count=40)
+    for i in range(40):
+        single.append('Two-Phase' if i < 20 else 'IDA*', depths[i], lengths[i], seconds[i],
+                      solved[i])
+    assert_same_summaries(summaries(batched), summaries(single))
+
+
+def test_reopen_and_rebuild(tmp_path):
+    path = str(tmp_path)
+    store = ResultsStore(path)
+    fill(store)
+    store.append_many('Value Network', [3, 4], [3, 5], [0.1, 0.2], [True, False], epoch=2)
+    expected = summaries(store)
+
+    assert_same_summaries(summaries(ResultsStore(path)), expected)
+
+    # a lost summary is rebuilt from records.bin
+    os.remove(os.path.join(path, 'summary.npz'))
+    assert_same_summaries(summaries(ResultsStore(path)), expected)
+
+    # and one that lags the raw log (a crash between the two writes) catches up
+    lost = np.zeros(2, dtype=RECORD_DTYPE)
+    lost['epoch'], lost['depth'], lost['length'], lost['solved'] = -1, 30, 25, True
+    with open(os.path.join(path, 'records.bin'), 'ab') as f:
+        lost.tofile(f)
+    reopened = ResultsStore(path)
+    assert len(reopened) == 204
+    assert reopened.depth_summary('Two-Phase')['count'][-1] == 2
+    assert reopened.depth_summary('Two-Phase')['depth'][-1] == 30
+    epochs = reopened.epoch_summary()
+    assert epochs['epoch'].tolist() == [2]
+    assert epochs['solve_rate'].tolist() == [0.5]
+    assert epochs['mean_length'].tolist() == [3.0]
+
+
+def test_truncated_log_is_resummarised(tmp_path):
+    path = str(tmp_path)
+    fill(ResultsStore(path), count=10)
+    records = os.path.join(path, 'records.bin')
+    with open(records, 'r+b') as f:
+        f.truncate(4 * RECORD_DTYPE.itemsize)
+    store = ResultsStore(path)
+    assert len(store) == 4
+    assert store.overall_summary()['count'] == 4
+
+
+def test_stores_see_each_others_appends(tmp_path):
+    first, second = ResultsStore(str(tmp_path)), ResultsStore(str(tmp_path))
+    first.append('Two-Phase', 5, 7, 0.01)
+    second.append('IDA*', 6, 8, 0.02)
+    assert len(second) == 2
+    first.refresh()
+    assert len(first) == 2
+    assert first.solvers == ['Two-Phase', 'IDA*']
+
+
+def test_recent(tmp_path):
+    store = ResultsStore(str(tmp_path))
+    assert len(store.recent()) == 0
+    for length in range(1, 6):
+        store.append('Two-Phase', 5, length, 0.01)
+    store.append('IDA*', 5, 99, 0.01)
+    assert store.recent(3)['length'].tolist() == [4, 5, 99]
+    assert store.recent(2, 'Two-Phase')['length'].tolist() == [4, 5]
+    assert len(store.recent(2, 'Unknown')) == 0
@@ -0,0 +1,343 @@
+import io
+import json
+import time
+import random
+import numpy as np
+import pytest
+from RubiksCubeEngine import (MOVES, QUARTER_MOVES, solved_state, apply_sequence, is_solved,
+                              invert_moves)
+from RubiksCubeEncoding import encode_batch, to_facelets
+from RubiksCubeSolver import (PatternDatabases, IDAStarSolver, CubeSolver,
+                              load_pattern_database_solver, load_two_phase_solver,
+                              parse_job, init_solve_worker, solve_job,
+                              BidirectionalSearch, SortedKeySet, BatchWeightedAStar,
+                              load_batch_weighted_astar, batch_solve, SolutionCache)
+from RubiksCubeSymmetry import transform_state
+from RubiksCubeTraining import ValueNetwork
+
+
+def scrambled(depth, seed, moves=QUARTER_MOVES):
+    rng = random.Random(seed)
+    scramble = [rng.choice(moves) for _ in range(depth)]
+    return apply_sequence(solved_state(), scramble), scramble
+
+
+def assert_solves(state, solution):
+    assert solution is not None
+    assert all(move in MOVES for move in solution)
+    assert is_solved(apply_sequence(state, solution))
+
+
+# ===== IDA* =====
+
+@pytest.mark.parametrize('seed', range(5))
+def test_ida_star_solves_shallow_scrambles(table_dir, seed):
+    state, _ = scrambled(8, seed)
+    solution = load_pattern_database_solver(table_dir=table_dir).solve(state)
+    assert_solves(state, solution)
+
+
+def test_unweighted_ida_star_is_optimal(table_dir):
+    databases = PatternDatabases(table_dir)
+    databases.load()
+    solver = IDAStarSolver(databases)
+    state = apply_sequence(solved_state(), ['R', "U'", 'F2', 'L', 'D'])
+    solution = solver.solve(state)
+    assert_solves(state, solution)
+    assert len(solution) == 5
+
+
+def test_ida_star_gives_up_past_its_node_budget(table_dir):
+    solver = load_pattern_database_solver(max_nodes=10, table_dir=table_dir)
+    state, _ = scrambled(20, 7)
+    assert solver.solve(state) is None
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_ida_star_gives_up_on_time_at_depth_20(table_dir, seed):
+    solver = load_pattern_database_solver(max_nodes=None, time_limit=0.3, table_dir=table_dir)
+    state, _ = scrambled(20, seed, MOVES)
+    start = time.perf_counter()
+    solution = solver.solve(state)
+    assert time.perf_counter() - start < 0.6
+    if solution is not None:
+        assert_solves(state, solution)
+
+
+def test_ida_star_engine_solves_depth_20_within_its_time_limit(table_dir):
+    solver = CubeSolver('IDA*', time_limit=0.3, cache_capacity=0, table_dir=table_dir,
+                        telemetry=False)
+    state, _ = scrambled(20, 0, MOVES)
+    start = time.perf_counter()
+    solution = solver.solve(state)
+    assert time.perf_counter() - start < 1.2
+    assert_solves(state, solution)
+
+
+def test_ida_star_falls_back_to_two_phase(table_dir):
+    solver = CubeSolver('IDA*', cache_capacity=0, table_dir=table_dir, telemetry=False)
+    solver.search_solver.max_nodes = 10
+    state, _ = scrambled(20, 8)
+    solution = solver.solve(state)
+    assert_solves(state, solution)
+    assert solver.fallback_from == 'IDA*'
+    assert solver.last_engine == 'Two-Phase'
+
+
+# ===== TWO-PHASE =====
+
+@pytest.mark.parametrize('seed', range(3))
+def test_two_phase_solves_deep_scrambles(table_dir, seed):
+    solver = load_two_phase_solver(table_dir)
+    state, _ = scrambled(25, seed, MOVES)
+    solution = solver.solve(state, time_limit=0.3)
+    assert_solves(state, solution)
+    assert len(solution) <= 30
+
+
+def test_two_phase_keeps_improving_until_the_time_limit(table_dir):
+    solver = load_two_phase_solver(table_dir)
+    state, _ = scrambled(25, 3, MOVES)
+    solution = solver.solve(state, time_limit=0.3)
+    lengths = [length for _, length in solver.solutions]
+    assert lengths == sorted(lengths, reverse=True)
+    assert len(solution) == lengths[-1]
+
+
+def test_two_phase_solved_state(table_dir):
+    assert load_two_phase_solver(table_dir).solve(solved_state()) == []
+
+
+def test_two_phase_tables_stay_reachable_after_a_solve(table_dir):
+    solver = load_two_phase_solver(table_dir)
+    state, _ = scrambled(10, 4)
+    solver.solve(state, time_limit=0.1)
+    assert solver.exists()
+    assert solver.path('tp_twist_moves').endswith('tp_twist_moves.npy')
+
+
+
+# ===== SOLUTION CACHE =====
+
+def test_cache_hits_symmetric_and_inverse_variants():
+    cache = SolutionCache()
+    state, scramble = scrambled(12, 10, MOVES)
+    cache.put(state, invert_moves(scramble))
+    assert_solves(state, cache.get(state))
+    for sym in (1, 17, 40):
+        image = transform_state(state, sym)
+        assert_solves(image, cache.get(image))
+    inverse = apply_sequence(solved_state(), invert_moves(scramble))
+    assert_solves(inverse, cache.get(inverse))
+    assert cache.hits == 5 and cache.misses == 0
+    assert len(cache.entries) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SolutionCache(capacity=2)
+    states = [scrambled(8, seed) for seed in range(3)]
+    for state, scramble in states[:2]:
+        cache.put(state, invert_moves(scramble))
+    cache.get(states[0][0])                    # now the most recently used
+    cache.put(states[2][0], invert_moves(states[2][1]))
+    assert cache.evictions == 1
+    assert cache.get(states[1][0]) is None
+    assert cache.get(states[0][0]) is not None
+    assert cache.hit_rate() == pytest.approx(2 / 3)
+    assert cache.memory_bytes() > 0
+
+
+# ===== HEADLESS SOLVER =====
+
+def test_parse_job_scramble():
+    state, scramble = parse_job({'scramble': "R U2 F'"})
+    assert scramble == ['R', 'U2', "F'"]
+    assert (state == apply_sequence(solved_state(), scramble)).all()
+    assert parse_job({'scramble': ['R', 'U2', "F'"]})[1] == scramble
+
+
+def test_parse_job_state():
+    expected = apply_sequence(solved_state(), ['R', 'U'])
+    state, scramble = parse_job({'state': expected.tolist()})
+    assert scramble is None
+    assert (state == expected).all()
+    state, _ = parse_job({'state': expected.tolist(), 'scramble': 'R U'})
+    assert (state == expected).all()
+
+
+@pytest.mark.parametrize('job, message', [
+    ([], 'JSON object'),
+    ({}, "'state' or a 'scramble'"),
+    ({'scramble': 'R X2'}, 'unknown moves: X2'),
+    ({'scramble': 42}, 'move string or a list'),
+    ({'scramble': ['R', 1]}, 'move string or a list'),
+    ({'state': [0] * 54}, 'stickers'),
+    ({'state': solved_state().tolist(), 'scramble': 'R'}, 'does not produce'),
+])
+def test_parse_job_rejects_bad_jobs(job, message):
+    with pytest.raises(ValueError, match=message):
+        parse_job(job)
+
+
+def test_solve_job_reports_errors_instead_of_raising():
+    init_solve_worker(engine='Inverse')
+    assert solve_job({'scramble': 'R Q'}) == {'error': 'unknown moves: Q'}
+    assert 'error' in solve_job('R U')
+
+
+def test_solve_job_result():
+    init_solve_worker(engine='Inverse', metric='QTM')
+    result = solve_job({'scramble': "R U U R'"})
+    assert result['solution'] == "R U U R'"
+    assert result['length'] == 4
+    assert result['metric'] == 'QTM'
+    assert result['engine'] == 'Inverse'
+    assert result['verified']
+
+
+def test_cube_solver_caches_solutions():
+    solver = CubeSolver('Inverse', telemetry=False)
+    state, scramble = scrambled(10, 9)
+    solution = solver.solve(state, scramble)
+    assert_solves(state, solution)
+    assert solver.last_engine == 'Inverse'
+    assert solver.fallback_from is None
+    assert solver.solve(state, scramble) == solution
+    assert solver.last_engine == 'Cache'
+
+
+# ===== BIDIRECTIONAL SEARCH =====
+
+@pytest.fixture(scope='module')
+def bidirectional():
+    # shared so the goal levels grown by one test serve the next
+    return BidirectionalSearch()
+
+
+def test_bidirectional_solved_state(bidirectional):
+    assert bidirectional.solve(solved_state()) == []
+
+
+@pytest.mark.parametrize('scramble, length', [
+    (['R'], 1),
+    (['R', 'U'], 2),
+    (['R', 'U', "R'", "U'"], 4),
+    (['R', 'L', 'U2', 'F', "B'", 'D'], 6),
+])
+def test_bidirectional_is_optimal(bidirectional, scramble, length):
+    state = apply_sequence(solved_state(), scramble)
+    solution = bidirectional.solve(state)
+    assert_solves(state, solution)
+    assert len(solution) == length
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_bidirectional_random_scrambles(bidirectional, seed):
+    state, scramble = scrambled(7, seed, MOVES)
+    solution = bidirectional.solve(state)
+    assert_solves(state, solution)
+    assert len(solution) <= len(scramble)
+
+
+def test_bidirectional_gives_up_past_its_limits():
+    state = apply_sequence(solved_state(), ['R', 'U', 'F', 'L', 'D'])
+    assert BidirectionalSearch(max_depth=4).solve(state) is None
+    assert BidirectionalSearch(max_states=1000).solve(state) is None
+
+
+def test_sorted_key_set():
+    keys = encode_batch(np.stack([apply_sequence(solved_state(), [move]) for move in MOVES]))
+    keys = keys[np.lexsort((keys[:, 1], keys[:, 0]))]
+    key_set = SortedKeySet.from_keys(keys)
+    assert len(key_set) == len(MOVES)
+    assert (key_set.keys() == keys).all()
+    assert key_set.contains(keys).all()
+    assert not key_set.contains(encode_batch(solved_state()[None])).any()
+
+
+# ===== BATCH WEIGHTED A* =====
+
+def lookup_heuristic(costs, default):
+    """Heuristic reading a fixed cost per state, `default` elsewhere"""
+    def heuristic(states):
+        return np.array([costs.get(bytes(s), default) for s in states], dtype=np.float32)
+    return heuristic
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_bwas_solves_shallow_scrambles(table_dir, seed):
+    solver = load_batch_weighted_astar('pdb', table_dir)
+    state, _ = scrambled(10, seed)
+    solution = solver.solve(state)
+    assert_solves(state, solution)
+    assert solver.nodes <= solver.max_nodes
+
+
+def test_bwas_with_a_value_network(tmp_path):
+    path = str(tmp_path / 'value_network.npz')
+    assert load_batch_weighted_astar('network', checkpoint_path=path) is None
+    ValueNetwork(hidden=(16,)).save(path, epoch=0)
+    solver = load_batch_weighted_astar('network', checkpoint_path=path, batch_size=100)
+    state = apply_sequence(solved_state(), ['R', "U'", 'F'])
+    solution = solver.solve(state)
+    assert_solves(state, solution)
+    assert all(move in QUARTER_MOVES for move in solution)
+
+
+def test_bwas_gives_up_past_its_budget():
+    state, _ = scrambled(20, 5, MOVES)
+    blind = lookup_heuristic({}, 0.0)
+    solver = BatchWeightedAStar(blind, batch_size=10, max_nodes=500)
+    assert solver.solve(state) is None
+    assert solver.nodes <= 500
+
+    solver = BatchWeightedAStar(blind, batch_size=10, time_limit=0.05)
+    start = time.perf_counter()
+    assert solver.solve(state) is None
+    assert time.perf_counter() - start < 0.5
+
+
+def test_bwas_engine_falls_back_within_its_time_limit(table_dir):
+    solver = CubeSolver('BWAS', time_limit=0.3, cache_capacity=0, table_dir=table_dir,
+                        telemetry=False)
+    state, _ = scrambled(20, 1, MOVES)
+    start = time.perf_counter()
+    solution = solver.solve(state)
+    assert time.perf_counter() - start < 1.5
+    assert_solves(state, solution)
+
+
+def test_bwas_reopens_a_closed_node_reached_more_cheaply():
+    # X = S R2 is first reached and closed along L R R L' (cost 4), then
+    # reached again along R R (cost 2); the solution must use the cheaper path
+    start = apply_sequence(solved_state(), ["U'", "F'", 'R2'])
+    costs = {bytes(apply_sequence(start, moves)): cost for moves, cost in [
+        ([], 0), (['L'], 0), (['L', 'R'], 0), (['L', 'R', 'R'], 0),
+        (['R2'], 0), (['R'], 10), (["R'"], 10), (['R2', 'F'], 7)]}
+    solver = BatchWeightedAStar(lookup_heuristic(costs, 100.0), weight=1.0, batch_size=1,
+                                moves=QUARTER_MOVES)
+    solution = solver.solve(start)
+    assert_solves(start, solution)
+    assert len(solution) == 4
+
+
+# ===== BATCH COMMAND LINE =====
+
+def test_batch_solve_keeps_input_order_and_reports_errors(table_dir):
+    facelets = to_facelets(apply_sequence(solved_state(), ['F', 'D']))
+    lines = ["R U R' U'\n", '\n', 'R Q\n', facelets + '\n', 'U2\n']
+    output = io.StringIO()
+    summary = batch_solve(lines, output, workers=2, engine='Inverse', chunk_size=2,
+                          table_dir=table_dir)
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [row['line'] for row in rows] == [1, 3, 4, 5]
+    assert rows[0]['solution'] == "U R U' R'" and rows[0]['verified']
+    assert rows[1]['error'] == 'unknown moves: Q'
+    # no scramble to invert: a facelet line is searched
+    assert rows[2]['input'] == facelets
+    assert rows[2]['solution'] == "D' F'" and rows[2]['engine'] == 'Two-Phase'
+    assert rows[3]['solution'] == 'U2'
+    assert summary['jobs'] == 4
+    assert summary['failed'] == 1
+    assert summary['solved'] == 3
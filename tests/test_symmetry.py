@@ -0,0 +1,93 @@
+import random
+import numpy as np
+import pytest
+from RubiksCubeEngine import MOVES, solved_state, apply_moves, is_solved, invert_moves
+from RubiksCubeEncoding import encode_batch
+from RubiksCubeSymmetry import (NUM_SYMMETRIES, transform_state, transform_moves,
+                                symmetric_states, invert_state_batch, canonical_form,
+                                to_canonical_solution, from_canonical_solution,
+                                classify_batch, class_representative, SymmetryReducedTable)
+
+
+def random_scramble(seed, depth=15):
+    rng = random.Random(seed)
+    return [rng.choice(MOVES) for _ in range(depth)]
+
+
+def test_symmetries_fix_the_solved_cube():
+    assert all(is_solved(image) for image in symmetric_states(solved_state()))
+
+
+@pytest.mark.parametrize('sym', range(NUM_SYMMETRIES))
+def test_transformed_moves_give_the_transformed_state(sym):
+    scramble = random_scramble(sym)
+    state = apply_moves(solved_state(), scramble)
+    expected = apply_moves(solved_state(), transform_moves(scramble, sym))
+    assert (transform_state(state, sym) == expected).all()
+
+
+def test_inverse_state():
+    scramble = random_scramble(0)
+    state = apply_moves(solved_state(), scramble)
+    inverse = apply_moves(solved_state(), invert_moves(scramble))
+    assert (invert_state_batch(state[None])[0] == inverse).all()
+
+
+def test_canonical_form_is_shared_by_symmetric_and_inverse_states():
+    scramble = random_scramble(1)
+    state = apply_moves(solved_state(), scramble)
+    key = canonical_form(state)[0]
+    for image in symmetric_states(state)[::7]:
+        assert canonical_form(image)[0] == key
+    assert canonical_form(apply_moves(solved_state(), invert_moves(scramble)))[0] == key
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_canonical_solution_round_trip(seed):
+    state = apply_moves(solved_state(), random_scramble(seed))
+    solution = invert_moves(random_scramble(seed))
+    other = transform_state(state, seed * 9)
+    _, sym, inverted = canonical_form(state)
+    canonical = to_canonical_solution(solution, sym, inverted)
+    _, other_sym, other_inverted = canonical_form(other)
+    translated = from_canonical_solution(canonical, other_sym, other_inverted)
+    assert is_solved(apply_moves(other, translated))
+
+
+def test_classify_batch_picks_the_smallest_image():
+    states = np.stack([apply_moves(solved_state(), random_scramble(seed)) for seed in range(10)])
+    keys, chosen = classify_batch(states)
+    for state, key, sym in zip(states, keys, chosen):
+        images = encode_batch(symmetric_states(state))
+        smallest = images[np.lexsort((images[:, 1], images[:, 0]))[0]]
+        assert (key == smallest).all()
+        assert (encode_batch(transform_state(state, sym)[None])[0] == key).all()
+
+
+def test_class_representative_is_symmetry_invariant():
+    state = apply_moves(solved_state(), random_scramble(2))
+    key = class_representative(state)[0]
+    assert all(class_representative(transform_state(state, sym))[0] == key
+               for sym in range(0, NUM_SYMMETRIES, 5))
+
+
+def test_symmetry_reduced_table_shares_entries():
+    states = np.stack([apply_moves(solved_state(), random_scramble(seed, 8)) for seed in range(20)])
+    table = SymmetryReducedTable(100)
+    table.insert(states, np.arange(20))
+    assert len(table) == len(np.unique(classify_batch(states)[0], axis=0))
+    images = np.stack([transform_state(state, 13) for state in states])
+    assert (table.lookup(images) == table.lookup(states)).all()
+    assert (table.lookup(solved_state()[None]) == -1).all()
+
+
+def test_full_symmetry_reduced_table_is_left_intact():
+    states = np.stack([apply_moves(solved_state(), random_scramble(seed, 8)) for seed in range(6)])
+    table = SymmetryReducedTable(4)
+    table.insert(states[:3], [1, 2, 3])
+    with pytest.raises(ValueError, match='full'):
+        table.insert(states[3:], [4, 5, 6])
+    assert len(table) == 3
+    assert table.lookup(states).tolist() == [1, 2, 3, -1, -1, -1]
+    table.insert(states[3:4], [4])
+    assert table.lookup(states[3:4]).tolist() == [4]
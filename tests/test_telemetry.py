@@ -0,0 +1,77 @@
+import os
+import pytest
+from RubiksCubeTelemetry import TELEMETRY_AVAILABLE, TelemetryPublisher, TelemetryListener
+
+pytestmark = pytest.mark.skipif(not TELEMETRY_AVAILABLE,
+                                reason="Unix datagram sockets are unavailable")
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / 'telemetry.sock')
+
+
+def test_events_reach_the_listener(socket_path):
+    listener = TelemetryListener(socket_path, capacity=8)
+    publisher = TelemetryPublisher(socket_path)
+    try:
+        assert publisher.publish('Two-Phase', 20, 18, 0.25)
+        assert publisher.publish('IDA*', 5, 5, 0.01, solved=False)
+        assert listener.poll() == 2
+        events = listener.recent()
+        assert events['solver'].tolist() == [b'Two-Phase', b'IDA*']
+        assert events['depth'].tolist() == [20, 5]
+        assert events['moves'].tolist() == [18, 5]
+        assert events['solved'].tolist() == [True, False]
+        assert (events['pid'] == os.getpid()).all()
+        assert listener.dropped == 0
+    finally:
+        publisher.close()
+        listener.close()
+
+
+def test_ring_keeps_the_latest_events(socket_path):
+    listener = TelemetryListener(socket_path, capacity=4)
+    publisher = TelemetryPublisher(socket_path)
+    try:
+        for depth in range(10):
+            publisher.publish('Two-Phase', depth, depth, 0.01)
+        assert listener.poll() == 10
+        assert listener.recent()['depth'].tolist() == [6, 7, 8, 9]
+        assert listener.recent(2)['depth'].tolist() == [8, 9]
+    finally:
+        publisher.close()
+        listener.close()
+
+
+def test_no_listener_is_not_counted_as_dropped(socket_path):
+    publisher = TelemetryPublisher(socket_path)
+    try:
+        assert not publisher.publish('Two-Phase', 5, 5, 0.01)
+        listener = TelemetryListener(socket_path)
+        listener.sock.close()                  # crashed: the socket file is left behind
+        assert os.path.exists(socket_path)
+        assert not publisher.publish('Two-Phase', 5, 5, 0.01)
+        listener.close()
+        assert not publisher.publish('Two-Phase', 5, 5, 0.01)
+        assert publisher.unheard == 3
+        assert publisher.dropped == 0
+    finally:
+        publisher.close()
+
+
+def test_full_buffer_drops_are_reported(socket_path):
+    listener = TelemetryListener(socket_path, capacity=4096, recv_buffer=4096)
+    publisher = TelemetryPublisher(socket_path)
+    try:
+        for _ in range(5000):
+            if not publisher.publish('Two-Phase', 5, 5, 0.01):
+                break
+        assert publisher.dropped == 1 and publisher.unheard == 0
+        listener.poll()
+        assert publisher.publish('Two-Phase', 5, 5, 0.01)
+        listener.poll()
+        assert listener.dropped == publisher.dropped == 1
+    finally:
+        publisher.close()
+        listener.close()
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from RubiksCubeEngine import QUARTER_MOVES, solved_state, apply_move, is_solved_batch
+from RubiksCubeTraining import (CurriculumSchedule, ScrambleDataGenerator, scramble_batch,
+                                ValueNetwork, one_hot, bellman_targets, greedy_rollout,
+                                ValueIterationTrainer, load_training_metrics)
+
+
+class FixedDepthSchedule(CurriculumSchedule):
+    """Every scramble of an epoch is exactly max_depth(epoch) moves long"""
+
+    def sample(self, rng, count, epoch):
+        return np.full(count, self.max_depth(epoch), dtype=np.uint8)
+
+
+# ===== CURRICULUM =====
+
+def test_curriculum_ramps_to_its_end_depth():
+    schedule = CurriculumSchedule(start_depth=5, end_depth=30, ramp_epochs=50)
+    assert schedule.max_depth(0) == 5
+    assert schedule.max_depth(25) == 18
+    assert schedule.max_depth(50) == schedule.max_depth(500) == 30
+    depths = schedule.sample(np.random.default_rng(0), 10000, 0)
+    assert depths.min() == 1 and depths.max() == 5
+
+
+def test_scramble_batch_depths():
+    rng = np.random.default_rng(0)
+    states = scramble_batch(np.array([0, 1, 1, 1], dtype=np.uint8), rng)
+    one_move = {bytes(apply_move(solved_state(), move)) for move in QUARTER_MOVES}
+    assert is_solved_batch(states[:1])[0]
+    assert all(bytes(state) in one_move for state in states[1:])
+
+
+# ===== SHARED-MEMORY GENERATOR =====
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_generator_batches_follow_the_schedule(num_workers):
+    schedule = CurriculumSchedule(start_depth=3, end_depth=3)
+    with ScrambleDataGenerator(batch_size=64, num_workers=num_workers,
+                               schedule=schedule) as generator:
+        for _ in range(5):
+            states, depths = generator.next_batch(timeout=10)
+            assert states.shape == (64, 54) and depths.shape == (64,)
+            assert depths.min() >= 1 and depths.max() <= 3
+            assert (np.bincount(states.ravel(), minlength=6) == 64 * 9).all()
+
+
+@pytest.mark.parametrize('num_workers', [0, 2])
+def test_generator_switches_curriculum_at_once(num_workers):
+    schedule = FixedDepthSchedule(start_depth=2, end_depth=9, ramp_epochs=1)
+    with ScrambleDataGenerator(batch_size=32, num_workers=num_workers, num_slots=6,
+                               schedule=schedule) as generator:
+        _, depths = generator.next_batch(timeout=10)
+        assert (depths == 2).all()
+        generator.set_epoch(1)
+        for _ in range(8):
+            _, depths = generator.next_batch(timeout=10)
+            assert (depths == 9).all()
+
+
+# ===== VALUE NETWORK =====
+
+def constant_network(value):
+    """Network predicting `value` for every state"""
+    network = ValueNetwork(hidden=(8,))
+    network.params['W1'][:] = 0.0
+    network.params['b1'][:] = value
+    return network
+
+
+def test_network_loss_decreases():
+    network = ValueNetwork(hidden=(32,), seed=1)
+    rng = np.random.default_rng(0)
+    depths = rng.integers(1, 6, size=256).astype(np.uint8)
+    x = one_hot(scramble_batch(depths, rng))
+    targets = depths.astype(np.float32)
+    first = network.train_step(x, targets, learning_rate=1e-2)
+    for _ in range(100):
+        last = network.train_step(x, targets, learning_rate=1e-2)
+    assert last < first / 4
+
+
+def test_network_save_and_load(tmp_path):
+    network = ValueNetwork(hidden=(16,), seed=2)
+    states = scramble_batch(np.full(10, 5, dtype=np.uint8), np.random.default_rng(0))
+    path = str(tmp_path / 'net.npz')
+    network.save(path, epoch=7)
+    loaded = ValueNetwork.load(path)
+    assert loaded.epoch == 7
+    assert np.allclose(loaded.predict(states), network.predict(states))
+
+
+def test_one_hot():
+    x = one_hot(solved_state()[None])
+    assert x.shape == (1, 288)
+    assert (x.sum(axis=1) == 48).all()
+
+
+def test_bellman_targets():
+    network = constant_network(5.0)
+    states = np.stack([solved_state(),
+                       apply_move(solved_state(), 'R'),
+                       apply_move(apply_move(solved_state(), 'R'), 'U')])
+    assert bellman_targets(network, states).tolist() == [0.0, 1.0, 6.0]
+
+
+def test_greedy_rollout():
+    network = constant_network(5.0)
+    states = np.stack([solved_state(),
+                       apply_move(solved_state(), "F'"),
+                       apply_move(apply_move(solved_state(), 'R'), 'U')])
+    solved, moves = greedy_rollout(network, states, max_steps=1)
+    assert solved.tolist() == [True, True, False]
+    assert moves.tolist() == [0, 1, 1]
+
+
+# ===== VALUE ITERATION =====
+
+def test_trainer_writes_metrics_and_resumes(tmp_path):
+    options = dict(batch_size=64, updates_per_epoch=2, eval_size=16, hidden=(16,),
+                   num_workers=0, schedule=CurriculumSchedule(start_depth=2, end_depth=4),
+                   checkpoint_path=str(tmp_path / 'net.npz'),
+                   metrics_path=str(tmp_path / 'metrics.json'))
+    ValueIterationTrainer(**options).train(2, log=lambda *args: None)
+    metrics = load_training_metrics(options['metrics_path'])
+    assert metrics['epoch'].tolist() == [0, 1]
+    assert set(metrics) == {'epoch', 'loss', 'accuracy', 'solve_rate', 'avg_moves'}
+
+    trainer = ValueIterationTrainer(**options)
+    assert trainer.start_epoch == 2
+    trainer.train(3, log=lambda *args: None)
+    assert load_training_metrics(options['metrics_path'])['epoch'].tolist() == [0, 1, 2]